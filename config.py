@@ -350,6 +350,36 @@ LOCAL_VIDEO_PATH = ""
 # Options: 'best', '2160p', '1080p', '720p', '480p', '360p', 'worst'
 YOUTUBE_QUALITY = '720p'
 
+# Download only these time ranges of the YouTube video (seconds)
+# Example: [(0, 300), (3600, 3900)] = first 5 minutes and 5 minutes after the 1h mark
+# Each range is downloaded as its own file and cut into clips; clip names keep
+# the times of the full video. Empty list = download the whole video
+YOUTUBE_SECTIONS = []
+
+# Cut downloaded sections exactly at the requested times?
+# True = Re-encode around the cut points (exact, slower)
+# False = Cut at the nearest keyframes (fast; VideoCutter re-cuts the clips anyway)
+YOUTUBE_SECTIONS_PRECISE_CUTS = False
+
+# Reuse fetched YouTube metadata (title, duration, formats) per video ID?
+# True = Info is extracted once per video and shared by the info lookup and the
+#        download, in memory and on disk (output/cache) ⭐ RECOMMENDED
+VIDEO_INFO_CACHE_ENABLED = True
+
+# How long cached video info stays valid (in hours)
+# Keep this below ~6: the stream URLs inside the info expire after that
+VIDEO_INFO_CACHE_TTL_HOURS = 3
+
+# Keep downloads by video ID + quality and reuse them?
+# True = The same video (youtu.be, watch?v=, embed... links) is downloaded once
+#        and saved as "<video id>-<format hash>.<ext>" in the downloads folder
+# False = Download every time, saved as "<title>.<ext>"
+DOWNLOAD_STORE_ENABLED = True
+
+# Disk space for stored downloads (in GB, 0 = unlimited)
+# Least recently used videos are deleted first when the store grows past this
+DOWNLOAD_STORE_MAX_GB = 20
+
 # ============================================================================
 # OUTPUT FOLDER STRUCTURE
 # ============================================================================
@@ -363,6 +393,7 @@ CLIPS_FOLDER = "clips"                  # Video clips without subtitles
 CLIPS_WITH_SUBTITLES_FOLDER = "clips_with_subtitles"  # Final clips with subtitles
 SUBTITLE_FILES_FOLDER = "subtitle_files"  # Separate .srt files
 LOGS_FOLDER = "logs"                    # Log files
+CACHE_FOLDER = "cache"                  # Reusable results (transcriptions, etc.)
 
 # Auto-create full paths (don't modify these)
 DOWNLOAD_PATH = os.path.join(OUTPUT_BASE_DIR, DOWNLOADS_FOLDER)
@@ -370,6 +401,7 @@ CLIPS_PATH = os.path.join(OUTPUT_BASE_DIR, CLIPS_FOLDER)
 CLIPS_WITH_SUBTITLES_PATH = os.path.join(OUTPUT_BASE_DIR, CLIPS_WITH_SUBTITLES_FOLDER)
 SUBTITLE_FILES_PATH = os.path.join(OUTPUT_BASE_DIR, SUBTITLE_FILES_FOLDER)
 LOGS_PATH = os.path.join(OUTPUT_BASE_DIR, LOGS_FOLDER)
+CACHE_PATH = os.path.join(OUTPUT_BASE_DIR, CACHE_FOLDER)
 
 # ============================================================================
 # VIDEO CUTTING SETTINGS
@@ -392,6 +424,22 @@ AUDIO_BITRATE = "192k"
 # veryslow = slowest encoding, best compression
 ENCODING_PRESET = "medium"
 
+# Cutting mode
+# Options:
+#   'reencode' = One FFmpeg run per clip (seeks and decodes the source every time)
+#   'segment'  = Decode the source ONCE and split it with FFmpeg's segment muxer
+#                (much faster for long videos, same clip names) ⭐ RECOMMENDED
+#   'copy'     = No re-encode at all: boundaries snap to the nearest keyframe
+#                and clips are stream-copied (seconds instead of minutes,
+#                clip lengths vary slightly - great for drafts)
+#   'smart'    = Frame-accurate like 'reencode', but only the partial GOPs at
+#                the start/end of each clip are re-encoded; the rest is copied
+CUT_MODE = "reencode"
+
+# Maximum distance (in seconds) a clip boundary may move to reach a keyframe
+# in 'copy' mode. Clips without a keyframe this close are re-encoded instead.
+KEYFRAME_SNAP_TOLERANCE = 2.0
+
 # ============================================================================
 # SUBTITLE SETTINGS
 # ============================================================================
@@ -416,11 +464,64 @@ SUBTITLE_LANGUAGE = "auto"
 # large:  Slowest, best accuracy (~10GB RAM, ~1x realtime)
 WHISPER_MODEL = "base"
 
+# Transcription engine
+# Options:
+#   'openai-whisper' = Original PyTorch implementation (fp32 on CPU)
+#   'faster-whisper' = CTranslate2 implementation, several times faster on CPU
+#                      (pip install faster-whisper) ⭐ RECOMMENDED for CPU-only
+TRANSCRIPTION_BACKEND = "openai-whisper"
+
+# Compute type for faster-whisper
+# Options: 'int8' (fastest) ⭐ RECOMMENDED, 'int8_float32', 'float32'
+WHISPER_COMPUTE_TYPE = "int8"
+
+# CPU threads used for transcription (0 = library default)
+# With MAX_CONCURRENT_PROCESSES > 1, each worker process loads its own model
+# and 0 means "split the CPU cores evenly between the workers"
+WHISPER_CPU_THREADS = 0
+
+# Transcribe the whole source video ONCE and split the transcript per clip?
+# True = One Whisper pass with word timestamps, sliced onto the clip grid
+#        (no per-clip model warm-up/padding, better accuracy at clip edges)
+# False = Transcribe every clip separately
+TRANSCRIBE_FULL_VIDEO = False
+
+# Cache Whisper results on disk?
+# True = Re-runs with the same audio/model/language skip Whisper entirely
+#        (e.g. when only the subtitle font or colour changed) ⭐ RECOMMENDED
+TRANSCRIPTION_CACHE_ENABLED = True
+
+# Maximum size of the transcription cache (in MB)
+# Least recently used entries are removed when the cache grows past this
+TRANSCRIPTION_CACHE_MAX_MB = 200
+
+# Skip silence and music before Whisper (voice activity detection)?
+# True = Clips with too little speech get empty subtitles without running
+#        Whisper (no hallucinated text on intros/music beds), and only the
+#        speech parts of the other clips are transcribed
+# False = Transcribe all audio
+VAD_ENABLED = False
+
+# Minimum share of speech (0.0 - 1.0) a clip needs to be transcribed
+VAD_MIN_SPEECH_RATIO = 0.1
+
+# How much louder than the background (in dB) audio must be to count as speech
+# Lower = more sensitive (quiet speakers), Higher = stricter (noisy sources)
+VAD_ENERGY_THRESHOLD_DB = 12
+
 # Burn subtitles into video?
 # True = Hardcode subtitles permanently into video (recommended for social media)
 # False = Keep subtitles as separate .srt files
 BURN_SUBTITLES = True
 
+# Cut and burn each clip in ONE encode, straight from the source video?
+# True = Transcribe the source first, then every final clip is produced by a
+#        single FFmpeg run (half the encode CPU, no second-generation quality
+#        loss). No plain clips are written to the clips folder.
+# False = Cut clips first, then re-encode them to burn subtitles
+# (Only used when ENABLE_SUBTITLES and BURN_SUBTITLES are True)
+FUSED_CUT_AND_BURN = False
+
 # ============================================================================
 # TRANSLATION SETTINGS (NEW!)
 # ============================================================================
@@ -437,6 +538,8 @@ TRANSLATION_SOURCE_LANG = "en"
 # Target language (language to translate TO)
 # Options: 'hi' (Hindi), 'en' (English), 'es' (Spanish), etc.
 # Common Indian languages: 'hi', 'bn', 'te', 'ta', 'mr', 'gu', 'kn', 'ml', 'pa', 'ur'
+# Several languages at once: ["hi", "es", "fr"] - one transcription, translated
+# and burned per language in parallel
 TRANSLATION_TARGET_LANG = "hi"
 
 # Create separate clips with translated subtitles?
@@ -444,9 +547,48 @@ TRANSLATION_TARGET_LANG = "hi"
 # False = Only create clips with translated subtitles (replaces original)
 KEEP_ORIGINAL_SUBTITLES = False
 
+# Translation service
+# Options:
+#   'google' = Free Google Translate (no API key)
+#   'libre'  = LibreTranslate-compatible server (self-hosted, or a local
+#              stand-in server for testing) at LIBRETRANSLATE_URL
+TRANSLATION_PROVIDER = "google"
+LIBRETRANSLATE_URL = "http://localhost:5000/"
+LIBRETRANSLATE_API_KEY = "local"  # Any non-empty value if the server needs no key
+
+# Translation concurrency
+# Requests are sent in parallel, but never more than TRANSLATION_MAX_IN_FLIGHT
+# at once and never faster than TRANSLATION_REQUESTS_PER_SECOND overall
+# (0 = no rate limit). Failed requests are retried with random backoff.
+TRANSLATION_MAX_IN_FLIGHT = 4
+TRANSLATION_REQUESTS_PER_SECOND = 5
+TRANSLATION_MAX_RETRIES = 3
+
 # Translation output folder suffix
+# Translated clips go to one subfolder per language,
+# e.g., "clips_with_subtitles_translated/hi"
 TRANSLATION_FOLDER_SUFFIX = "_translated"  # e.g., "clips_with_subtitles_translated"
 
+# Maximum characters per translation request
+# Many subtitle lines are packed into one request instead of one request per line
+# (Google Translate accepts up to 5000 characters per request)
+TRANSLATION_BATCH_MAX_CHARS = 4500
+
+# Remember translations in a local database (output/cache)?
+# True = Lines translated before ("Thank you", intros, sponsor reads...) are
+#        reused instead of re-sent, on every rerun ⭐ RECOMMENDED
+TRANSLATION_MEMORY_ENABLED = True
+
+# Maximum remembered translations (least recently used are removed first)
+TRANSLATION_MEMORY_MAX_ENTRIES = 100000
+
+# Translate the whole-video transcript once instead of every clip's SRT file?
+# True = Whole sentences are translated (even across clip boundaries) and the
+#        result is split back onto the clips (needs TRANSCRIBE_FULL_VIDEO or
+#        FUSED_CUT_AND_BURN, otherwise per-clip files are translated)
+# False = Translate each clip's subtitle file separately
+TRANSLATE_FULL_TRANSCRIPT = True
+
 # ============================================================================
 # SUBTITLE STYLING (Applied when BURN_SUBTITLES = True)
 # ============================================================================
@@ -551,15 +693,55 @@ DELETE_ORIGINAL_CLIPS = False
 # False = Keep original download
 DELETE_DOWNLOADED_VIDEO = False
 
-# Maximum concurrent subtitle generation processes
+# Maximum concurrent processes (clip encodes, subtitle generation)
 # Higher = faster but uses more RAM
 # 1 = Process one at a time (safest) ⭐ RECOMMENDED
 # 2-4 = Faster if you have good CPU/RAM
+# Clip encoding splits the CPU cores evenly between the parallel FFmpeg jobs
 MAX_CONCURRENT_PROCESSES = 1
 
 # Skip clips that already have subtitles
 SKIP_EXISTING_SUBTITLES = True
 
+# Resume interrupted runs?
+# True = Every finished cut, subtitle, burn and translation is recorded in a
+#        per-video manifest (cache/manifests). Running the same video again
+#        skips the steps that are already done, so a crash or Ctrl+C halfway
+#        through only redoes the step that was running
+# False = Always process everything again
+RESUME_JOBS = True
+
+# Process clips as a stream instead of stage by stage?
+# True = Each clip moves on (cut → subtitles → burn → translate) as soon as it
+#        is ready, so the first short is done after one clip, not the whole
+#        video, and FFmpeg and Whisper work run at the same time
+# False = Cut every clip, then subtitle every clip, then translate
+STREAMING_PIPELINE = False
+
+# Workers per stage when STREAMING_PIPELINE = True
+# Whisper uses one model per process: with MAX_CONCURRENT_PROCESSES = 1 extra
+# subtitle workers only overlap audio decoding; with the worker pool, match it
+PIPELINE_CUT_WORKERS = 2
+PIPELINE_SUBTITLE_WORKERS = 1
+PIPELINE_BURN_WORKERS = 2
+PIPELINE_TRANSLATE_WORKERS = 2
+
+# Schedule the work as a task graph sized to this machine? (overrides STREAMING_PIPELINE)
+# True = Every cut, transcription, burn and translation declares the CPU
+#        threads and RAM it needs, and tasks are packed onto the real cores
+#        and memory - no hand-tuned worker counts, no thrashing
+# False = Use STREAMING_PIPELINE / stage-by-stage processing
+TASK_SCHEDULER = False
+
+# RAM the task scheduler may use (in MB, 0 = 80% of physical memory)
+SCHEDULER_RAM_MB = 0
+
+# FFmpeg threads per encode when TASK_SCHEDULER = True
+SCHEDULER_ENCODE_THREADS = 2
+
+# Disk-heavy tasks (probing, stream copies) running at once
+SCHEDULER_DISK_IO_SLOTS = 2
+
 # ============================================================================
 # BATCH PROCESSING (Multiple videos)
 # ============================================================================
@@ -578,14 +760,25 @@ BATCH_LOCAL_FILES = [
     # "video3.mp4",
 ]
 
+# When either list above has entries, it is processed instead of YOUTUBE_URL /
+# LOCAL_VIDEO_PATH. Each video starts processing as soon as it is downloaded
+# while the next ones keep downloading; a combined report is saved in logs/
+
+# YouTube downloads running at the same time during batch processing
+BATCH_MAX_PARALLEL_DOWNLOADS = 3
+
 # ============================================================================
 # ADVANCED SETTINGS (Rarely need to change)
 # ============================================================================
 
 # Create separate output folder for each video?
-# True = Each video gets its own subfolder
-# False = All clips in same folder
-SEPARATE_FOLDERS_PER_VIDEO = False
+# True = Each video gets its own subfolder (named after the video file plus a
+#        short hash) in the clips, subtitle files, subtitled clips and
+#        translated folders, so videos in a batch never overwrite each
+#        other's clips (recommended)
+# False = All clips in same folder; clips of different videos with the same
+#         names replace each other
+SEPARATE_FOLDERS_PER_VIDEO = True
 
 # Clip naming format
 # Available variables: {index}, {start}, {end}, {duration}
@@ -645,6 +838,13 @@ def time_to_seconds(hours=0, minutes=0, seconds=0):
     return hours * 3600 + minutes * 60 + seconds
 
 
+def get_translation_target_langs():
+    """Get TRANSLATION_TARGET_LANG as a list (it may be one code or several)"""
+    if isinstance(TRANSLATION_TARGET_LANG, str):
+        return [TRANSLATION_TARGET_LANG]
+    return list(dict.fromkeys(TRANSLATION_TARGET_LANG))
+
+
 def create_all_directories():
     """Create all necessary directories"""
     directories = [
@@ -654,6 +854,7 @@ def create_all_directories():
         CLIPS_WITH_SUBTITLES_PATH,
         SUBTITLE_FILES_PATH,
         LOGS_PATH,
+        CACHE_PATH,
     ]
     
     if CLEANUP_TEMP_FILES:
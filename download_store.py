@@ -0,0 +1,212 @@
+"""
+Download Store - Integrated with config and logging
+Keeps downloaded videos under a key of (video ID, format), so any URL form of the
+same video is downloaded once
+"""
+
+import hashlib
+import json
+import os
+import threading
+import time
+from pathlib import Path
+import config
+from logger import get_logger
+
+logger = get_logger()
+
+INDEX_FILE_NAME = "store_index.json"
+PARTIAL_FOLDER_NAME = ".partial"
+
+
+class DownloadStore:
+    """
+    Content-addressed download folder with an index and an LRU disk quota
+    
+    Every path handed out by get() or add() is pinned until release() is
+    called for it, so a video that is downloaded but still waiting to be
+    processed is never evicted to make room for the next download.
+    """
+    
+    def __init__(self, store_folder=None, max_size_gb=None):
+        """
+        Initialize the download store
+        
+        Args:
+            store_folder (str): Folder holding the stored videos (uses config if None)
+            max_size_gb (float): Disk quota in GB, 0 = unlimited (uses config if None)
+        """
+        self.store_folder = store_folder or config.DOWNLOAD_PATH
+        max_size_gb = config.DOWNLOAD_STORE_MAX_GB if max_size_gb is None else max_size_gb
+        self.max_bytes = int(max_size_gb * 1024 ** 3)
+        self.partial_folder = os.path.join(self.store_folder, PARTIAL_FOLDER_NAME)
+        self.index_path = os.path.join(self.store_folder, INDEX_FILE_NAME)
+        self._lock = threading.Lock()
+        self._key_locks = {}
+        self._pins = {}  # key -> number of handed out paths not released yet
+        
+        Path(self.partial_folder).mkdir(parents=True, exist_ok=True)
+        self._index = self._load_index()
+        logger.debug(f"Download store: {self.store_folder} ({len(self._index)} videos)")
+    
+    def make_key(self, video_id, format_string):
+        """
+        Build the store key of a download
+        
+        Args:
+            video_id (str): 11-character YouTube video ID
+            format_string (str): yt-dlp format selection
+        
+        Returns:
+            str: File-name-safe key, e.g. "DGU0wXMKqf4-3f2a9c1b07"
+        """
+        format_hash = hashlib.sha256(format_string.encode('utf-8')).hexdigest()[:10]
+        return f"{video_id}-{format_hash}"
+    
+    def key_lock(self, key):
+        """
+        Lock to hold while a key is looked up and downloaded
+        
+        Two threads downloading the same key would share its partial files,
+        so the second one waits and then finds the first one's download.
+        """
+        with self._lock:
+            return self._key_locks.setdefault(key, threading.Lock())
+    
+    def get(self, key):
+        """
+        Look up a stored download
+        
+        Returns:
+            str: Path of the stored video, or None if it is not in the store
+        """
+        with self._lock:
+            entry = self._index.get(key)
+            if entry is None:
+                return None
+            
+            path = os.path.join(self.store_folder, entry['file'])
+            if not os.path.exists(path):
+                # Deleted outside the store (e.g. DELETE_DOWNLOADED_VIDEO)
+                del self._index[key]
+                self._save_index()
+                return None
+            
+            entry['last_used'] = time.time()
+            self._pins[key] = self._pins.get(key, 0) + 1
+            self._save_index()
+        
+        logger.debug(f"Download store hit: {key}")
+        return path
+    
+    def partial_template(self, key):
+        """yt-dlp output template for downloading a key before it is added"""
+        return os.path.join(self.partial_folder, f"{key}.%(ext)s")
+    
+    def add(self, key, downloaded_file, title=None):
+        """
+        Move a finished download into the store
+        
+        The file is renamed into place in one step, so the store never holds
+        a half-written video. Least recently used videos that are not in use
+        are then evicted until the store fits its quota.
+        
+        Args:
+            key (str): Store key (from make_key)
+            downloaded_file (str): Finished download (normally under partial_template)
+            title (str): Video title, kept in the index for reference
+        
+        Returns:
+            str: Path of the stored video
+        """
+        extension = os.path.splitext(downloaded_file)[1]
+        file_name = f"{key}{extension}"
+        path = os.path.join(self.store_folder, file_name)
+        os.replace(downloaded_file, path)
+        
+        with self._lock:
+            self._index[key] = {
+                'file': file_name,
+                'title': title,
+                'size': os.path.getsize(path),
+                'last_used': time.time(),
+            }
+            self._pins[key] = self._pins.get(key, 0) + 1
+            self._evict()
+            self._save_index()
+        
+        logger.debug(f"Stored download: {key} -> {file_name}")
+        return path
+    
+    def release(self, path):
+        """
+        Unpin a path returned by get() or add() once its video is processed
+        
+        Args:
+            path (str): Video path (paths outside the store are ignored)
+        
+        Returns:
+            bool: False if another caller still uses the video (don't delete it)
+        """
+        file_name = os.path.basename(path)
+        with self._lock:
+            key = next((key for key, entry in self._index.items() if entry['file'] == file_name), None)
+            if key is None or key not in self._pins:
+                return True
+            
+            self._pins[key] -= 1
+            if self._pins[key]:
+                return False
+            del self._pins[key]
+            
+            # Videos kept over the quota while in use can go now
+            self._evict()
+            self._save_index()
+        return True
+    
+    def _load_index(self):
+        """Read the index file (missing or unreadable = empty store)"""
+        try:
+            with open(self.index_path, 'r', encoding='utf-8') as f:
+                return json.load(f)
+        except FileNotFoundError:
+            return {}
+        except Exception as e:
+            logger.warning(f"Ignoring unreadable download store index: {e}")
+            return {}
+    
+    def _save_index(self):
+        """Write the index atomically (temp file + replace); caller holds the lock"""
+        temp_path = f"{self.index_path}.{os.getpid()}.tmp"
+        try:
+            with open(temp_path, 'w', encoding='utf-8') as f:
+                json.dump(self._index, f, ensure_ascii=False, indent=2)
+            os.replace(temp_path, self.index_path)
+        except Exception as e:
+            logger.log_error_with_exception("Error writing download store index", e)
+            if os.path.exists(temp_path):
+                os.remove(temp_path)
+    
+    def _evict(self):
+        """Delete least recently used videos not in use until the store fits max_bytes; caller holds the lock"""
+        if not self.max_bytes:
+            return
+        
+        total_bytes = sum(entry['size'] for entry in self._index.values())
+        by_age = sorted(self._index.items(), key=lambda item: item[1]['last_used'])
+        
+        for key, entry in by_age:
+            if total_bytes <= self.max_bytes:
+                break
+            if key in self._pins:
+                continue
+            try:
+                os.remove(os.path.join(self.store_folder, entry['file']))
+            except FileNotFoundError:
+                pass
+            except OSError as e:
+                logger.warning(f"Could not evict {entry['file']}: {e}")
+                continue
+            del self._index[key]
+            total_bytes -= entry['size']
+            logger.info(f"Evicted stored download: {entry.get('title') or key}")
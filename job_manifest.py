@@ -0,0 +1,168 @@
+"""
+Job Manifest - Integrated with config and logging
+Records which steps of a video's processing are finished, so an interrupted
+run continues where it stopped instead of starting over
+"""
+
+import hashlib
+import json
+import os
+import threading
+import time
+from pathlib import Path
+import config
+from logger import get_logger
+
+logger = get_logger()
+
+# Key of the steps that belong to the whole video rather than one clip
+VIDEO_KEY = "_video"
+
+
+def file_fingerprint(path):
+    """
+    Cheap identity of a file's content: size and modification time
+    
+    Returns:
+        str: "size:mtime_ns", or None if the file does not exist
+    """
+    if not path:
+        return None
+    try:
+        stat = os.stat(path)
+    except OSError:
+        return None
+    return f"{stat.st_size}:{stat.st_mtime_ns}"
+
+
+def inputs_fingerprint(inputs):
+    """Hash a dict of step inputs (file fingerprints, times, settings) into one string"""
+    encoded = json.dumps(inputs, sort_keys=True, default=str).encode('utf-8')
+    return hashlib.sha256(encoded).hexdigest()[:16]
+
+
+class JobManifest:
+    """
+    Per-video JSON record of finished steps, their outputs and input fingerprints
+    
+    Every step is stored under its clip (or the video itself) with the path
+    it produced, a fingerprint of that output and a fingerprint of what it
+    was made from. A step counts as done only while its output is still the
+    file it wrote and its inputs are unchanged, so a re-cut (or overwritten)
+    clip automatically invalidates the subtitle and burns made from the old
+    one. The file is rewritten atomically after every step, so a crash or
+    Ctrl+C loses at most the step that was running.
+    """
+    
+    def __init__(self, video_path, manifest_folder=None, video_id=None):
+        """
+        Initialize the manifest of one source video
+        
+        Args:
+            video_path (str): Source video file
+            manifest_folder (str): Folder for manifest files (uses config if None)
+            video_id (str): YouTube video ID, if the file was downloaded
+        """
+        self.video_path = video_path
+        self.manifest_folder = manifest_folder or os.path.join(config.CACHE_PATH, "manifests")
+        Path(self.manifest_folder).mkdir(parents=True, exist_ok=True)
+        
+        # A download is the same job when it is the same video ID, file name
+        # and size, even if it was downloaded again; any other file also has
+        # to keep its modification time
+        name = os.path.basename(video_path)
+        if video_id:
+            size = os.path.getsize(video_path) if os.path.exists(video_path) else 0
+            identity = f"{video_id}:{name}:{size}"
+        else:
+            identity = f"{name}:{file_fingerprint(video_path)}"
+        video_hash = hashlib.sha256(identity.encode('utf-8')).hexdigest()[:10]
+        prefix = video_id or Path(name).stem[:60]
+        self.path = os.path.join(self.manifest_folder, f"{prefix}-{video_hash}.json")
+        
+        self._lock = threading.Lock()
+        self._data = self._load()
+        self._data['video'] = video_path
+        
+        finished = sum(len(steps) for steps in self._data['clips'].values())
+        if finished:
+            logger.info(f" Resuming from manifest: {finished} finished steps")
+        logger.debug(f"Job manifest: {self.path}")
+    
+    def artifact_path(self, name):
+        """Path for a file kept next to the manifest, e.g. artifact_path('transcript.json')"""
+        return f"{os.path.splitext(self.path)[0]}.{name}"
+    
+    def has(self, step, clip=None):
+        """Check whether a step was ever recorded, up to date or not"""
+        with self._lock:
+            return step in self._data['clips'].get(clip or VIDEO_KEY, {})
+    
+    def get(self, step, clip=None, inputs=None):
+        """
+        Look up a finished step
+        
+        Args:
+            step (str): Step name, e.g. 'cut', 'subtitle' or 'translate:hi'
+            clip (str): Clip file name (None for whole-video steps)
+            inputs (dict): What the step is made from now; must match what was recorded
+        
+        Returns:
+            str: Output path of the step, or None if it has to be (re)done
+        """
+        with self._lock:
+            entry = self._data['clips'].get(clip or VIDEO_KEY, {}).get(step)
+        
+        if entry is None:
+            return None
+        if entry['inputs'] != inputs_fingerprint(inputs or {}):
+            logger.info(f"  Inputs or settings changed, redoing {step}: {clip or 'video'}")
+            return None
+        if entry['output'] and file_fingerprint(entry['output']) != entry.get('output_fingerprint'):
+            # Deleted, or replaced by another step or another video's file
+            return None
+        return entry['output'] or ""
+    
+    def record(self, step, output, clip=None, inputs=None):
+        """
+        Mark a step finished (thread-safe) and save the manifest
+        
+        Args:
+            step (str): Step name
+            output (str): File the step produced
+            clip (str): Clip file name (None for whole-video steps)
+            inputs (dict): What the step was made from
+        """
+        with self._lock:
+            self._data['clips'].setdefault(clip or VIDEO_KEY, {})[step] = {
+                'output': str(output) if output else "",
+                'output_fingerprint': file_fingerprint(output),
+                'inputs': inputs_fingerprint(inputs or {}),
+                'finished_at': time.time(),
+            }
+            self._save()
+    
+    def _load(self):
+        """Read the manifest file (missing or unreadable = nothing finished yet)"""
+        try:
+            with open(self.path, 'r', encoding='utf-8') as f:
+                data = json.load(f)
+            data.setdefault('clips', {})
+            return data
+        except FileNotFoundError:
+            return {'clips': {}}
+        except Exception as e:
+            logger.warning(f"Ignoring unreadable job manifest: {e}")
+            return {'clips': {}}
+    
+    def _save(self):
+        """Write the manifest atomically (temp file + replace); caller holds the lock"""
+        temp_path = f"{self.path}.{os.getpid()}.tmp"
+        try:
+            with open(temp_path, 'w', encoding='utf-8') as f:
+                json.dump(self._data, f, ensure_ascii=False, indent=1)
+            os.replace(temp_path, self.path)
+        except Exception as e:
+            logger.log_error_with_exception("Error writing job manifest", e)
+            if os.path.exists(temp_path):
+                os.remove(temp_path)
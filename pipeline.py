@@ -0,0 +1,140 @@
+"""
+Stage Pipeline - Integrated with config and logging
+Runs work items through a chain of stages connected by bounded queues
+"""
+
+import queue
+import threading
+import time
+from logger import get_logger
+
+logger = get_logger()
+
+# Put on a queue once per downstream worker when a stage has finished
+_DONE = object()
+
+
+class Stage:
+    """One pipeline step: a function applied to each item by its own worker threads"""
+    
+    def __init__(self, name, function, workers=1, queue_size=None):
+        """
+        Args:
+            name (str): Stage name for logs
+            function (callable): Takes an item and returns the item for the next
+                                 stage, or None to drop it
+            workers (int): Threads running this stage
+            queue_size (int): Items waiting in front of this stage (default 2 per worker)
+        """
+        self.name = name
+        self.function = function
+        self.workers = max(1, workers)
+        self.queue = queue.Queue(maxsize=queue_size or 2 * self.workers)
+        self.processed = 0
+        self.failed = 0
+        self.busy_time = 0.0
+        self._lock = threading.Lock()
+        self._running = self.workers
+
+
+class Pipeline:
+    """
+    Producer/consumer pipeline with bounded queues between stages
+    
+    Every stage runs on its own worker threads, so an item can be in stage 2
+    while the next one is still in stage 1. The bounded queues stop a fast
+    stage from running far ahead of a slow one.
+    """
+    
+    def __init__(self, name="pipeline"):
+        self.name = name
+        self.stages = []
+    
+    def add_stage(self, name, function, workers=1, queue_size=None):
+        """Append a stage (see Stage); returns self so calls can be chained"""
+        self.stages.append(Stage(name, function, workers, queue_size))
+        return self
+    
+    def run(self, items):
+        """
+        Push items through every stage and wait until all are done
+        
+        An item whose stage function raises is logged and dropped; the rest
+        keep flowing.
+        
+        Args:
+            items: Iterable of input items for the first stage
+        
+        Returns:
+            list: What the last stage returned for each item (in completion order)
+        """
+        if not self.stages:
+            return list(items)
+        
+        results = []
+        threads = []
+        for position, stage in enumerate(self.stages):
+            next_stage = self.stages[position + 1] if position + 1 < len(self.stages) else None
+            for worker in range(stage.workers):
+                thread = threading.Thread(
+                    target=self._work,
+                    args=(stage, next_stage, results),
+                    name=f"{self.name}-{stage.name}-{worker + 1}",
+                    daemon=True
+                )
+                thread.start()
+                threads.append(thread)
+        
+        first = self.stages[0]
+        try:
+            for item in items:
+                first.queue.put(item)
+        finally:
+            for _ in range(first.workers):
+                first.queue.put(_DONE)
+        
+        for thread in threads:
+            thread.join()
+        
+        for stage in self.stages:
+            logger.debug(
+                f"Stage {stage.name}: {stage.processed} done, {stage.failed} failed, "
+                f"{stage.busy_time:.1f}s busy across {stage.workers} workers"
+            )
+        return results
+    
+    def _work(self, stage, next_stage, results):
+        """Worker loop: take items, run the stage, hand results downstream"""
+        while True:
+            item = stage.queue.get()
+            if item is _DONE:
+                break
+            
+            started = time.time()
+            try:
+                output = stage.function(item)
+            except Exception as e:
+                logger.log_error_with_exception(f"Error in {stage.name} stage", e)
+                output = None
+                with stage._lock:
+                    stage.failed += 1
+            
+            with stage._lock:
+                stage.processed += 1
+                stage.busy_time += time.time() - started
+            
+            if output is None:
+                continue
+            if next_stage:
+                next_stage.queue.put(output)
+            else:
+                with stage._lock:
+                    results.append(output)
+        
+        # The last worker of a stage to finish closes the next stage
+        with stage._lock:
+            stage._running -= 1
+            last = stage._running == 0
+        if last and next_stage:
+            for _ in range(next_stage.workers):
+                next_stage.queue.put(_DONE)
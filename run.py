@@ -328,20 +328,204 @@ Everything is controlled by config.py!
 Includes comprehensive logging and organized folder structure.
 """
 
+import hashlib
+import json
 import os
+import threading
 import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from pathlib import Path
 from datetime import datetime
 
 import config
 from logger import get_logger
 from youtube_downloader import YouTubeDownloader
-from video_cutter import VideoCutter
+from video_cutter import JOB_COPY, VideoCutter
 from subtitle_generator import SubtitleGenerator
 from translator import SubtitleTranslator
+from transcription_pool import TranscriptionPool
+from pipeline import Pipeline
+from job_manifest import JobManifest, file_fingerprint
 
 logger = get_logger()
 
+# Approximate resident memory of one Whisper model (MB), for task scheduling
+WHISPER_RAM_MB = {
+    'tiny': 400,
+    'base': 600,
+    'small': 1200,
+    'medium': 3000,
+    'large': 6000,
+}
+
+# Whisper threads the task scheduler reserves (and sets) when WHISPER_CPU_THREADS is 0
+SCHEDULER_WHISPER_THREADS = 4
+
+# Config keys each step's output depends on. A step recorded in the job
+# manifest is redone when one of them changes; other steps are kept.
+TRANSCRIPT_SETTINGS = (
+    'TRANSCRIPTION_BACKEND',
+    'WHISPER_MODEL',
+    'WHISPER_COMPUTE_TYPE',
+    'SUBTITLE_LANGUAGE',
+    'VAD_ENABLED',
+    'VAD_ENERGY_THRESHOLD_DB',
+    'VAD_MIN_SPEECH_RATIO',
+)
+ENCODE_SETTINGS = (
+    'VIDEO_CODEC',
+    'VIDEO_BITRATE',
+    'AUDIO_CODEC',
+    'AUDIO_BITRATE',
+    'ENCODING_PRESET',
+)
+STEP_SETTINGS = {
+    'cut': ('CLIP_DURATION', 'CUT_MODE', 'KEYFRAME_SNAP_TOLERANCE') + ENCODE_SETTINGS,
+    'transcript': TRANSCRIPT_SETTINGS,
+    'subtitle': TRANSCRIPT_SETTINGS + ('SUBTITLE_FORMAT', 'TRANSCRIBE_FULL_VIDEO'),
+    'burn': (
+        'SUBTITLE_FONT_SIZE',
+        'SUBTITLE_FONT_COLOR',
+        'SUBTITLE_BG_COLOR',
+        'SUBTITLE_BOLD',
+        'SUBTITLE_ITALIC',
+        'SUBTITLE_OUTLINE_COLOR',
+        'SUBTITLE_OUTLINE_WIDTH',
+    ) + ENCODE_SETTINGS,
+    'translate': ('TRANSLATION_PROVIDER', 'TRANSLATION_SOURCE_LANG', 'TRANSLATE_FULL_TRANSCRIPT'),
+}
+
+
+class Task:
+    """One node of a TaskScheduler graph"""
+    
+    def __init__(self, name, function, deps=(), cost=None):
+        """
+        Args:
+            name (str): Task name for logs
+            function (callable): Called without arguments; its return value is kept in .result
+            deps (list): Tasks that must finish successfully first
+            cost: Resources held while running, e.g. {'cpu': 4, 'ram_mb': 1000}, or a
+                  callable returning them once the dependencies are done
+        """
+        self.name = name
+        self.function = function
+        self.deps = list(deps)
+        self.cost = cost if callable(cost) else (cost or {})
+        self.state = "pending"  # pending -> running -> done / failed (or skipped)
+        self.result = None
+
+
+class TaskScheduler:
+    """
+    Run a task graph (DAG), packing tasks onto the machine's resources
+    
+    A task starts once its dependencies are done and its declared cost fits
+    in what is left of every resource (CPU cores, RAM, Whisper models, disk
+    and network slots). Later tasks may start ahead of an earlier one that
+    doesn't fit yet. Tasks can add more tasks while the graph runs, and a
+    failed task skips everything that depends on it.
+    """
+    
+    def __init__(self, capacity):
+        """
+        Args:
+            capacity (dict): Available amount per resource; resources not listed are unlimited
+        """
+        self.capacity = dict(capacity)
+        self.available = dict(capacity)
+        self.tasks = []
+        self._pending = []
+        self._running = 0
+        self._condition = threading.Condition()
+    
+    def add(self, name, function, deps=(), cost=None):
+        """Add a task (thread-safe, also from inside a running task)"""
+        task = Task(name, function, deps, cost if callable(cost) else self._clamp(cost))
+        with self._condition:
+            self.tasks.append(task)
+            self._pending.append(task)
+            self._condition.notify_all()
+        return task
+    
+    def run(self):
+        """
+        Run until every task has finished
+        
+        Returns:
+            list: Tasks that failed or were skipped
+        """
+        with self._condition:
+            while True:
+                self._start_ready()
+                if not self._pending and not self._running:
+                    break
+                self._condition.wait()
+        
+        unfinished = [task for task in self.tasks if task.state != "done"]
+        logger.debug(
+            f"Task graph finished: {len(self.tasks) - len(unfinished)} done, "
+            f"{len(unfinished)} failed or skipped"
+        )
+        return unfinished
+    
+    def _start_ready(self):
+        """Start every pending task whose dependencies are done and whose cost fits (lock held)"""
+        still_pending = []
+        for task in self._pending:
+            if any(dep.state in ("failed", "skipped") for dep in task.deps):
+                task.state = "skipped"
+                logger.debug(f"Skipping {task.name}: a dependency failed")
+                continue
+            if any(dep.state != "done" for dep in task.deps):
+                still_pending.append(task)
+                continue
+            if callable(task.cost):
+                # Costs that depend on what the dependencies produced
+                task.cost = self._clamp(task.cost())
+            if not self._fits(task.cost):
+                still_pending.append(task)
+                continue
+            
+            for resource, amount in task.cost.items():
+                if resource in self.available:
+                    self.available[resource] -= amount
+            task.state = "running"
+            self._running += 1
+            threading.Thread(target=self._execute, args=(task,), name=task.name, daemon=True).start()
+        self._pending = still_pending
+    
+    def _clamp(self, cost):
+        """Limit a cost to the capacity - a task larger than the machine still runs, alone"""
+        return {
+            resource: min(amount, self.capacity.get(resource, amount))
+            for resource, amount in (cost or {}).items()
+        }
+    
+    def _fits(self, cost):
+        return all(
+            amount <= self.available[resource]
+            for resource, amount in cost.items()
+            if resource in self.available
+        )
+    
+    def _execute(self, task):
+        """Run one task on its own thread, then release its resources"""
+        try:
+            task.result = task.function()
+            state = "done"
+        except Exception as e:
+            logger.log_error_with_exception(f"Error in task {task.name}", e)
+            state = "failed"
+        
+        with self._condition:
+            task.state = state
+            for resource, amount in task.cost.items():
+                if resource in self.available:
+                    self.available[resource] += amount
+            self._running -= 1
+            self._condition.notify_all()
+
 
 class VideoProcessor:
     """Main video processing class with logging and config integration"""
@@ -349,7 +533,26 @@ class VideoProcessor:
     def __init__(self):
         self.downloader = None
         self.subtitle_gen = None
+        self.transcription_pool = None
         self.translator = None
+        self.clip_times = {}  # Clip file name -> (start, end) in the source video
+        self.source_video = None
+        self.source_offset = 0  # Where source_video starts in the original video
+        self.video_id = None  # YouTube video ID of the video being processed
+        self.full_transcript = None  # Whole-video transcription, when one was made
+        self._translated_transcripts = {}  # Target language -> translated full transcript
+        self.manifest = None  # JobManifest of the source being processed (RESUME_JOBS)
+        self.subtitles = {}  # Clip file name -> subtitle file, for the source being processed
+        
+        # Output folders of the source being processed (see _set_workspace)
+        self.clips_folder = config.CLIPS_PATH
+        self.subtitles_folder = config.SUBTITLE_FILES_PATH
+        self.subtitled_folder = config.CLIPS_WITH_SUBTITLES_PATH
+        self.translated_folder = config.CLIPS_WITH_SUBTITLES_PATH + config.TRANSLATION_FOLDER_SUFFIX
+        self.workspace_private = False  # True when no other video writes to these folders
+        self.burn_threads = None  # FFmpeg threads per subtitle burn (None = all cores)
+        self._stats_lock = threading.Lock()
+        self._translation_lock = threading.Lock()
         self.stats = {
             "total_clips_created": 0,
             "clips_with_subtitles": 0,
@@ -362,6 +565,63 @@ class VideoProcessor:
         logger.log_config()
         self._initialize_components()
     
+    def _count(self, key, amount=1):
+        """Add to a stats counter (pipeline stages update it from several threads)"""
+        with self._stats_lock:
+            self.stats[key] += amount
+    
+    def _finished(self, step, clip_path, inputs):
+        """
+        Look up a step the job manifest already has (RESUME_JOBS)
+        
+        The step only counts as finished if its inputs and the settings it
+        depends on (STEP_SETTINGS) are the same as when it ran.
+        
+        Args:
+            step (str): Step name, e.g. 'subtitle' or 'burn:hi'
+            clip_path: Clip the step belongs to (None for whole-video steps)
+            inputs (dict): Fingerprints of what the step is made from
+        
+        Returns:
+            str: Output of the finished step, or None if it has to run
+        """
+        if not self.manifest:
+            return None
+        clip = os.path.basename(str(clip_path)) if clip_path else None
+        return self.manifest.get(step, clip, self._step_inputs(step, inputs))
+    
+    def _record(self, step, clip_path, output, inputs):
+        """Save a finished step in the job manifest (RESUME_JOBS)"""
+        if self.manifest:
+            clip = os.path.basename(str(clip_path)) if clip_path else None
+            self.manifest.record(step, output, clip, self._step_inputs(step, inputs))
+    
+    def _step_inputs(self, step, inputs):
+        """Add the current values of the step's STEP_SETTINGS to its inputs"""
+        return dict(inputs, settings=self._step_settings(step.split(':')[0]))
+    
+    def _step_settings(self, kind):
+        return {key: getattr(config, key) for key in STEP_SETTINGS.get(kind, ())}
+    
+    def _track_cuts(self, cutter):
+        """Let a cutter skip clips the job manifest has, and record the ones it cuts"""
+        if not self.manifest:
+            return cutter
+        source = file_fingerprint(cutter.input_video)
+        
+        def cut_inputs(start_time, end_time):
+            return {'source': source, 'start': round(start_time, 3), 'end': round(end_time, 3)}
+        
+        def is_clip_done(output_file, start_time, end_time):
+            return self._finished('cut', output_file, cut_inputs(start_time, end_time)) is not None
+        
+        def on_clip_done(output_file, start_time, end_time):
+            self._record('cut', output_file, output_file, cut_inputs(start_time, end_time))
+        
+        cutter.is_clip_done = is_clip_done
+        cutter.on_clip_done = on_clip_done
+        return cutter
+    
     def _initialize_components(self):
         """Initialize downloader and subtitle generator"""
         try:
@@ -370,9 +630,19 @@ class VideoProcessor:
             logger.info(" YouTube downloader initialized")
             
             # Initialize subtitle generator if enabled
-            if config.ENABLE_SUBTITLES:
+            if config.ENABLE_SUBTITLES and config.MAX_CONCURRENT_PROCESSES > 1:
+                # Each pool worker loads its own model; this instance only writes/burns
+                self.transcription_pool = TranscriptionPool(
+                    workers=config.MAX_CONCURRENT_PROCESSES,
+                    model_size=config.WHISPER_MODEL
+                )
+                self.subtitle_gen = SubtitleGenerator(model_size=config.WHISPER_MODEL, load_model=False)
+                logger.info(" Subtitle generator initialized (worker pool)")
+            elif config.ENABLE_SUBTITLES:
                 logger.info(f" Loading Whisper model ({config.WHISPER_MODEL})...")
-                self.subtitle_gen = SubtitleGenerator(model_size=config.WHISPER_MODEL)
+                # The task scheduler packs Whisper onto as many cores as it reserves for it
+                cpu_threads = (config.WHISPER_CPU_THREADS or SCHEDULER_WHISPER_THREADS) if config.TASK_SCHEDULER else None
+                self.subtitle_gen = SubtitleGenerator(model_size=config.WHISPER_MODEL, cpu_threads=cpu_threads)
                 logger.info(" Subtitle generator initialized")
             else:
                 logger.info("  Subtitle generation disabled")
@@ -381,7 +651,7 @@ class VideoProcessor:
             if config.ENABLE_TRANSLATION:
                 logger.info(" Initializing translator...")
                 self.translator = SubtitleTranslator()
-                logger.info(f" Translator initialized (Target: {config.TRANSLATION_TARGET_LANG})")
+                logger.info(f" Translator initialized (Target: {', '.join(config.get_translation_target_langs())})")
             else:
                 logger.info("  Translation disabled")
                 
@@ -389,43 +659,43 @@ class VideoProcessor:
             logger.log_error_with_exception("Error initializing components", e)
             raise
     
-    def process_video(self, video_source, is_youtube=True):
+    def process_video(self, video_source, is_youtube=True, sources=None):
         """
         Main video processing pipeline
         
         Args:
             video_source: YouTube URL or local file path
             is_youtube: True if YouTube URL, False if local file
+            sources: Already downloaded files from get_sources (skips step 1)
         """
         start_time = time.time()
         
         try:
             logger.log_processing_start(video_source)
+            self.video_id = self.downloader.get_video_id(video_source) if is_youtube else None
             
             # Step 1: Get or download video
-            video_path = self._get_video_path(video_source, is_youtube)
-            if not video_path:
+            if sources is None:
+                sources = self.get_sources(video_source, is_youtube)
+            if not sources:
                 logger.error(" Failed to get video")
-                self.stats["errors"] += 1
-                return False
-            
-            # Step 2: Cut video into clips
-            clips = self._cut_video(video_path)
-            if not clips:
-                logger.error(" Failed to create clips")
-                self.stats["errors"] += 1
+                self._count("errors")
                 return False
             
-            # Step 3: Generate subtitles and burn them
-            if config.ENABLE_SUBTITLES:
-                self._process_subtitles(clips)
-            
-            # Step 4: Translate subtitles if enabled
-            if config.ENABLE_TRANSLATION and config.ENABLE_SUBTITLES:
-                self._translate_subtitles()
+            processed = 0
+            for video_path, time_offset in sources:
+                if len(sources) > 1:
+                    logger.log_section(f"SECTION FROM {time_offset:.0f}s: {os.path.basename(video_path)}")
+                
+                # Steps 2-4: Cut, subtitle and translate
+                if self._process_source(video_path, time_offset):
+                    processed += 1
+                
+                # Step 5: Cleanup
+                self._cleanup(video_path, is_youtube)
             
-            # Step 5: Cleanup
-            self._cleanup(video_path, is_youtube)
+            if not processed:
+                return False
             
             # Calculate total time
             total_time = time.time() - start_time
@@ -438,9 +708,126 @@ class VideoProcessor:
             
         except Exception as e:
             logger.log_error_with_exception("Error in video processing", e)
-            self.stats["errors"] += 1
+            self._count("errors")
             return False
     
+    def get_sources(self, video_source, is_youtube):
+        """
+        Get or download a video (or just the configured sections of it)
+        
+        Safe to call from a download thread while another video is processed.
+        
+        Returns:
+            list: (video file path, start in the original video) tuples, empty if failed
+        """
+        if is_youtube and config.YOUTUBE_SECTIONS:
+            return self._download_sections(video_source)
+        
+        video_path = self._get_video_path(video_source, is_youtube)
+        return [(video_path, 0)] if video_path else []
+    
+    def _process_source(self, video_path, time_offset=0):
+        """
+        Cut, subtitle and translate one source video file
+        
+        Args:
+            video_path (str): Video file to process
+            time_offset (float): Where the file starts in the original video
+        
+        Returns:
+            bool: True if clips were created
+        """
+        self.source_video = video_path
+        self.source_offset = time_offset
+        self.full_transcript = None
+        self._translated_transcripts = {}
+        self.clip_times = {}
+        self.subtitles = {}
+        self.manifest = JobManifest(video_path, video_id=self.video_id) if config.RESUME_JOBS else None
+        self._set_workspace(video_path)
+        fused = config.FUSED_CUT_AND_BURN and config.ENABLE_SUBTITLES and config.BURN_SUBTITLES
+        
+        # Steps 2-4 as a task graph on the machine's cores and memory
+        if config.TASK_SCHEDULER and not fused:
+            return bool(self._run_task_graph(video_path))
+        
+        # Steps 2-4 overlapped, one clip at a time
+        if config.STREAMING_PIPELINE and not fused:
+            return bool(self._run_streaming_pipeline(video_path))
+        
+        # Step 2: Cut video into clips
+        if fused:
+            # Steps 2 + 3 in one encode per clip, straight from the source
+            clips = self._cut_and_burn(video_path)
+        else:
+            clips = self._cut_video(video_path)
+        if not clips:
+            logger.error(" Failed to create clips")
+            self._count("errors")
+            return False
+        
+        # Step 3: Generate subtitles and burn them
+        if config.ENABLE_SUBTITLES and not fused:
+            self._process_subtitles(clips, video_path)
+        
+        # Step 4: Translate subtitles if enabled
+        if config.ENABLE_TRANSLATION and config.ENABLE_SUBTITLES:
+            self._translate_subtitles()
+        
+        return True
+    
+    def _set_workspace(self, video_path):
+        """
+        Point the output folders at the source being processed
+        
+        With SEPARATE_FOLDERS_PER_VIDEO every source gets its own subfolder in
+        the clips, subtitle files, subtitled clips and translated folders, so
+        a video never sees (or reprocesses) another video's files. The
+        subfolder is the file name plus a short hash of the video ID (or the
+        full path), so two sources with the same file name stay apart.
+        """
+        folders = (
+            config.CLIPS_PATH,
+            config.SUBTITLE_FILES_PATH,
+            config.CLIPS_WITH_SUBTITLES_PATH,
+            config.CLIPS_WITH_SUBTITLES_PATH + config.TRANSLATION_FOLDER_SUFFIX,
+        )
+        if config.SEPARATE_FOLDERS_PER_VIDEO:
+            name = Path(video_path).stem[:60].strip() or "video"
+            identity = f"{self.video_id}:{Path(video_path).name}" if self.video_id else os.path.abspath(video_path)
+            workspace = f"{name}-{hashlib.sha256(identity.encode('utf-8')).hexdigest()[:8]}"
+            folders = tuple(os.path.join(folder, workspace) for folder in folders)
+            logger.info(f" Video folder: {workspace}")
+        
+        for folder in folders:
+            Path(folder).mkdir(parents=True, exist_ok=True)
+        self.workspace_private = config.SEPARATE_FOLDERS_PER_VIDEO
+        self.clips_folder, self.subtitles_folder, self.subtitled_folder, self.translated_folder = folders
+    
+    def _download_sections(self, url):
+        """
+        Download only config.YOUTUBE_SECTIONS of a YouTube video
+        
+        Returns:
+            list: (section file path, section start in seconds) tuples
+        """
+        logger.log_download_start(url)
+        
+        section_files = self.downloader.download_sections(
+            url,
+            config.YOUTUBE_SECTIONS,
+            quality=config.YOUTUBE_QUALITY
+        )
+        if not section_files:
+            logger.error(" Section download failed")
+            return []
+        
+        for path in section_files.values():
+            size_mb = os.path.getsize(path) / (1024 * 1024)
+            logger.log_download_complete(path, size_mb)
+        
+        return [(path, start) for (start, end), path in section_files.items()]
+    
     def _get_video_path(self, source, is_youtube):
         """Get video path (download if YouTube, validate if local)"""
         if is_youtube:
@@ -479,15 +866,16 @@ class VideoProcessor:
     def _cut_video(self, video_path):
         """Cut video into clips"""
         logger.log_section("CUTTING VIDEO INTO CLIPS")
-        logger.info(f" Output folder: {config.CLIPS_PATH}")
+        logger.info(f" Output folder: {self.clips_folder}")
         logger.info(f"  Clip duration: {config.CLIP_DURATION} seconds")
         
         try:
-            cutter = VideoCutter(
+            cutter = self._track_cuts(VideoCutter(
                 input_video=video_path,
-                output_folder=config.CLIPS_PATH,
-                clip_duration=config.CLIP_DURATION
-            )
+                output_folder=self.clips_folder,
+                clip_duration=config.CLIP_DURATION,
+                time_offset=self.source_offset
+            ))
             
             # Get video duration
             duration = cutter.get_video_duration()
@@ -497,10 +885,14 @@ class VideoProcessor:
             
             # Cut video
             cutter.cut_video_segments()
+            self.clip_times = {
+                os.path.basename(clip['path']): (clip['start'], clip['end'])
+                for clip in cutter.clip_info
+            }
             
-            # Get created clips
-            clips = sorted(Path(config.CLIPS_PATH).glob("*.mp4"))
-            self.stats["total_clips_created"] = len(clips)
+            # Get created clips (only this source's - sections share the folder)
+            clips = [Path(clip['path']) for clip in cutter.clip_info]
+            self._count("total_clips_created", len(clips))
             logger.info(f" Created {len(clips)} clips")
             
             return clips
@@ -509,7 +901,109 @@ class VideoProcessor:
             logger.log_error_with_exception("Error cutting video", e)
             return []
     
-    def _process_subtitles(self, clips):
+    def _cut_and_burn(self, video_path):
+        """Transcribe the source once, then cut and burn every clip in a single encode"""
+        logger.log_section("CUTTING CLIPS WITH SUBTITLES (SINGLE ENCODE)")
+        logger.info(f" Output folder: {self.subtitled_folder}")
+        logger.info(f"  Clip duration: {config.CLIP_DURATION} seconds")
+        
+        try:
+            cutter = VideoCutter(
+                input_video=video_path,
+                output_folder=self.clips_folder,
+                clip_duration=config.CLIP_DURATION,
+                time_offset=self.source_offset
+            )
+            plan = cutter.get_clip_plan()
+            if not plan:
+                logger.error(" Could not plan clips")
+                return []
+            logger.info(f" Planned clips: {len(plan)}")
+            
+            transcript = self._transcribe_full_video(video_path)
+            self.full_transcript = transcript
+            if transcript is None:
+                logger.warning("  Falling back to separate cut and burn")
+                clips = self._cut_video(video_path)
+                if clips:
+                    self._process_subtitles(clips, video_path)
+                return clips
+            
+            self.clip_times = {}
+            clips = []
+            
+            for idx, clip in enumerate(plan, 1):
+                clip_path = Path(clip['path'])
+                logger.log_progress(idx, len(plan), clip_path.name)
+                self.clip_times[clip_path.name] = (clip['start'], clip['end'])
+                
+                clip_inputs = {
+                    'source': file_fingerprint(video_path),
+                    'start': round(clip['start'], 3),
+                    'end': round(clip['end'], 3),
+                }
+                subtitle_path = self._finished('subtitle', clip_path, clip_inputs)
+                if subtitle_path is None:
+                    subtitle_path = self.subtitle_gen.write_subtitles(
+                        self.subtitle_gen.slice_result(transcript, clip['start'], clip['end']),
+                        os.path.join(self.subtitles_folder, f"{clip_path.stem}.{config.SUBTITLE_FORMAT}"),
+                        output_format=config.SUBTITLE_FORMAT
+                    )
+                    if not subtitle_path:
+                        logger.error(f" Failed to write subtitles for: {clip_path.name}")
+                        self._count("errors")
+                        continue
+                    self._count("subtitles_generated")
+                    self._record('subtitle', clip_path, subtitle_path, clip_inputs)
+                self.subtitles[clip_path.name] = subtitle_path
+                
+                # The single encode is the cut as well
+                burn_inputs = dict(
+                    clip_inputs,
+                    subtitle=file_fingerprint(subtitle_path),
+                    cut=self._step_settings('cut')
+                )
+                if self._finished('burn', clip_path, burn_inputs) is not None:
+                    logger.info(f"  Skipping (already burned): {clip_path.name}")
+                    clips.append(clip_path)
+                    continue
+                
+                output_path = os.path.join(
+                    self.subtitled_folder,
+                    clip_path.stem + "_subtitled" + clip_path.suffix
+                )
+                logger.log_video_cut(os.path.basename(output_path), clip['start'], clip['end'])
+                
+                result = self.subtitle_gen.add_subtitles_to_video(
+                    video_path,
+                    subtitle_path,
+                    output_path,
+                    font_size=config.SUBTITLE_FONT_SIZE,
+                    font_color=config.SUBTITLE_FONT_COLOR,
+                    bg_color=config.SUBTITLE_BG_COLOR,
+                    start_time=clip['start'],
+                    end_time=clip['end'],
+                    threads=self.burn_threads
+                )
+                
+                if result:
+                    self._count("clips_with_subtitles")
+                    logger.log_file_created(output_path)
+                    self._record('burn', clip_path, output_path, burn_inputs)
+                    clips.append(clip_path)
+                else:
+                    logger.error(f" Failed to create subtitled clip: {clip_path.name}")
+                    self._count("errors")
+            
+            self._count("total_clips_created", len(clips))
+            logger.info(f" Created {len(clips)} subtitled clips")
+            return clips
+            
+        except Exception as e:
+            logger.log_error_with_exception("Error cutting and burning video", e)
+            return []
+    
+    def _process_subtitles(self, clips, video_path=None):
         """Generate and burn subtitles for all clips"""
         if not clips:
             logger.warning("  No clips to process")
@@ -521,65 +1015,198 @@ class VideoProcessor:
         logger.info(f" Model: {config.WHISPER_MODEL}")
         logger.info(f" Burn into video: {config.BURN_SUBTITLES}")
         
-        for idx, clip_path in enumerate(clips, 1):
-            try:
-                logger.log_progress(idx, len(clips), clip_path.name)
-                
-                # Check if already processed
-                if config.SKIP_EXISTING_SUBTITLES:
-                    subtitle_path = str(clip_path).replace('.mp4', f'.{config.SUBTITLE_FORMAT}')
-                    if os.path.exists(subtitle_path):
-                        logger.info(f"  Skipping (subtitle exists): {clip_path.name}")
-                        continue
-                
-                # Generate subtitles
-                subtitle_start = time.time()
-                logger.log_subtitle_generation(
-                    clip_path.name,
-                    config.SUBTITLE_LANGUAGE,
-                    config.WHISPER_MODEL
-                )
-                
-                subtitle_path = self.subtitle_gen.generate_subtitles(
+        # Transcribe the whole source once and slice it per clip
+        full_transcript = None
+        if config.TRANSCRIBE_FULL_VIDEO and video_path:
+            full_transcript = self._transcribe_full_video(video_path)
+            self.full_transcript = full_transcript
+        
+        # Queue every remaining clip on the worker pool up front
+        pending = {}
+        if self.transcription_pool:
+            for clip_path in clips:
+                if self._existing_subtitle(clip_path):
+                    continue
+                if full_transcript and clip_path.name in self.clip_times:
+                    continue
+                pending[clip_path] = self.transcription_pool.submit(
                     str(clip_path),
-                    output_format=config.SUBTITLE_FORMAT,
                     language=config.SUBTITLE_LANGUAGE
                 )
+        
+        for idx, clip_path in enumerate(clips, 1):
+            try:
+                logger.log_progress(idx, len(clips), clip_path.name)
                 
-                subtitle_duration = time.time() - subtitle_start
+                subtitle_path = self._subtitle_clip(clip_path, full_transcript, pending.pop(clip_path, None))
                 
-                if subtitle_path:
-                    self.stats["subtitles_generated"] += 1
-                    logger.log_subtitle_complete(subtitle_path, subtitle_duration)
-                    
-                    # Move subtitle to subtitle files folder
-                    subtitle_filename = os.path.basename(subtitle_path)
-                    new_subtitle_path = os.path.join(
-                        config.SUBTITLE_FILES_PATH,
-                        subtitle_filename
-                    )
-                    os.rename(subtitle_path, new_subtitle_path)
-                    logger.info(f" Moved subtitle to: {config.SUBTITLE_FILES_PATH}/")
-                    
-                    # Burn subtitles into video if enabled
-                    if config.BURN_SUBTITLES:
-                        self._burn_subtitles(clip_path, new_subtitle_path)
-                    
-                else:
-                    logger.error(f" Failed to generate subtitles for: {clip_path.name}")
-                    self.stats["errors"] += 1
+                # Burn subtitles into video if enabled
+                if subtitle_path and config.BURN_SUBTITLES:
+                    self._burn_subtitles(clip_path, subtitle_path)
                     
             except Exception as e:
                 logger.log_error_with_exception(f"Error processing {clip_path.name}", e)
-                self.stats["errors"] += 1
+                self._count("errors")
         
         logger.info(f" Subtitle generation complete: {self.stats['subtitles_generated']}/{len(clips)}")
     
+    def _subtitle_clip(self, clip_path, full_transcript=None, future=None):
+        """
+        Generate one clip's subtitle file in the subtitle files folder
+        
+        Args:
+            clip_path (Path): Clip to subtitle
+            full_transcript (dict): Whole-video transcription to slice, if any
+            future: Pending TranscriptionPool result for this clip, if already queued
+        
+        Returns:
+            str: Subtitle file path, or None if generation failed
+        """
+        # Check if already processed
+        existing = self._existing_subtitle(clip_path)
+        if existing:
+            logger.info(f"  Skipping (subtitle exists): {clip_path.name}")
+            self.subtitles[clip_path.name] = existing
+            return existing
+        
+        subtitle_start = time.time()
+        logger.log_subtitle_generation(
+            clip_path.name,
+            config.SUBTITLE_LANGUAGE,
+            config.WHISPER_MODEL
+        )
+        
+        if full_transcript and clip_path.name in self.clip_times:
+            clip_start, clip_end = self.clip_times[clip_path.name]
+            subtitle_path = self.subtitle_gen.write_subtitles(
+                self.subtitle_gen.slice_result(full_transcript, clip_start, clip_end),
+                str(clip_path.with_suffix(f'.{config.SUBTITLE_FORMAT}')),
+                output_format=config.SUBTITLE_FORMAT
+            )
+        elif future or self.transcription_pool:
+            if future is None:
+                future = self.transcription_pool.submit(
+                    str(clip_path),
+                    language=config.SUBTITLE_LANGUAGE
+                )
+            result = future.result()
+            subtitle_path = result and self.subtitle_gen.write_subtitles(
+                result,
+                str(clip_path.with_suffix(f'.{config.SUBTITLE_FORMAT}')),
+                output_format=config.SUBTITLE_FORMAT
+            )
+        else:
+            subtitle_path = self.subtitle_gen.generate_subtitles(
+                str(clip_path),
+                output_format=config.SUBTITLE_FORMAT,
+                language=config.SUBTITLE_LANGUAGE
+            )
+        
+        if not subtitle_path:
+            logger.error(f" Failed to generate subtitles for: {clip_path.name}")
+            self._count("errors")
+            return None
+        
+        self._count("subtitles_generated")
+        logger.log_subtitle_complete(subtitle_path, time.time() - subtitle_start)
+        
+        # Move subtitle to subtitle files folder
+        subtitle_filename = os.path.basename(subtitle_path)
+        new_subtitle_path = os.path.join(
+            self.subtitles_folder,
+            subtitle_filename
+        )
+        os.replace(subtitle_path, new_subtitle_path)
+        logger.info(f" Moved subtitle to: {self.subtitles_folder}/")
+        self._record('subtitle', clip_path, new_subtitle_path, {'clip': file_fingerprint(clip_path)})
+        self.subtitles[clip_path.name] = new_subtitle_path
+        return new_subtitle_path
+    
+    def _existing_subtitle(self, clip_path):
+        """
+        Find a clip's subtitle from an earlier run (job manifest or SKIP_EXISTING_SUBTITLES)
+        
+        Returns:
+            str: Subtitle file path, or None if it has to be generated
+        """
+        subtitle_path = self._finished('subtitle', clip_path, {'clip': file_fingerprint(clip_path)})
+        if subtitle_path:
+            return subtitle_path
+        
+        # A manifest entry that is out of date means the subtitle must be redone
+        if self.manifest and self.manifest.has('subtitle', clip_path.name):
+            return None
+        
+        # Clip names repeat across videos, so a subtitle is only matched by
+        # name inside a folder no other video writes to
+        if config.SKIP_EXISTING_SUBTITLES and self.workspace_private:
+            # Subtitles are moved next to the others once written
+            subtitle_path = os.path.join(
+                self.subtitles_folder,
+                f"{Path(clip_path).stem}.{config.SUBTITLE_FORMAT}"
+            )
+            if os.path.exists(subtitle_path):
+                return subtitle_path
+        return None
+    
+    def _transcribe_full_video(self, video_path):
+        """Transcribe the source video once, with word timestamps for slicing"""
+        transcript_inputs = {'source': file_fingerprint(video_path)}
+        cached = self._finished('transcript', None, transcript_inputs)
+        if cached:
+            try:
+                with open(cached, 'r', encoding='utf-8') as f:
+                    result = json.load(f)
+                logger.info(f" Using full-video transcript from an earlier run ({len(result['segments'])} segments)")
+                return result
+            except Exception as e:
+                logger.warning(f"  Could not read saved transcript, transcribing again: {e}")
+        
+        logger.info(f" Transcribing full video once: {os.path.basename(video_path)}")
+        transcribe_start = time.time()
+        
+        if self.transcription_pool:
+            result = self.transcription_pool.submit(
+                video_path,
+                language=config.SUBTITLE_LANGUAGE,
+                word_timestamps=True
+            ).result()
+        else:
+            result = self.subtitle_gen.transcribe(
+                video_path,
+                language=config.SUBTITLE_LANGUAGE,
+                word_timestamps=True
+            )
+        
+        if result is None:
+            logger.warning("  Full-video transcription failed - falling back to per-clip")
+            return None
+        
+        logger.info(
+            f" Full video transcribed in {time.time() - transcribe_start:.2f}s "
+            f"({len(result['segments'])} segments)"
+        )
+        
+        if self.manifest:
+            transcript_path = self.manifest.artifact_path("transcript.json")
+            try:
+                with open(transcript_path, 'w', encoding='utf-8') as f:
+                    json.dump(result, f, ensure_ascii=False)
+                self._record('transcript', None, transcript_path, transcript_inputs)
+            except (OSError, TypeError) as e:
+                logger.warning(f"  Could not save transcript for resuming: {e}")
+        return result
+    
     def _burn_subtitles(self, clip_path, subtitle_path):
         """Burn subtitles into video"""
         try:
+            burn_inputs = {'clip': file_fingerprint(clip_path), 'subtitle': file_fingerprint(subtitle_path)}
+            if self._finished('burn', clip_path, burn_inputs) is not None:
+                logger.info(f"  Skipping (already burned): {clip_path.name}")
+                return
+            
             output_filename = clip_path.stem + "_subtitled" + clip_path.suffix
-            output_path = os.path.join(config.CLIPS_WITH_SUBTITLES_PATH, output_filename)
+            output_path = os.path.join(self.subtitled_folder, output_filename)
             
             logger.info(f" Burning subtitles into: {clip_path.name}")
             
@@ -589,12 +1216,14 @@ class VideoProcessor:
                 output_path,
                 font_size=config.SUBTITLE_FONT_SIZE,
                 font_color=config.SUBTITLE_FONT_COLOR,
-                bg_color=config.SUBTITLE_BG_COLOR
+                bg_color=config.SUBTITLE_BG_COLOR,
+                threads=self.burn_threads
             )
             
             if result:
-                self.stats["clips_with_subtitles"] += 1
+                self._count("clips_with_subtitles")
                 logger.log_file_created(output_path)
+                self._record('burn', clip_path, output_path, burn_inputs)
                 
                 # Delete original clip if configured
                 if config.DELETE_ORIGINAL_CLIPS:
@@ -602,102 +1231,605 @@ class VideoProcessor:
                     logger.log_file_deleted(str(clip_path))
             else:
                 logger.error(f" Failed to burn subtitles for: {clip_path.name}")
-                self.stats["errors"] += 1
+                self._count("errors")
                 
         except Exception as e:
             logger.log_error_with_exception(f"Error burning subtitles", e)
-            self.stats["errors"] += 1
+            self._count("errors")
     
     def _translate_subtitles(self):
-        """Translate all subtitle files"""
+        """Translate all subtitles to every target language and burn them"""
         logger.log_section("TRANSLATING SUBTITLES")
         
-        # Get all subtitle files
-        subtitle_files = list(Path(config.SUBTITLE_FILES_PATH).glob("*.srt"))
+        source_lang = self._translation_source_lang()
+        target_langs = config.get_translation_target_langs()
+        logger.info(f"Target languages: {', '.join(target_langs)}")
         
-        if not subtitle_files:
-            logger.warning("No subtitle files found to translate")
-            return
+        translated_by_lang = self._translate_all(source_lang, target_langs)
         
-        # Determine source language
+        burn_jobs = []
+        for target_lang, translated in translated_by_lang.items():
+            if translated is None:
+                self._count("errors")
+                continue
+            
+            # Create translated folder (one per language)
+            translated_folder = os.path.join(
+                self.translated_folder,
+                target_lang
+            )
+            Path(translated_folder).mkdir(parents=True, exist_ok=True)
+            
+            for clip_stem, translated_srt in translated:
+                if translated_srt:
+                    self._count("clips_translated")
+                    if config.BURN_SUBTITLES:
+                        burn_jobs.append((clip_stem, translated_srt, target_lang, translated_folder))
+                else:
+                    logger.error(f"Failed to translate: {clip_stem} ({target_lang})")
+                    self._count("errors")
+        
+        # Burn translated subtitles into video if enabled - all languages in parallel
+        if burn_jobs:
+            logger.info(f" Burning {len(burn_jobs)} translated clips")
+            with ThreadPoolExecutor(max_workers=max(1, config.MAX_CONCURRENT_PROCESSES)) as executor:
+                results = list(executor.map(lambda job: self._burn_translated(*job), burn_jobs))
+            self._count("errors", results.count(False))
+        
+        total = sum(len(translated or []) for translated in translated_by_lang.values())
+        logger.info(f" Translation complete: {self.stats['clips_translated']}/{total}")
+        logger.info(
+            f" Translated clips saved in: "
+            f"{self.translated_folder}/<language>"
+        )
+    
+    def _translation_source_lang(self):
+        """Determine the language subtitles are translated from"""
         source_lang = config.TRANSLATION_SOURCE_LANG
         if source_lang == "auto":
             source_lang = config.SUBTITLE_LANGUAGE
             if source_lang == "auto":
                 source_lang = "en"  # Default to English
                 logger.info(f"Auto-detected source language: {source_lang}")
+        return source_lang
+    
+    def _translate_all(self, source_lang, target_langs):
+        """
+        Translate the subtitles to every target language
         
-        logger.info(f"Translating {len(subtitle_files)} subtitle files")
-        logger.info(f"From: {source_lang} → To: {config.TRANSLATION_TARGET_LANG}")
+        Returns:
+            dict: Target language -> (clip stem, translated subtitle path or None)
+                  list in clip order, or None for a language that failed
+        """
+        # Translate the whole transcript once when there is one, else each file;
+        # either way all languages are translated at the same time
+        if config.TRANSLATE_FULL_TRANSCRIPT and self.full_transcript and self.clip_times:
+            translate = self._translate_full_transcript
+        else:
+            translate = self._translate_subtitle_files
         
-        # Create translated folder
-        translated_folder = config.CLIPS_WITH_SUBTITLES_PATH + config.TRANSLATION_FOLDER_SUFFIX
-        Path(translated_folder).mkdir(parents=True, exist_ok=True)
+        try:
+            return translate(source_lang, target_langs)
+        except Exception as e:
+            logger.log_error_with_exception(f"Error translating to {', '.join(target_langs)}", e)
+            return dict.fromkeys(target_langs)
+    
+    def _burn_translated(self, clip_stem, translated_srt, target_lang, translated_folder):
+        """
+        Burn one translated subtitle file (runs on a worker thread)
         
-        for idx, srt_path in enumerate(subtitle_files, 1):
-            try:
-                logger.log_progress(idx, len(subtitle_files), srt_path.name)
-                
-                # Translate subtitle file
-                translated_srt = self.translator.translate_srt_file(
-                    str(srt_path),
+        Returns:
+            bool: True if burned or skipped, False on failure
+        """
+        try:
+            # Find corresponding video clip
+            clip_name = clip_stem + ".mp4"
+            clip_path = os.path.join(self.clips_folder, clip_name)
+            
+            # Fused mode keeps no plain clips - cut from the source instead
+            window = {}
+            if not os.path.exists(clip_path) and clip_name in self.clip_times:
+                clip_path = self.source_video
+                window['start_time'], window['end_time'] = self.clip_times[clip_name]
+            
+            if not (clip_path and os.path.exists(clip_path)):
+                logger.warning(f"Video clip not found: {clip_name}")
+                return True
+            
+            burn_step = f"burn:{target_lang}"
+            burn_inputs = dict(
+                window,
+                clip=file_fingerprint(clip_path),
+                subtitle=file_fingerprint(translated_srt)
+            )
+            if self._finished(burn_step, clip_name, burn_inputs) is not None:
+                logger.info(f"  Skipping (already burned): {target_lang}/{clip_stem}")
+                return True
+            
+            output_filename = f"{clip_stem}_{target_lang}_subtitled.mp4"
+            output_path = os.path.join(translated_folder, output_filename)
+            
+            logger.info(f" Burning translated subtitles: {target_lang}/{output_filename}")
+            
+            result = self.subtitle_gen.add_subtitles_to_video(
+                clip_path,
+                translated_srt,
+                output_path,
+                font_size=config.SUBTITLE_FONT_SIZE,
+                font_color=config.SUBTITLE_FONT_COLOR,
+                bg_color=config.SUBTITLE_BG_COLOR,
+                threads=self.burn_threads,
+                **window
+            )
+            
+            if result:
+                logger.log_file_created(output_path)
+                self._record(burn_step, clip_name, output_path, burn_inputs)
+            return bool(result)
+            
+        except Exception as e:
+            logger.log_error_with_exception(f"Error burning {clip_stem} ({target_lang})", e)
+            return False
+    
+    def _translate_full_transcript(self, source_lang, target_langs):
+        """
+        Translate the whole-video transcript once into every language and write one SRT per clip
+        
+        Returns:
+            dict: Target language -> (clip stem, translated subtitle path or None) list in clip order
+        """
+        translated = {}
+        pending = {}
+        for target_lang in target_langs:
+            translated[target_lang] = {}
+            pending[target_lang] = {}
+            for clip_name in self.clip_times:
+                inputs = {'subtitle': file_fingerprint(self.subtitles.get(clip_name))}
+                done = self._finished(f"translate:{target_lang}", clip_name, inputs)
+                translated[target_lang][clip_name] = done
+                if not done:
+                    pending[target_lang][clip_name] = inputs
+            if not pending[target_lang]:
+                logger.info(f"All {len(self.clip_times)} clips already translated to {target_lang}")
+        
+        results = {}
+        pending_langs = [target_lang for target_lang in target_langs if pending[target_lang]]
+        if pending_langs:
+            logger.info(f"Translating full transcript for {len(self.clip_times)} clips")
+            
+            # Every language's sentence batches go out together
+            transcripts = self.translator.translate_transcripts(self.full_transcript, source_lang, pending_langs)
+            failed_langs = [target_lang for target_lang in pending_langs if transcripts[target_lang] is None]
+            if failed_langs:
+                logger.warning("  Transcript translation failed - translating per clip")
+                results.update(self._translate_subtitle_files(source_lang, failed_langs))
+            
+            for target_lang in pending_langs:
+                if target_lang in failed_langs:
+                    continue
+                for clip_name, inputs in pending[target_lang].items():
+                    clip_start, clip_end = self.clip_times[clip_name]
+                    translated_filename = f"{Path(clip_name).stem}_{target_lang}.srt"
+                    translated_srt = self.subtitle_gen.write_subtitles(
+                        self.subtitle_gen.slice_result(transcripts[target_lang], clip_start, clip_end),
+                        os.path.join(self.subtitles_folder, translated_filename),
+                        output_format="srt"
+                    )
+                    if translated_srt:
+                        logger.info(f" Saved translated subtitle: {translated_filename}")
+                        self._record(f"translate:{target_lang}", clip_name, translated_srt, inputs)
+                    translated[target_lang][clip_name] = translated_srt
+        
+        for target_lang in target_langs:
+            results.setdefault(target_lang, [
+                (Path(clip_name).stem, path) for clip_name, path in translated[target_lang].items()
+            ])
+        return results
+    
+    def _translate_subtitle_files(self, source_lang, target_langs):
+        """
+        Translate every clip subtitle file of this source separately
+        
+        All (file, language) pairs go to the translator as one flat list, so
+        every language shares one rate-limited worker pool.
+        
+        Returns:
+            dict: Target language -> (clip stem, translated subtitle path or None) list in clip order
+        """
+        # This source's subtitles, registered as they were written
+        subtitle_files = sorted(self.subtitles.items())
+        translated = {target_lang: [] for target_lang in target_langs}
+        
+        if not subtitle_files:
+            logger.warning("No subtitle files found to translate")
+            return translated
+        
+        # Reuse translations finished by an earlier run
+        pending = []
+        for target_lang in target_langs:
+            for clip_name, subtitle_path in subtitle_files:
+                inputs = {'subtitle': file_fingerprint(subtitle_path)}
+                done = self._finished(f"translate:{target_lang}", clip_name, inputs)
+                if done:
+                    translated[target_lang].append((Path(clip_name).stem, done))
+                else:
+                    pending.append((clip_name, subtitle_path, target_lang, inputs))
+        
+        if pending:
+            logger.info(f"Translating {len(pending)} subtitle files")
+            logger.info(f"From: {source_lang} → To: {', '.join(target_langs)}")
+            
+            # Translate every file into every language concurrently (rate-limited), results in job order
+            translated_srts = self.translator.translate_srt_jobs([
+                (
+                    subtitle_path,
                     source_lang,
-                    config.TRANSLATION_TARGET_LANG
+                    target_lang,
+                    os.path.join(self.subtitles_folder, f"{Path(clip_name).stem}_{target_lang}.srt")
                 )
-                
+                for clip_name, subtitle_path, target_lang, _ in pending
+            ])
+            
+            for (clip_name, _, target_lang, inputs), translated_srt in zip(pending, translated_srts):
                 if translated_srt:
-                    self.stats["clips_translated"] += 1
-                    
-                    # Move translated subtitle to subtitle files folder
-                    translated_filename = f"{srt_path.stem}_{config.TRANSLATION_TARGET_LANG}.srt"
-                    new_translated_path = os.path.join(
-                        config.SUBTITLE_FILES_PATH,
-                        translated_filename
+                    logger.info(f" Saved translated subtitle: {os.path.basename(translated_srt)}")
+                    self._record(f"translate:{target_lang}", clip_name, translated_srt, inputs)
+                translated[target_lang].append((Path(clip_name).stem, translated_srt))
+        else:
+            logger.info(f"All {len(subtitle_files)} subtitle files already translated")
+        
+        return {
+            target_lang: sorted(items, key=lambda item: item[0])
+            for target_lang, items in translated.items()
+        }
+    
+    def _run_streaming_pipeline(self, video_path):
+        """
+        Cut, subtitle, burn and translate clip by clip through a staged pipeline
+        
+        Each stage has its own workers (PIPELINE_*_WORKERS) and bounded queues
+        between them, so the first clip is finished while later ones are still
+        being cut, and FFmpeg work overlaps with Whisper work.
+        
+        Returns:
+            list: Paths of the clips that were cut
+        """
+        logger.log_section("PROCESSING CLIPS (STREAMING PIPELINE)")
+        logger.info(f" Output folder: {self.clips_folder}")
+        logger.info(f"  Clip duration: {config.CLIP_DURATION} seconds")
+        
+        cutter = self._track_cuts(VideoCutter(
+            input_video=video_path,
+            output_folder=self.clips_folder,
+            clip_duration=config.CLIP_DURATION,
+            workers=config.PIPELINE_CUT_WORKERS,
+            time_offset=self.source_offset
+        ))
+        created = []
+        pipeline = Pipeline("clips")
+        
+        jobs = cutter.get_clip_jobs()
+        if jobs is None:
+            # Segment mode writes every clip in one pass - cut first, stream the rest
+            items = self._cut_video(video_path)
+            created.extend(items)
+        else:
+            logger.info(f" Planned clips: {len(jobs)}")
+            items = jobs
+            self.clip_times = {}
+            
+            def cut(job):
+                clip_file = cutter.run_clip_job(job)
+                if clip_file is None:
+                    self._count("errors")
+                    return None
+                _, _, clip_start, clip_end, _, _ = job
+                self.clip_times[os.path.basename(clip_file)] = (clip_start, clip_end)
+                self._count("total_clips_created")
+                created.append(Path(clip_file))
+                return Path(clip_file)
+            
+            pipeline.add_stage("cut", cut, workers=config.PIPELINE_CUT_WORKERS)
+        
+        if config.ENABLE_SUBTITLES:
+            # The whole-video transcription runs while the first clips are cut
+            transcript_future = None
+            if config.TRANSCRIBE_FULL_VIDEO:
+                executor = ThreadPoolExecutor(max_workers=1)
+                transcript_future = executor.submit(self._transcribe_full_video, video_path)
+                executor.shutdown(wait=False)
+            
+            def subtitle(clip_path):
+                if transcript_future:
+                    self.full_transcript = transcript_future.result()
+                subtitle_path = self._subtitle_clip(clip_path, self.full_transcript)
+                return (clip_path, subtitle_path) if subtitle_path else None
+            
+            pipeline.add_stage("subtitle", subtitle, workers=config.PIPELINE_SUBTITLE_WORKERS)
+            
+            if config.BURN_SUBTITLES:
+                def burn(item):
+                    self._burn_subtitles(*item)
+                    return item
+                
+                pipeline.add_stage("burn", burn, workers=config.PIPELINE_BURN_WORKERS)
+            
+            if config.ENABLE_TRANSLATION:
+                def translate(item):
+                    self._translate_clip(*item)
+                    return item
+                
+                pipeline.add_stage("translate", translate, workers=config.PIPELINE_TRANSLATE_WORKERS)
+        
+        pipeline.run(items)
+        
+        created.sort()
+        logger.info(f" Processed {len(created)} clips")
+        return created
+    
+    def _scheduler_capacity(self):
+        """Resources the task scheduler may hand out"""
+        ram_mb = config.SCHEDULER_RAM_MB
+        if not ram_mb:
+            try:
+                # Leave a fifth of physical memory for the OS and everything else
+                total = os.sysconf('SC_PAGE_SIZE') * os.sysconf('SC_PHYS_PAGES')
+                ram_mb = int(total / (1024 * 1024) * 0.8)
+            except (AttributeError, ValueError, OSError):
+                ram_mb = 4096
+        
+        whisper_slots = config.MAX_CONCURRENT_PROCESSES if self.transcription_pool else 1
+        return {
+            'cpu': os.cpu_count() or 1,
+            'ram_mb': ram_mb,
+            'whisper': max(1, whisper_slots),
+            'disk_io': max(1, config.SCHEDULER_DISK_IO_SLOTS),
+            'network': max(1, config.TRANSLATION_MAX_IN_FLIGHT),
+        }
+    
+    def _task_costs(self):
+        """Resource cost of each kind of task"""
+        encode_threads = max(1, config.SCHEDULER_ENCODE_THREADS)
+        whisper_threads = config.WHISPER_CPU_THREADS or SCHEDULER_WHISPER_THREADS
+        if self.transcription_pool:
+            # Pool workers split the cores between them (see TranscriptionPool)
+            whisper_threads = config.WHISPER_CPU_THREADS or max(
+                1, (os.cpu_count() or 1) // max(1, config.MAX_CONCURRENT_PROCESSES)
+            )
+        
+        return {
+            'probe': {'cpu': 1, 'ram_mb': 100, 'disk_io': 1},
+            'copy': {'cpu': 1, 'ram_mb': 100, 'disk_io': 1},
+            'encode': {'cpu': encode_threads, 'ram_mb': 300 + 100 * encode_threads},
+            'whisper': {
+                'cpu': whisper_threads,
+                'ram_mb': WHISPER_RAM_MB.get(config.WHISPER_MODEL, 1500),
+                'whisper': 1,
+            },
+            'slice': {'cpu': 1, 'ram_mb': 50},
+            'translate': {'network': 1, 'ram_mb': 50},
+        }
+    
+    def _run_task_graph(self, video_path):
+        """
+        Cut, subtitle, burn and translate through the resource-aware TaskScheduler
+        
+        Graph per source: probe -> cut (per clip) -> subtitle -> burn, and
+        subtitle -> translate (per language) -> translated burn. The optional
+        whole-video transcription is a node every subtitle task waits for.
+        Clip nodes are added by the probe task once the clip grid is known.
+        
+        Returns:
+            list: Paths of the clips that were cut
+        """
+        logger.log_section("PROCESSING CLIPS (TASK SCHEDULER)")
+        capacity = self._scheduler_capacity()
+        costs = self._task_costs()
+        # Burns run with the threads their tasks reserve, like the cutter's encodes
+        self.burn_threads = costs['encode']['cpu']
+        logger.info(
+            f" Resources: {capacity['cpu']} cores, {capacity['ram_mb']} MB RAM, "
+            f"{capacity['whisper']} Whisper slot(s)"
+        )
+        
+        scheduler = TaskScheduler(capacity)
+        cutter = self._track_cuts(VideoCutter(
+            input_video=video_path,
+            output_folder=self.clips_folder,
+            clip_duration=config.CLIP_DURATION,
+            time_offset=self.source_offset,
+            encode_threads=costs['encode']['cpu']
+        ))
+        self.clip_times = {}
+        created = []
+        
+        full_task = None
+        if config.ENABLE_SUBTITLES and config.TRANSCRIBE_FULL_VIDEO:
+            def transcribe_full():
+                self.full_transcript = self._transcribe_full_video(video_path)
+            
+            full_task = scheduler.add("transcribe:full", transcribe_full, cost=costs['whisper'])
+        
+        def add_clip_tasks(clip_path, cut_task):
+            if not config.ENABLE_SUBTITLES:
+                return
+            
+            def subtitle():
+                return self._subtitle_clip(clip_path, self.full_transcript)
+            
+            def subtitle_cost():
+                # Per-clip Whisper unless the whole-video transcript is there to slice
+                return costs['slice'] if self.full_transcript else costs['whisper']
+            
+            subtitle_task = scheduler.add(
+                f"subtitle:{clip_path.stem}",
+                subtitle,
+                deps=[task for task in (cut_task, full_task) if task],
+                cost=subtitle_cost
+            )
+            
+            if config.BURN_SUBTITLES:
+                scheduler.add(
+                    f"burn:{clip_path.stem}",
+                    lambda: subtitle_task.result and self._burn_subtitles(clip_path, subtitle_task.result),
+                    deps=[subtitle_task],
+                    cost=costs['encode']
+                )
+            
+            if not config.ENABLE_TRANSLATION:
+                return
+            source_lang = self._translation_source_lang()
+            for target_lang in config.get_translation_target_langs():
+                translate_task = scheduler.add(
+                    f"translate:{clip_path.stem}:{target_lang}",
+                    lambda target_lang=target_lang: subtitle_task.result and self._translate_clip_to(
+                        clip_path, subtitle_task.result, source_lang, target_lang
+                    ),
+                    deps=[subtitle_task],
+                    cost=costs['translate']
+                )
+                if config.BURN_SUBTITLES:
+                    scheduler.add(
+                        f"burn:{clip_path.stem}:{target_lang}",
+                        lambda task=translate_task, target_lang=target_lang: task.result and self._burn_translated_clip(
+                            clip_path, task.result, target_lang
+                        ),
+                        deps=[translate_task],
+                        cost=costs['encode']
                     )
-                    
-                    # Rename the translated file
-                    if os.path.exists(translated_srt):
-                        os.rename(translated_srt, new_translated_path)
-                        logger.info(f" Saved translated subtitle: {translated_filename}")
-                    
-                    # Burn translated subtitles into video if enabled
-                    if config.BURN_SUBTITLES:
-                        # Find corresponding video clip
-                        clip_name = srt_path.stem + ".mp4"
-                        clip_path = os.path.join(config.CLIPS_PATH, clip_name)
-                        
-                        if os.path.exists(clip_path):
-                            output_filename = f"{srt_path.stem}_{config.TRANSLATION_TARGET_LANG}_subtitled.mp4"
-                            output_path = os.path.join(translated_folder, output_filename)
-                            
-                            logger.info(f" Burning translated subtitles: {output_filename}")
-                            
-                            result = self.subtitle_gen.add_subtitles_to_video(
-                                clip_path,
-                                new_translated_path,
-                                output_path,
-                                font_size=config.SUBTITLE_FONT_SIZE,
-                                font_color=config.SUBTITLE_FONT_COLOR,
-                                bg_color=config.SUBTITLE_BG_COLOR
-                            )
-                            
-                            if result:
-                                logger.log_file_created(output_path)
-                        else:
-                            logger.warning(f"Video clip not found: {clip_name}")
-                else:
-                    logger.error(f"Failed to translate: {srt_path.name}")
-                    self.stats["errors"] += 1
-                    
-            except Exception as e:
-                logger.log_error_with_exception(f"Error translating {srt_path.name}", e)
-                self.stats["errors"] += 1
         
-        logger.info(f" Translation complete: {self.stats['clips_translated']}/{len(subtitle_files)}")
-        logger.info(f" Translated clips saved in: {translated_folder}")
+        def cut_all():
+            for clip_path in self._cut_video(video_path):
+                created.append(clip_path)
+                add_clip_tasks(clip_path, None)
+        
+        def probe():
+            jobs = cutter.get_clip_jobs()
+            if jobs is None:
+                # Segment mode writes every clip in one FFmpeg pass on all cores
+                scheduler.add("cut:all", cut_all, cost=dict(costs['encode'], cpu=capacity['cpu']))
+                return
+            
+            logger.info(f" Planned clips: {len(jobs)}")
+            for job in jobs:
+                def cut(job=job):
+                    clip_file = cutter.run_clip_job(job)
+                    if clip_file is None:
+                        self._count("errors")
+                        raise RuntimeError(f"Could not cut clip {job[1]}")
+                    _, _, clip_start, clip_end, _, _ = job
+                    self.clip_times[os.path.basename(clip_file)] = (clip_start, clip_end)
+                    self._count("total_clips_created")
+                    created.append(Path(clip_file))
+                
+                cut_task = scheduler.add(
+                    f"cut:{job[1]}",
+                    cut,
+                    cost=costs['copy'] if job[5] == JOB_COPY else costs['encode']
+                )
+                add_clip_tasks(Path(job[4]), cut_task)
+        
+        scheduler.add("probe", probe, cost=costs['probe'])
+        failed = scheduler.run()
+        
+        created.sort()
+        logger.info(f" Processed {len(created)} clips ({len(failed)} tasks failed or skipped)")
+        return created
+    
+    def _translate_clip(self, clip_path, subtitle_path):
+        """Translate one clip's subtitles to every target language and burn them"""
+        source_lang = self._translation_source_lang()
+        
+        for target_lang in config.get_translation_target_langs():
+            translated_srt = self._translate_clip_to(clip_path, subtitle_path, source_lang, target_lang)
+            if translated_srt and config.BURN_SUBTITLES:
+                self._burn_translated_clip(clip_path, translated_srt, target_lang)
+    
+    def _translate_clip_to(self, clip_path, subtitle_path, source_lang, target_lang):
+        """
+        Translate one clip's subtitles to one language
+        
+        Returns:
+            str: Translated subtitle path, or None if translation failed
+        """
+        translated_filename = f"{clip_path.stem}_{target_lang}.srt"
+        translate_step = f"translate:{target_lang}"
+        translate_inputs = {'subtitle': file_fingerprint(subtitle_path)}
+        translated_srt = self._finished(translate_step, clip_path, translate_inputs)
+        if translated_srt:
+            logger.info(f"  Skipping (already translated): {translated_filename}")
+            return translated_srt
+        
+        if config.TRANSLATE_FULL_TRANSCRIPT and self.full_transcript and clip_path.name in self.clip_times:
+            # Slice the once-translated transcript
+            translated_transcript = self._get_translated_transcript(source_lang, target_lang)
+            clip_start, clip_end = self.clip_times[clip_path.name]
+            translated_srt = translated_transcript and self.subtitle_gen.write_subtitles(
+                self.subtitle_gen.slice_result(translated_transcript, clip_start, clip_end),
+                os.path.join(self.subtitles_folder, translated_filename),
+                output_format="srt"
+            )
+        else:
+            translated_srt = self.translator.translate_srt_file(
+                subtitle_path,
+                source_lang,
+                target_lang,
+                output_path=os.path.join(self.subtitles_folder, translated_filename)
+            )
+        
+        if not translated_srt:
+            logger.error(f"Failed to translate: {clip_path.stem} ({target_lang})")
+            self._count("errors")
+            return None
+        
+        self._count("clips_translated")
+        self._record(translate_step, clip_path, translated_srt, translate_inputs)
+        return translated_srt
+    
+    def _burn_translated_clip(self, clip_path, translated_srt, target_lang):
+        """Burn one clip's translated subtitles into its language folder"""
+        translated_folder = os.path.join(
+            self.translated_folder,
+            target_lang
+        )
+        Path(translated_folder).mkdir(parents=True, exist_ok=True)
+        if not self._burn_translated(clip_path.stem, translated_srt, target_lang, translated_folder):
+            self._count("errors")
+    
+    def _get_translated_transcript(self, source_lang, target_lang):
+        """
+        Translate the full transcript once (the first clip waits, later ones reuse it)
+        
+        The first request translates every target language not done yet in
+        one go, so the languages are translated at the same time.
+        """
+        with self._translation_lock:
+            if target_lang not in self._translated_transcripts:
+                target_langs = [
+                    lang for lang in config.get_translation_target_langs()
+                    if lang not in self._translated_transcripts
+                ]
+                if target_lang not in target_langs:
+                    target_langs.append(target_lang)
+                self._translated_transcripts.update(
+                    self.translator.translate_transcripts(self.full_transcript, source_lang, target_langs)
+                )
+            return self._translated_transcripts[target_lang]
+    
+    def close(self):
+        """Stop background workers"""
+        if self.transcription_pool:
+            self.transcription_pool.shutdown()
+            self.transcription_pool = None
     
     def _cleanup(self, video_path, is_youtube):
         """Cleanup temporary files"""
+        # Let the download store evict the video again, unless another
+        # batch entry of the same video still has to process it
+        store = self.downloader.store
+        if is_youtube and store and not store.release(video_path):
+            return
+        
         if is_youtube and config.DELETE_DOWNLOADED_VIDEO:
             try:
                 if os.path.exists(video_path):
@@ -707,16 +1839,151 @@ class VideoProcessor:
                 logger.log_error_with_exception("Error deleting downloaded video", e)
 
 
+class BatchProcessor:
+    """Process many videos, downloading the next ones while the current one is processed"""
+    
+    # Per-video counters taken from VideoProcessor.stats for the report
+    REPORT_COUNTERS = (
+        "total_clips_created",
+        "subtitles_generated",
+        "clips_with_subtitles",
+        "clips_translated",
+        "errors",
+    )
+    
+    def __init__(self, processor, max_downloads=None):
+        """
+        Initialize the batch processor
+        
+        Args:
+            processor (VideoProcessor): Processor used for every video
+            max_downloads (int): Downloads running at once (uses config if None)
+        """
+        self.processor = processor
+        self.max_downloads = max(1, max_downloads or config.BATCH_MAX_PARALLEL_DOWNLOADS)
+        self.results = []
+    
+    def run(self, youtube_urls=(), local_files=()):
+        """
+        Download and process every video
+        
+        Downloads run in a bounded thread pool. Each video is handed to the
+        cut/subtitle/translate stages (on this thread) as soon as its download
+        finishes, so network and CPU work overlap instead of alternating.
+        
+        Args:
+            youtube_urls (list): YouTube URLs
+            local_files (list): Local video file paths
+        
+        Returns:
+            list: One result dict per video, in the order they finished
+        """
+        jobs = [(source, False) for source in local_files] + [(url, True) for url in youtube_urls]
+        logger.log_section(f"BATCH PROCESSING: {len(jobs)} VIDEOS")
+        logger.info(f" Parallel downloads: {self.max_downloads}")
+        
+        batch_start = time.time()
+        self.results = []
+        executor = ThreadPoolExecutor(max_workers=self.max_downloads)
+        try:
+            futures = {
+                executor.submit(self._fetch, source, is_youtube): (source, is_youtube)
+                for source, is_youtube in jobs
+            }
+            for done, future in enumerate(as_completed(futures), 1):
+                source, is_youtube = futures[future]
+                sources, download_time = future.result()
+                logger.info(f" Batch video {done}/{len(jobs)} ready: {source}")
+                self.results.append(self._process(source, is_youtube, sources, download_time))
+        finally:
+            # Ctrl+C or a fatal error: don't start downloads nobody will process
+            executor.shutdown(wait=False, cancel_futures=True)
+        
+        self._report(time.time() - batch_start)
+        return self.results
+    
+    def _fetch(self, source, is_youtube):
+        """Download (or locate) one video - runs on a download thread"""
+        fetch_start = time.time()
+        try:
+            sources = self.processor.get_sources(source, is_youtube)
+        except Exception as e:
+            logger.log_error_with_exception(f"Error getting {source}", e)
+            sources = []
+        return sources, time.time() - fetch_start
+    
+    def _process(self, source, is_youtube, sources, download_time):
+        """Process one fetched video and return its result row"""
+        before = dict(self.processor.stats)
+        process_start = time.time()
+        
+        success = self.processor.process_video(source, is_youtube, sources=sources)
+        
+        result = {
+            "source": source,
+            "success": success,
+            "download_time": round(download_time, 2),
+            "processing_time": round(time.time() - process_start, 2),
+        }
+        for key in self.REPORT_COUNTERS:
+            result[key] = self.processor.stats[key] - before[key]
+        return result
+    
+    def _report(self, wall_time):
+        """Log the consolidated batch statistics and save them as JSON in the logs folder"""
+        totals = {key: sum(result[key] for result in self.results) for key in self.REPORT_COUNTERS}
+        succeeded = sum(1 for result in self.results if result["success"])
+        busy_time = sum(result["download_time"] + result["processing_time"] for result in self.results)
+        
+        logger.log_section("BATCH STATISTICS")
+        for result in self.results:
+            status = "OK" if result["success"] else "FAILED"
+            logger.info(
+                f"  [{status}] {result['source']}: {result['total_clips_created']} clips, "
+                f"{result['errors']} errors (download {result['download_time']:.1f}s, "
+                f"processing {result['processing_time']:.1f}s)"
+            )
+        logger.info(f"  Videos succeeded: {succeeded}/{len(self.results)}")
+        for key, value in totals.items():
+            logger.info(f"  {key}: {value}")
+        logger.info(f"  Wall time: {wall_time:.1f}s (download + processing: {busy_time:.1f}s)")
+        logger.log_separator()
+        
+        report_path = os.path.join(
+            config.LOGS_PATH,
+            f"batch_report_{datetime.now().strftime('%Y%m%d_%H%M%S')}.json"
+        )
+        try:
+            with open(report_path, 'w', encoding='utf-8') as f:
+                json.dump({
+                    "videos": self.results,
+                    "succeeded": succeeded,
+                    "totals": totals,
+                    "wall_time": round(wall_time, 2),
+                }, f, ensure_ascii=False, indent=2)
+            logger.info(f" Batch report: {report_path}")
+        except Exception as e:
+            logger.log_error_with_exception("Error writing batch report", e)
+
+
 def main():
     """Main entry point"""
     logger.log_section("VIDEO PROCESSING STARTED")
     logger.info(f"Timestamp: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}")
     
+    processor = None
     try:
         processor = VideoProcessor()
         
         # Determine video source
-        if config.YOUTUBE_URL:
+        if config.BATCH_YOUTUBE_URLS or config.BATCH_LOCAL_FILES:
+            logger.info(" Mode: Batch")
+            results = BatchProcessor(processor).run(
+                youtube_urls=config.BATCH_YOUTUBE_URLS,
+                local_files=config.BATCH_LOCAL_FILES
+            )
+            success = any(result["success"] for result in results)
+        elif config.YOUTUBE_URL:
             logger.info(" Mode: YouTube URL")
             success = processor.process_video(config.YOUTUBE_URL, is_youtube=True)
         elif config.LOCAL_VIDEO_PATH:
@@ -743,6 +2010,9 @@ def main():
     except Exception as e:
         logger.log_error_with_exception("Fatal error in main", e)
         raise
+    finally:
+        if processor:
+            processor.close()
 
 
 if __name__ == "__main__":
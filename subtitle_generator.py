@@ -1,44 +1,58 @@
 """
 Subtitle Generator - Integrated with config and logging
-Generates subtitles using OpenAI Whisper
+Generates subtitles using Whisper (openai-whisper or faster-whisper)
 """
 
+import hashlib
 import os
 import subprocess
+import threading
 from pathlib import Path
 import config
 from logger import get_logger
+from subtitle_io import cues_from_segments, save_cues
+from transcription_cache import TranscriptionCache
+from transcription_backends import SAMPLE_RATE, create_backend, load_audio
+from voice_activity import detect_speech, extract_speech, restore_timestamps, speech_ratio
 
 logger = get_logger()
 
-try:
-    import whisper
-    WHISPER_AVAILABLE = True
-except ImportError:
-    WHISPER_AVAILABLE = False
-    logger.warning("Whisper not installed. Subtitle generation unavailable.")
-    logger.info("Install with: pip install openai-whisper")
-
 
 class SubtitleGenerator:
-    def __init__(self, model_size=None):
+    def __init__(self, model_size=None, backend=None, cpu_threads=None, load_model=True):
         """
         Initialize subtitle generator
         
         Args:
             model_size (str): Whisper model size (uses config if None)
+            backend (str): Transcription backend name (uses config if None)
+            cpu_threads (int): CPU threads for transcription (uses config if None)
+            load_model (bool): Load the model now. Pass False when transcription
+                               runs in a TranscriptionPool and this instance only
+                               writes and burns subtitles.
         """
         self.model_size = model_size or config.WHISPER_MODEL
-        self.model = None
+        self.backend_name = backend or config.TRANSCRIPTION_BACKEND
+        self.backend = None
+        self.cache = TranscriptionCache() if config.TRANSCRIPTION_CACHE_ENABLED else None
+        # One model instance: threads decode audio in parallel but take turns on Whisper
+        self._backend_lock = threading.Lock()
+        
+        if not load_model:
+            return
         
-        if WHISPER_AVAILABLE:
-            logger.info(f"Loading Whisper model ({self.model_size})...")
-            logger.info("(First time will download the model - this may take a while)")
-            try:
-                self.model = whisper.load_model(self.model_size)
+        logger.info(f"Loading Whisper model ({self.model_size}, backend: {self.backend_name})...")
+        logger.info("(First time will download the model - this may take a while)")
+        try:
+            self.backend = create_backend(
+                self.backend_name,
+                model_size=self.model_size,
+                cpu_threads=cpu_threads
+            )
+            if self.backend:
                 logger.info("Model loaded successfully!")
-            except Exception as e:
-                logger.log_error_with_exception("Error loading Whisper model", e)
+        except Exception as e:
+            logger.log_error_with_exception("Error loading Whisper model", e)
     
     def generate_subtitles(self, video_path, output_format=None, language=None):
         """
@@ -52,8 +66,8 @@ class SubtitleGenerator:
         Returns:
             str: Path to generated subtitle file
         """
-        if not WHISPER_AVAILABLE:
-            logger.error("Whisper not available. Install with: pip install openai-whisper")
+        if self.backend is None:
+            logger.error(f"Transcription backend '{self.backend_name}' not available")
             return None
         
         if not os.path.exists(video_path):
@@ -67,26 +81,173 @@ class SubtitleGenerator:
         logger.info(f"Language: {language if language != 'auto' else 'Auto-detect'}")
         logger.info(f"Format: {output_format}")
         
+        result = self.transcribe(video_path, language=language)
+        if result is None:
+            return None
+        
+        # Generate subtitle file
+        base_path = os.path.splitext(video_path)[0]
+        subtitle_path = f"{base_path}.{output_format}"
+        
+        return self.write_subtitles(result, subtitle_path, output_format)
+    
+    def transcribe(self, media_path, language=None, word_timestamps=False):
+        """
+        Transcribe a video or audio file
+        
+        Args:
+            media_path (str): Path to video/audio file
+            language (str): Language code (uses config if None)
+            word_timestamps (bool): Also return per-word timings in each segment
+        
+        Returns:
+            dict: Whisper result ('text', 'segments', 'language'), or None if failed
+        """
+        if self.backend is None:
+            logger.error(f"Transcription backend '{self.backend_name}' not available")
+            return None
+        
+        language = language or config.SUBTITLE_LANGUAGE
+        
         try:
-            # Transcribe the video
-            transcribe_options = {}
-            if language != "auto":
-                transcribe_options['language'] = language
-            
-            result = self.model.transcribe(
-                video_path,
-                **transcribe_options,
-                verbose=False
+            # Decode once: the same samples feed the cache key and Whisper
+            audio = load_audio(media_path)
+            
+            cache_key = None
+            if self.cache:
+                cache_key = self.cache.make_key(
+                    hashlib.sha256(audio.tobytes()).hexdigest(),
+                    backend=self.backend_name,
+                    compute_type=getattr(self.backend, 'compute_type', None),
+                    model=self.model_size,
+                    language=language,
+                    word_timestamps=word_timestamps,
+                    vad=[config.VAD_MIN_SPEECH_RATIO, config.VAD_ENERGY_THRESHOLD_DB]
+                        if config.VAD_ENABLED else None
+                )
+                cached = self.cache.get(cache_key)
+                if cached is not None:
+                    logger.info("Using cached transcription (audio unchanged)")
+                    return cached
+            
+            result = self._transcribe_audio(audio, language, word_timestamps)
+            
+            if self.cache:
+                self.cache.put(cache_key, result)
+            
+            return result
+            
+        except Exception as e:
+            logger.log_error_with_exception("Error generating subtitles", e)
+            return None
+    
+    def _transcribe_audio(self, audio, language, word_timestamps):
+        """
+        Run the backend, skipping non-speech audio when VAD is enabled
+        
+        Audio with too little speech returns an empty result without calling
+        Whisper. Otherwise only the speech regions are transcribed and the
+        timestamps are mapped back onto the original timeline.
+        """
+        backend_language = None if language == "auto" else language
+        
+        if not config.VAD_ENABLED:
+            with self._backend_lock:
+                return self.backend.transcribe(
+                    audio,
+                    language=backend_language,
+                    word_timestamps=word_timestamps
+                )
+        
+        regions = detect_speech(audio, sample_rate=SAMPLE_RATE)
+        ratio = speech_ratio(regions, len(audio) / SAMPLE_RATE)
+        
+        if ratio < config.VAD_MIN_SPEECH_RATIO:
+            logger.info(f"Skipping transcription: only {ratio:.0%} speech detected")
+            return {'text': '', 'segments': [], 'language': backend_language}
+        
+        logger.debug(f"VAD: {ratio:.0%} speech in {len(regions)} regions")
+        speech_audio, mapping = extract_speech(audio, regions, sample_rate=SAMPLE_RATE)
+        with self._backend_lock:
+            result = self.backend.transcribe(
+                speech_audio,
+                language=backend_language,
+                word_timestamps=word_timestamps
             )
+        return restore_timestamps(result, mapping)
+    
+    def slice_result(self, result, start_time, end_time):
+        """
+        Cut a transcription down to one clip's time window
+        
+        Segments are split on word boundaries (when word timestamps are
+        available) and their times are shifted to be relative to start_time,
+        so a whole-video transcript can be reused for every clip.
+        
+        Args:
+            result (dict): Transcription of the full video
+            start_time (float): Clip start in seconds
+            end_time (float): Clip end in seconds
+        
+        Returns:
+            dict: Result with only the clip's segments ('text', 'segments', 'language')
+        """
+        segments = []
+        
+        for segment in result['segments']:
+            if segment['end'] <= start_time or segment['start'] >= end_time:
+                continue
             
-            # Generate subtitle file
-            base_path = os.path.splitext(video_path)[0]
-            subtitle_path = f"{base_path}.{output_format}"
+            words = segment.get('words')
+            if words:
+                # Keep the words whose midpoint falls inside the clip
+                inside = [
+                    w for w in words
+                    if start_time <= (w['start'] + w['end']) / 2 < end_time
+                ]
+                if not inside:
+                    continue
+                seg_start = max(inside[0]['start'], start_time)
+                seg_end = min(inside[-1]['end'], end_time)
+                text = ''.join(w['word'] for w in inside).strip()
+            else:
+                # No word timings - the segment belongs to the clip holding its midpoint
+                if not start_time <= (segment['start'] + segment['end']) / 2 < end_time:
+                    continue
+                seg_start = max(segment['start'], start_time)
+                seg_end = min(segment['end'], end_time)
+                text = segment['text'].strip()
             
-            if output_format == "srt":
-                self._write_srt(result, subtitle_path)
-            elif output_format == "vtt":
-                self._write_vtt(result, subtitle_path)
+            if text:
+                segments.append({
+                    'start': seg_start - start_time,
+                    'end': seg_end - start_time,
+                    'text': text,
+                })
+        
+        return {
+            'text': ' '.join(s['text'] for s in segments),
+            'segments': segments,
+            'language': result.get('language'),
+        }
+    
+    def write_subtitles(self, result, subtitle_path, output_format=None):
+        """
+        Write a transcription result to a subtitle file
+        
+        Args:
+            result (dict): Transcription result with 'segments' and 'text'
+            subtitle_path (str): Output file path
+            output_format (str): Subtitle format (uses config if None)
+        
+        Returns:
+            str: Path to subtitle file, or None if failed
+        """
+        output_format = output_format or config.SUBTITLE_FORMAT
+        
+        try:
+            if output_format in ("srt", "vtt"):
+                save_cues(cues_from_segments(result['segments']), subtitle_path, output_format)
             elif output_format == "txt":
                 self._write_txt(result, subtitle_path)
             else:
@@ -97,53 +258,24 @@ class SubtitleGenerator:
             return subtitle_path
             
         except Exception as e:
-            logger.log_error_with_exception("Error generating subtitles", e)
+            logger.log_error_with_exception("Error writing subtitles", e)
             return None
     
-    def _write_srt(self, result, output_path):
-        """Write subtitles in SRT format"""
-        with open(output_path, 'w', encoding='utf-8') as f:
-            for i, segment in enumerate(result['segments'], 1):
-                start = self._format_timestamp(segment['start'])
-                end = self._format_timestamp(segment['end'])
-                text = segment['text'].strip()
-                
-                f.write(f"{i}\n")
-                f.write(f"{start} --> {end}\n")
-                f.write(f"{text}\n\n")
-    
-    def _write_vtt(self, result, output_path):
-        """Write subtitles in WebVTT format"""
-        with open(output_path, 'w', encoding='utf-8') as f:
-            f.write("WEBVTT\n\n")
-            
-            for i, segment in enumerate(result['segments'], 1):
-                start = self._format_timestamp(segment['start'])
-                end = self._format_timestamp(segment['end'])
-                text = segment['text'].strip()
-                
-                f.write(f"{start} --> {end}\n")
-                f.write(f"{text}\n\n")
-    
     def _write_txt(self, result, output_path):
         """Write plain text transcript"""
         with open(output_path, 'w', encoding='utf-8') as f:
             f.write(result['text'].strip())
     
-    def _format_timestamp(self, seconds):
-        """Format seconds to SRT timestamp (HH:MM:SS,mmm)"""
-        hours = int(seconds // 3600)
-        minutes = int((seconds % 3600) // 60)
-        secs = int(seconds % 60)
-        millis = int((seconds % 1) * 1000)
-        
-        return f"{hours:02d}:{minutes:02d}:{secs:02d},{millis:03d}"
-    
     def add_subtitles_to_video(self, video_path, subtitle_path, output_path=None,
-                               font_size=None, font_color=None, bg_color=None):
+                               font_size=None, font_color=None, bg_color=None,
+                               start_time=None, end_time=None, threads=None):
         """
         Burn subtitles into video (hardcoded/permanent)
         
+        When start_time/end_time are given, only that window of the input is
+        used, so a clip can be cut from the source and subtitled in a single
+        encode. The subtitle times must then be relative to start_time.
+        
         Args:
             video_path (str): Input video path
             subtitle_path (str): Subtitle file path (.srt)
@@ -151,6 +283,9 @@ class SubtitleGenerator:
             font_size (int): Font size (uses config if None)
             font_color (str): Font color (uses config if None)
             bg_color (str): Background color (uses config if None)
+            start_time (float): Start of the window to cut from the input (optional)
+            end_time (float): End of the window to cut from the input (optional)
+            threads (int): FFmpeg encoder threads (None = FFmpeg default, all cores)
         
         Returns:
             str: Path to output video with burned subtitles
@@ -199,15 +334,39 @@ class SubtitleGenerator:
             
             style_string = ','.join(style_parts)
             
+            subtitle_filter = f"subtitles={subtitle_path_escaped}:force_style='{style_string}'"
+            
             # FFmpeg command to burn subtitles
-            cmd = [
-                'ffmpeg',
-                '-i', video_path,
-                '-vf', f"subtitles={subtitle_path_escaped}:force_style='{style_string}'",
-                '-c:a', 'copy',  # Copy audio without re-encoding
-                '-y',  # Overwrite output
-                output_path
-            ]
+            if start_time is None:
+                cmd = [
+                    'ffmpeg',
+                    '-i', video_path,
+                    '-vf', subtitle_filter,
+                    '-c:a', 'copy',  # Copy audio without re-encoding
+                    '-y',  # Overwrite output
+                    output_path
+                ]
+            else:
+                # Cut + burn in one pass, encoded with the clip settings
+                duration = (end_time - start_time) if end_time is not None else config.CLIP_DURATION
+                cmd = [
+                    'ffmpeg',
+                    '-ss', str(start_time),
+                    '-t', str(duration),
+                    '-i', video_path,
+                    '-vf', subtitle_filter,
+                    '-c:v', config.VIDEO_CODEC,
+                    '-b:v', config.VIDEO_BITRATE,
+                    '-preset', config.ENCODING_PRESET,
+                    '-c:a', config.AUDIO_CODEC,
+                    '-b:a', config.AUDIO_BITRATE,
+                    '-y',  # Overwrite output
+                    output_path
+                ]
+            
+            if threads:
+                # Set on the output so the encoder stays within its reserved cores
+                cmd[-1:-1] = ['-threads', str(threads)]
             
             subprocess.run(cmd, check=True, capture_output=True)
             logger.info(f"Video with subtitles created: {output_path}")
@@ -0,0 +1,228 @@
+"""
+Subtitle I/O - Shared SRT/WebVTT reading and writing
+Cues keep integer millisecond times, so shifting and slicing are plain arithmetic
+"""
+
+import heapq
+import re
+
+# "00:01:02,345 --> 00:01:04,000" (SRT) or "01:02.345 --> 01:04.000 align:start" (VTT)
+TIMING_LINE = re.compile(
+    r'^\s*((?:\d+:)?\d{1,2}:\d{2}[,.]\d{1,3})\s*-->\s*((?:\d+:)?\d{1,2}:\d{2}[,.]\d{1,3})'
+)
+
+# WebVTT blocks that are not cues
+VTT_SKIPPED_BLOCKS = ('NOTE', 'STYLE', 'REGION')
+
+
+class Cue:
+    """One subtitle cue: start/end in milliseconds and its (possibly multi-line) text"""
+    
+    __slots__ = ('start', 'end', 'text')
+    
+    def __init__(self, start, end, text):
+        self.start = start
+        self.end = end
+        self.text = text
+    
+    def __repr__(self):
+        return f"Cue({self.start}, {self.end}, {self.text!r})"
+    
+    def __eq__(self, other):
+        if not isinstance(other, Cue):
+            return NotImplemented
+        return (self.start, self.end, self.text) == (other.start, other.end, other.text)
+    
+    @property
+    def duration(self):
+        return self.end - self.start
+    
+    def shifted(self, offset):
+        """Return a copy moved by offset milliseconds"""
+        return Cue(self.start + offset, self.end + offset, self.text)
+
+
+def seconds_to_ms(seconds):
+    """Convert seconds (float) to integer milliseconds"""
+    return int(round(seconds * 1000))
+
+
+def parse_timestamp(value):
+    """
+    Parse an SRT/VTT timestamp into milliseconds
+    
+    Accepts "HH:MM:SS,mmm", "HH:MM:SS.mmm" and the short VTT form "MM:SS.mmm".
+    Hours may have more than two digits.
+    """
+    clock, millis = re.split(r'[,.]', value.strip())
+    parts = [int(part) for part in clock.split(':')]
+    if len(parts) == 2:
+        parts.insert(0, 0)
+    hours, minutes, seconds = parts
+    return ((hours * 60 + minutes) * 60 + seconds) * 1000 + int(millis.ljust(3, '0'))
+
+
+def format_timestamp(ms, separator=','):
+    """Format milliseconds as HH:MM:SS,mmm (separator '.' for WebVTT)"""
+    ms = max(0, int(ms))
+    seconds, millis = divmod(ms, 1000)
+    minutes, seconds = divmod(seconds, 60)
+    hours, minutes = divmod(minutes, 60)
+    return f"{hours:02d}:{minutes:02d}:{seconds:02d}{separator}{millis:03d}"
+
+
+def iter_cues(lines):
+    """
+    Parse SRT or WebVTT cues incrementally
+    
+    Cues are yielded as soon as the next timing line (or the end of input) is
+    reached, so large files are never held in memory. Works with CRLF line
+    endings, a UTF-8 BOM, missing or extra blank lines and blank lines inside
+    cue text (which are dropped, as they would end the cue when written back).
+    
+    Args:
+        lines: File object or any iterable of text lines
+    
+    Yields:
+        Cue: Parsed cues in file order
+    """
+    is_vtt = False
+    first_line = True
+    start = end = None
+    text_lines = []
+    after_blank = True
+    skipping = False
+    
+    for line in lines:
+        line = line.rstrip('\r\n')
+        if first_line:
+            line = line.lstrip('\ufeff')
+            first_line = False
+            if line.startswith('WEBVTT'):
+                is_vtt = True
+                skipping = True  # Header block runs until the first blank line
+                continue
+        
+        stripped = line.strip()
+        if not stripped:
+            after_blank = True
+            skipping = False
+            if text_lines and text_lines[-1] is not None:
+                text_lines.append(None)  # Remember the blank for identifier detection
+            continue
+        if skipping:
+            continue
+        if is_vtt and after_blank and stripped.startswith(VTT_SKIPPED_BLOCKS):
+            skipping = True
+            continue
+        
+        match = TIMING_LINE.match(line)
+        if match:
+            if start is not None:
+                yield _finish_cue(start, end, text_lines, is_vtt)
+            start = parse_timestamp(match.group(1))
+            end = parse_timestamp(match.group(2))
+            text_lines = []
+        elif start is not None:
+            text_lines.append(stripped)
+        after_blank = False
+    
+    if start is not None:
+        yield _finish_cue(start, end, text_lines, is_vtt, last=True)
+
+
+def _finish_cue(start, end, text_lines, is_vtt, last=False):
+    """Build a cue, dropping the next cue's index/identifier from the end of its text"""
+    while text_lines and text_lines[-1] is None:
+        text_lines.pop()
+    
+    if not last and text_lines:
+        # The line right before a timing line is the next cue's number (SRT)
+        # or identifier (VTT, only when it follows a blank line)
+        if text_lines[-1].isdigit():
+            text_lines.pop()
+        elif is_vtt and len(text_lines) >= 2 and text_lines[-2] is None:
+            text_lines.pop()
+    
+    text = '\n'.join(line for line in text_lines if line is not None)
+    return Cue(start, end, text)
+
+
+def read_cues(path):
+    """Read every cue from an SRT/VTT file"""
+    with open(path, 'r', encoding='utf-8-sig') as f:
+        return list(iter_cues(f))
+
+
+def write_srt(cues, f):
+    """Write cues to a text file object in SRT format (numbered from 1)"""
+    for i, cue in enumerate(cues, 1):
+        f.write(f"{i}\n")
+        f.write(f"{format_timestamp(cue.start)} --> {format_timestamp(cue.end)}\n")
+        f.write(f"{cue.text.strip()}\n\n")
+
+
+def write_vtt(cues, f):
+    """Write cues to a text file object in WebVTT format"""
+    f.write("WEBVTT\n\n")
+    for cue in cues:
+        f.write(f"{format_timestamp(cue.start, '.')} --> {format_timestamp(cue.end, '.')}\n")
+        f.write(f"{cue.text.strip()}\n\n")
+
+
+def save_cues(cues, path, output_format="srt"):
+    """
+    Write cues to a subtitle file
+    
+    Args:
+        cues: Iterable of Cue objects
+        path (str): Output file path
+        output_format (str): 'srt' or 'vtt'
+    
+    Returns:
+        str: path
+    """
+    writers = {'srt': write_srt, 'vtt': write_vtt}
+    if output_format not in writers:
+        raise ValueError(f"Unsupported subtitle format: {output_format}")
+    
+    with open(path, 'w', encoding='utf-8') as f:
+        writers[output_format](cues, f)
+    return path
+
+
+def cues_from_segments(segments):
+    """Turn transcription segments ('start'/'end' in seconds, 'text') into cues"""
+    return [
+        Cue(seconds_to_ms(segment['start']), seconds_to_ms(segment['end']), segment['text'].strip())
+        for segment in segments
+    ]
+
+
+def shift_cues(cues, offset):
+    """Move every cue by offset milliseconds"""
+    return [cue.shifted(offset) for cue in cues]
+
+
+def slice_cues(cues, start, end):
+    """
+    Keep the cues overlapping start-end (ms), clipped and made relative to start
+    
+    Args:
+        cues: Iterable of Cue objects
+        start (int): Window start in milliseconds
+        end (int): Window end in milliseconds
+    
+    Returns:
+        list: Cues inside the window, timed from 0
+    """
+    return [
+        Cue(max(cue.start, start) - start, min(cue.end, end) - start, cue.text)
+        for cue in cues
+        if cue.end > start and cue.start < end
+    ]
+
+
+def merge_cues(*cue_lists):
+    """Merge several time-ordered cue lists into one, ordered by start time"""
+    return list(heapq.merge(*cue_lists, key=lambda cue: (cue.start, cue.end)))
@@ -0,0 +1,218 @@
+"""
+Transcription Backends - Integrated with config and logging
+Speech-to-text engines used by SubtitleGenerator
+"""
+
+import subprocess
+import config
+from logger import get_logger
+
+logger = get_logger()
+
+# Whisper models expect 16 kHz mono audio
+SAMPLE_RATE = 16000
+
+try:
+    import numpy as np
+    NUMPY_AVAILABLE = True
+except ImportError:
+    NUMPY_AVAILABLE = False
+
+try:
+    import whisper
+    WHISPER_AVAILABLE = True
+except ImportError:
+    WHISPER_AVAILABLE = False
+
+try:
+    from faster_whisper import WhisperModel
+    FASTER_WHISPER_AVAILABLE = True
+except ImportError:
+    FASTER_WHISPER_AVAILABLE = False
+
+
+def load_audio(media_path, sample_rate=SAMPLE_RATE):
+    """
+    Decode the audio track of any media file with FFmpeg
+    
+    Args:
+        media_path (str): Path to video/audio file
+        sample_rate (int): Output sample rate
+    
+    Returns:
+        numpy.ndarray: Mono float32 samples in [-1, 1]
+    """
+    cmd = [
+        'ffmpeg',
+        '-nostdin',
+        '-threads', '0',
+        '-i', media_path,
+        '-f', 's16le',
+        '-ac', '1',
+        '-acodec', 'pcm_s16le',
+        '-ar', str(sample_rate),
+        '-'
+    ]
+    
+    try:
+        output = subprocess.run(cmd, capture_output=True, check=True).stdout
+    except subprocess.CalledProcessError as e:
+        raise RuntimeError(f"Failed to load audio: {e.stderr.decode()}") from e
+    
+    return np.frombuffer(output, np.int16).astype(np.float32) / 32768.0
+
+
+class OpenAIWhisperBackend:
+    """openai-whisper running PyTorch (fp32 on CPU)"""
+    
+    name = "openai-whisper"
+    
+    def __init__(self, model_size, cpu_threads=0):
+        """
+        Load the model
+        
+        Args:
+            model_size (str): Whisper model size
+            cpu_threads (int): Torch intra-op threads (0 = library default)
+        """
+        if cpu_threads:
+            import torch
+            torch.set_num_threads(cpu_threads)
+        
+        self.model = whisper.load_model(model_size)
+    
+    def transcribe(self, audio, language=None, word_timestamps=False):
+        """
+        Transcribe audio samples
+        
+        Args:
+            audio (numpy.ndarray): 16 kHz mono float32 samples
+            language (str): Language code (None = auto-detect)
+            word_timestamps (bool): Include per-word timings
+        
+        Returns:
+            dict: 'text', 'segments' and 'language'
+        """
+        options = {}
+        if language:
+            options['language'] = language
+        if word_timestamps:
+            options['word_timestamps'] = True
+        
+        result = self.model.transcribe(audio, verbose=False, **options)
+        
+        return {
+            'text': result['text'],
+            'segments': result['segments'],
+            'language': result.get('language'),
+        }
+
+
+class FasterWhisperBackend:
+    """faster-whisper running CTranslate2 (int8 / int8_float32 on CPU)"""
+    
+    name = "faster-whisper"
+    
+    def __init__(self, model_size, compute_type="int8", cpu_threads=0):
+        """
+        Load the model
+        
+        Args:
+            model_size (str): Whisper model size
+            compute_type (str): CTranslate2 compute type ('int8', 'int8_float32', 'float32')
+            cpu_threads (int): CTranslate2 threads (0 = library default)
+        """
+        self.compute_type = compute_type
+        self.model = WhisperModel(
+            model_size,
+            device="cpu",
+            compute_type=compute_type,
+            cpu_threads=cpu_threads
+        )
+    
+    def transcribe(self, audio, language=None, word_timestamps=False):
+        """
+        Transcribe audio samples
+        
+        Args:
+            audio (numpy.ndarray): 16 kHz mono float32 samples
+            language (str): Language code (None = auto-detect)
+            word_timestamps (bool): Include per-word timings
+        
+        Returns:
+            dict: 'text', 'segments' and 'language', in openai-whisper's format
+        """
+        segments, info = self.model.transcribe(
+            audio,
+            language=language,
+            word_timestamps=word_timestamps
+        )
+        
+        # faster-whisper yields segments lazily; decoding happens here
+        converted = []
+        for segment in segments:
+            item = {
+                'id': segment.id,
+                'start': segment.start,
+                'end': segment.end,
+                'text': segment.text,
+                'avg_logprob': segment.avg_logprob,
+                'no_speech_prob': segment.no_speech_prob,
+            }
+            if word_timestamps and segment.words:
+                item['words'] = [
+                    {
+                        'word': word.word,
+                        'start': word.start,
+                        'end': word.end,
+                        'probability': word.probability,
+                    }
+                    for word in segment.words
+                ]
+            converted.append(item)
+        
+        return {
+            'text': ''.join(s['text'] for s in converted),
+            'segments': converted,
+            'language': info.language,
+        }
+
+
+def create_backend(name=None, model_size=None, compute_type=None, cpu_threads=None):
+    """
+    Create a transcription backend
+    
+    Args:
+        name (str): 'openai-whisper' or 'faster-whisper' (uses config if None)
+        model_size (str): Whisper model size (uses config if None)
+        compute_type (str): faster-whisper compute type (uses config if None)
+        cpu_threads (int): CPU threads for inference (uses config if None)
+    
+    Returns:
+        Backend instance, or None if the backend is unavailable
+    """
+    name = name or config.TRANSCRIPTION_BACKEND
+    model_size = model_size or config.WHISPER_MODEL
+    compute_type = compute_type or config.WHISPER_COMPUTE_TYPE
+    cpu_threads = config.WHISPER_CPU_THREADS if cpu_threads is None else cpu_threads
+    
+    if not NUMPY_AVAILABLE:
+        logger.error("NumPy not installed. Subtitle generation unavailable.")
+        return None
+    
+    if name == OpenAIWhisperBackend.name:
+        if not WHISPER_AVAILABLE:
+            logger.warning("Whisper not installed. Subtitle generation unavailable.")
+            logger.info("Install with: pip install openai-whisper")
+            return None
+        return OpenAIWhisperBackend(model_size, cpu_threads=cpu_threads)
+    
+    if name == FasterWhisperBackend.name:
+        if not FASTER_WHISPER_AVAILABLE:
+            logger.warning("faster-whisper not installed. Subtitle generation unavailable.")
+            logger.info("Install with: pip install faster-whisper")
+            return None
+        return FasterWhisperBackend(model_size, compute_type=compute_type, cpu_threads=cpu_threads)
+    
+    logger.error(f"Unknown transcription backend: {name}")
+    return None
@@ -0,0 +1,126 @@
+"""
+Transcription Cache - Integrated with config and logging
+Stores raw Whisper results on disk so unchanged audio is never transcribed twice
+"""
+
+import hashlib
+import json
+import os
+from pathlib import Path
+import config
+from logger import get_logger
+
+logger = get_logger()
+
+
+class TranscriptionCache:
+    """Size-bounded LRU cache of transcription results, one JSON file per entry"""
+    
+    def __init__(self, cache_folder=None, max_size_mb=None):
+        """
+        Initialize the transcription cache
+        
+        Args:
+            cache_folder (str): Folder for cache entries (uses config if None)
+            max_size_mb (int): Maximum total cache size in MB (uses config if None)
+        """
+        self.cache_folder = cache_folder or os.path.join(config.CACHE_PATH, "transcriptions")
+        self.max_size_mb = max_size_mb or config.TRANSCRIPTION_CACHE_MAX_MB
+        
+        Path(self.cache_folder).mkdir(parents=True, exist_ok=True)
+        logger.debug(f"Transcription cache folder: {self.cache_folder}")
+    
+    def make_key(self, audio_hash, **options):
+        """
+        Build a cache key
+        
+        Args:
+            audio_hash (str): Hash of the decoded audio (or of the file bytes)
+            **options: Everything else that changes the result (model, language, ...)
+        
+        Returns:
+            str: Hex digest identifying the cache entry
+        """
+        key_data = json.dumps({'audio': audio_hash, **options}, sort_keys=True)
+        return hashlib.sha256(key_data.encode('utf-8')).hexdigest()
+    
+    def get(self, key):
+        """
+        Look up a cached result
+        
+        Returns:
+            dict: Cached result ('text', 'segments', 'language'), or None on a miss
+        """
+        entry_path = self._entry_path(key)
+        
+        try:
+            with open(entry_path, 'r', encoding='utf-8') as f:
+                result = json.load(f)
+        except FileNotFoundError:
+            return None
+        except Exception as e:
+            logger.warning(f"Ignoring unreadable cache entry {key[:12]}: {e}")
+            return None
+        
+        # Mark as recently used
+        try:
+            os.utime(entry_path)
+        except OSError:
+            pass
+        
+        logger.debug(f"Transcription cache hit: {key[:12]}")
+        return result
+    
+    def put(self, key, result):
+        """Store a result and evict old entries if the cache is over its size limit"""
+        entry = {
+            'text': result.get('text', ''),
+            'segments': result.get('segments', []),
+            'language': result.get('language'),
+        }
+        entry_path = self._entry_path(key)
+        temp_path = f"{entry_path}.{os.getpid()}.tmp"
+        
+        try:
+            with open(temp_path, 'w', encoding='utf-8') as f:
+                # default=float handles NumPy scalars in Whisper segments
+                json.dump(entry, f, ensure_ascii=False, default=float)
+            os.replace(temp_path, entry_path)
+            logger.debug(f"Transcription cached: {key[:12]}")
+        except Exception as e:
+            logger.log_error_with_exception("Error writing transcription cache", e)
+            if os.path.exists(temp_path):
+                os.remove(temp_path)
+            return
+        
+        self._evict()
+    
+    def _entry_path(self, key):
+        """Path of the JSON file for a cache key"""
+        return os.path.join(self.cache_folder, f"{key}.json")
+    
+    def _evict(self):
+        """Delete least recently used entries until the cache fits max_size_mb"""
+        max_bytes = self.max_size_mb * 1024 * 1024
+        
+        entries = []
+        for entry_path in Path(self.cache_folder).glob("*.json"):
+            try:
+                stat = entry_path.stat()
+            except OSError:
+                continue
+            entries.append((stat.st_mtime, stat.st_size, entry_path))
+        
+        total_bytes = sum(size for _, size, _ in entries)
+        if total_bytes <= max_bytes:
+            return
+        
+        for _, size, entry_path in sorted(entries):
+            try:
+                entry_path.unlink()
+            except OSError:
+                continue
+            total_bytes -= size
+            logger.debug(f"Evicted transcription cache entry: {entry_path.name}")
+            if total_bytes <= max_bytes:
+                break
@@ -0,0 +1,108 @@
+"""
+Transcription Pool - Integrated with config and logging
+Runs transcription in worker processes that each load the model once
+"""
+
+import os
+from concurrent.futures import ProcessPoolExecutor
+import config
+from logger import get_logger
+
+logger = get_logger()
+
+# SubtitleGenerator owned by the current worker process (set by _init_worker)
+_worker_generator = None
+
+
+def _init_worker(model_size, backend, cpu_threads):
+    """Load the model once when a worker process starts"""
+    global _worker_generator
+    from subtitle_generator import SubtitleGenerator
+    
+    logger.info(f"Transcription worker {os.getpid()} starting ({cpu_threads} threads)")
+    _worker_generator = SubtitleGenerator(
+        model_size=model_size,
+        backend=backend,
+        cpu_threads=cpu_threads
+    )
+
+
+def _transcribe_job(media_path, language, word_timestamps):
+    """Transcribe one file inside a worker process"""
+    return _worker_generator.transcribe(
+        media_path,
+        language=language,
+        word_timestamps=word_timestamps
+    )
+
+
+class TranscriptionPool:
+    """Pool of worker processes, each holding its own loaded Whisper model"""
+    
+    def __init__(self, workers=None, model_size=None, backend=None):
+        """
+        Initialize the pool (worker processes start on the first job)
+        
+        Args:
+            workers (int): Number of worker processes (uses MAX_CONCURRENT_PROCESSES if None)
+            model_size (str): Whisper model size (uses config if None)
+            backend (str): Transcription backend name (uses config if None)
+        """
+        self.workers = max(1, workers or config.MAX_CONCURRENT_PROCESSES)
+        
+        # Split the cores between workers so they don't oversubscribe the CPU
+        self.threads_per_worker = (
+            config.WHISPER_CPU_THREADS or max(1, (os.cpu_count() or 1) // self.workers)
+        )
+        
+        self.executor = ProcessPoolExecutor(
+            max_workers=self.workers,
+            initializer=_init_worker,
+            initargs=(
+                model_size or config.WHISPER_MODEL,
+                backend or config.TRANSCRIPTION_BACKEND,
+                self.threads_per_worker,
+            )
+        )
+        logger.info(
+            f"Transcription pool: {self.workers} workers x {self.threads_per_worker} threads"
+        )
+    
+    def submit(self, media_path, language=None, word_timestamps=False):
+        """
+        Queue a file for transcription
+        
+        Args:
+            media_path (str): Path to video/audio file
+            language (str): Language code (uses config if None)
+            word_timestamps (bool): Also return per-word timings
+        
+        Returns:
+            Future: Resolves to the transcription result dict (or None if failed)
+        """
+        return self.executor.submit(
+            _transcribe_job,
+            str(media_path),
+            language or config.SUBTITLE_LANGUAGE,
+            word_timestamps
+        )
+    
+    def map(self, media_paths, language=None):
+        """
+        Transcribe several files
+        
+        Returns:
+            list: Transcription results in the same order as media_paths
+        """
+        futures = [self.submit(path, language) for path in media_paths]
+        return [future.result() for future in futures]
+    
+    def shutdown(self):
+        """Stop the worker processes"""
+        self.executor.shutdown(wait=True)
+    
+    def __enter__(self):
+        return self
+    
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.shutdown()
@@ -0,0 +1,105 @@
+"""
+Translation Engine - Integrated with config and logging
+Runs translation requests concurrently with a global rate limit and retries
+"""
+
+import random
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+import config
+from logger import get_logger
+
+logger = get_logger()
+
+
+class TokenBucket:
+    """Thread-safe token bucket: allows `rate` requests per second on average"""
+    
+    def __init__(self, rate, capacity=None):
+        """
+        Args:
+            rate (float): Tokens added per second
+            capacity (float): Maximum burst size (defaults to one second's worth)
+        """
+        self.rate = rate
+        self.capacity = capacity or max(1.0, rate)
+        self.tokens = self.capacity
+        self.updated = time.monotonic()
+        self._lock = threading.Lock()
+    
+    def acquire(self):
+        """Block until a token is available, then take it"""
+        while True:
+            with self._lock:
+                now = time.monotonic()
+                self.tokens = min(self.capacity, self.tokens + (now - self.updated) * self.rate)
+                self.updated = now
+                
+                if self.tokens >= 1:
+                    self.tokens -= 1
+                    return
+                
+                wait = (1 - self.tokens) / self.rate
+            time.sleep(wait)
+
+
+class TranslationEngine:
+    """Bounded, rate-limited, retrying executor for translation requests"""
+    
+    def __init__(self, max_in_flight=None, requests_per_second=None, max_retries=None,
+                 backoff_seconds=1.0):
+        """
+        Args:
+            max_in_flight (int): Maximum requests running at once (uses config if None)
+            requests_per_second (float): Global request rate, 0 = unlimited (uses config if None)
+            max_retries (int): Retries per failed request (uses config if None)
+            backoff_seconds (float): Base delay for exponential backoff
+        """
+        self.max_in_flight = max(1, max_in_flight or config.TRANSLATION_MAX_IN_FLIGHT)
+        rate = (config.TRANSLATION_REQUESTS_PER_SECOND
+                if requests_per_second is None else requests_per_second)
+        self.max_retries = config.TRANSLATION_MAX_RETRIES if max_retries is None else max_retries
+        self.backoff_seconds = backoff_seconds
+        
+        self.bucket = TokenBucket(rate) if rate else None
+        self._slots = threading.BoundedSemaphore(self.max_in_flight)
+    
+    def call(self, fn, *args, **kwargs):
+        """
+        Run one request under the rate limit and in-flight bound
+        
+        Failed requests are retried with exponential backoff and random
+        jitter, so parallel workers hitting the same error don't retry in
+        lockstep. The last error is raised once retries run out.
+        """
+        for attempt in range(self.max_retries + 1):
+            if self.bucket:
+                self.bucket.acquire()
+            
+            with self._slots:
+                try:
+                    return fn(*args, **kwargs)
+                except Exception as e:
+                    error = e
+            
+            if attempt < self.max_retries:
+                delay = self.backoff_seconds * (2 ** attempt) * random.uniform(0.5, 1.5)
+                logger.debug(f"Translation request failed ({error}), retrying in {delay:.1f}s")
+                time.sleep(delay)
+        
+        raise error
+    
+    def map(self, fn, items):
+        """
+        Apply fn to every item concurrently
+        
+        Returns:
+            list: Results in the same order as items
+        """
+        items = list(items)
+        if len(items) <= 1 or self.max_in_flight == 1:
+            return [fn(item) for item in items]
+        
+        with ThreadPoolExecutor(max_workers=min(self.max_in_flight, len(items))) as pool:
+            return list(pool.map(fn, items))
@@ -0,0 +1,142 @@
+"""
+Translation Memory - Integrated with config and logging
+Local SQLite store of previous translations, so repeated lines are never re-sent
+"""
+
+import os
+import sqlite3
+import threading
+import time
+import config
+from logger import get_logger
+
+logger = get_logger()
+
+
+class TranslationMemory:
+    """Size-capped store of translations keyed by (source, target, normalized text)"""
+    
+    def __init__(self, db_path=None, max_entries=None):
+        """
+        Open (or create) the translation memory
+        
+        Args:
+            db_path (str): SQLite database file (uses config if None)
+            max_entries (int): Maximum stored translations (uses config if None)
+        """
+        self.db_path = db_path or os.path.join(config.CACHE_PATH, "translation_memory.sqlite3")
+        self.max_entries = max_entries or config.TRANSLATION_MEMORY_MAX_ENTRIES
+        self._lock = threading.Lock()
+        
+        self.connection = sqlite3.connect(self.db_path, check_same_thread=False)
+        with self._lock, self.connection:
+            self.connection.execute(
+                "CREATE TABLE IF NOT EXISTS translations ("
+                " source_lang TEXT NOT NULL,"
+                " target_lang TEXT NOT NULL,"
+                " source_text TEXT NOT NULL,"
+                " translated_text TEXT NOT NULL,"
+                " last_used REAL NOT NULL,"
+                " PRIMARY KEY (source_lang, target_lang, source_text))"
+            )
+            self.connection.execute(
+                "CREATE INDEX IF NOT EXISTS idx_translations_last_used"
+                " ON translations (last_used)"
+            )
+        logger.debug(f"Translation memory: {self.db_path}")
+    
+    @staticmethod
+    def normalize(text):
+        """Normalize text for lookups (collapse whitespace)"""
+        return ' '.join(text.split())
+    
+    def get_many(self, source_lang, target_lang, texts):
+        """
+        Look up several texts at once
+        
+        Args:
+            source_lang (str): Source language code
+            target_lang (str): Target language code
+            texts (list): Texts to look up (normalized internally)
+        
+        Returns:
+            dict: Normalized text -> stored translation, for every hit
+        """
+        keys = list({self.normalize(text) for text in texts if text})
+        found = {}
+        
+        with self._lock, self.connection:
+            # Stay well below SQLite's host-parameter limit
+            for chunk_start in range(0, len(keys), 500):
+                chunk = keys[chunk_start:chunk_start + 500]
+                placeholders = ','.join('?' * len(chunk))
+                rows = self.connection.execute(
+                    "SELECT source_text, translated_text FROM translations"
+                    " WHERE source_lang = ? AND target_lang = ?"
+                    f" AND source_text IN ({placeholders})",
+                    [source_lang, target_lang, *chunk]
+                ).fetchall()
+                found.update(rows)
+            
+            if found:
+                # Mark as recently used
+                now = time.time()
+                self.connection.executemany(
+                    "UPDATE translations SET last_used = ?"
+                    " WHERE source_lang = ? AND target_lang = ? AND source_text = ?",
+                    [(now, source_lang, target_lang, key) for key in found]
+                )
+        
+        return found
+    
+    def get(self, source_lang, target_lang, text):
+        """Look up one text; returns the stored translation or None"""
+        return self.get_many(source_lang, target_lang, [text]).get(self.normalize(text))
+    
+    def put_many(self, source_lang, target_lang, translations):
+        """
+        Store translations and evict the least recently used over the cap
+        
+        Args:
+            source_lang (str): Source language code
+            target_lang (str): Target language code
+            translations (dict): Source text -> translated text
+        """
+        now = time.time()
+        rows = [
+            (source_lang, target_lang, self.normalize(text), translated, now)
+            for text, translated in translations.items()
+            if text and translated
+        ]
+        if not rows:
+            return
+        
+        with self._lock, self.connection:
+            self.connection.executemany(
+                "INSERT OR REPLACE INTO translations"
+                " (source_lang, target_lang, source_text, translated_text, last_used)"
+                " VALUES (?, ?, ?, ?, ?)",
+                rows
+            )
+            self._evict()
+    
+    def put(self, source_lang, target_lang, text, translated):
+        """Store one translation"""
+        self.put_many(source_lang, target_lang, {text: translated})
+    
+    def _evict(self):
+        """Delete the least recently used rows above max_entries (caller holds the lock)"""
+        count = self.connection.execute("SELECT COUNT(*) FROM translations").fetchone()[0]
+        excess = count - self.max_entries
+        if excess > 0:
+            self.connection.execute(
+                "DELETE FROM translations WHERE rowid IN ("
+                " SELECT rowid FROM translations ORDER BY last_used LIMIT ?)",
+                (excess,)
+            )
+            logger.debug(f"Evicted {excess} entries from translation memory")
+    
+    def close(self):
+        """Close the database"""
+        with self._lock:
+            self.connection.close()
@@ -6,33 +6,49 @@ Uses deep-translator (100% FREE, no API keys needed!)
 
 import os
 import re
+import threading
 from pathlib import Path
 import config
 from logger import get_logger
+from subtitle_io import Cue, iter_cues, save_cues
+from translation_engine import TranslationEngine
+from translation_memory import TranslationMemory
 
 logger = get_logger()
 
 try:
-    from deep_translator import GoogleTranslator
+    from deep_translator import GoogleTranslator, LibreTranslator
     TRANSLATOR_AVAILABLE = True
 except ImportError:
     TRANSLATOR_AVAILABLE = False
     logger.warning("deep-translator not installed. Translation unavailable.")
     logger.info("Install with: pip install deep-translator")
 
+# A transcript sentence ends at closing punctuation (optionally followed by quotes/brackets)
+SENTENCE_END = re.compile(r'[.!?…。！？]["\'”’)\]]*$')
+
+# Sentences are also closed at long pauses and after this many segments, so
+# unpunctuated transcripts don't turn into one huge request
+SENTENCE_MAX_GAP = 2.0
+SENTENCE_MAX_SEGMENTS = 8
+
 
 class SubtitleTranslator:
     """Translate subtitle files between languages"""
     
     def __init__(self):
         """Initialize the translator"""
+        self.memory = TranslationMemory() if config.TRANSLATION_MEMORY_ENABLED else None
+        self.engine = TranslationEngine()
+        self._local = threading.local()  # Per-thread translator clients
+        
         if not TRANSLATOR_AVAILABLE:
             logger.error("Translation module not available")
             logger.info("Install with: pip install deep-translator")
         else:
             logger.info("Subtitle translator initialized")
     
-    def translate_srt_file(self, srt_path, source_lang, target_lang, output_path=None):
+    def translate_srt_file(self, srt_path, source_lang, target_lang, output_path=None, concurrent=True):
         """
         Translate an SRT subtitle file
         
@@ -41,6 +57,8 @@ class SubtitleTranslator:
             source_lang (str): Source language code ('en', 'hi', etc.)
             target_lang (str): Target language code ('hi', 'en', etc.)
             output_path (str): Output path (optional)
+            concurrent (bool): Send the file's batches concurrently (False when
+                               the caller already runs files in parallel)
         
         Returns:
             str: Path to translated subtitle file
@@ -57,36 +75,23 @@ class SubtitleTranslator:
         logger.info(f"From: {source_lang} → To: {target_lang}")
         
         try:
-            # Read the SRT file
-            with open(srt_path, 'r', encoding='utf-8') as f:
-                content = f.read()
-            
-            # Parse SRT content
-            subtitles = self._parse_srt(content)
+            # Read and parse the SRT file
+            with open(srt_path, 'r', encoding='utf-8-sig') as f:
+                cues = list(iter_cues(f))
             
-            # Translate each subtitle
-            translator = GoogleTranslator(source=source_lang, target=target_lang)
-            translated_subtitles = []
+            # Translate the subtitles in batches
+            translations = self._translate_texts(
+                [cue.text for cue in cues],
+                source_lang,
+                target_lang,
+                concurrent=concurrent
+            )
             
-            total = len(subtitles)
-            for idx, subtitle in enumerate(subtitles, 1):
-                try:
-                    # Translate the text
-                    translated_text = translator.translate(subtitle['text'])
-                    
-                    translated_subtitles.append({
-                        'index': subtitle['index'],
-                        'timestamp': subtitle['timestamp'],
-                        'text': translated_text
-                    })
-                    
-                    if idx % 10 == 0:  # Log progress every 10 subtitles
-                        logger.debug(f"Translated {idx}/{total} subtitles")
-                    
-                except Exception as e:
-                    logger.warning(f"Error translating subtitle {idx}: {e}")
-                    # Keep original text if translation fails
-                    translated_subtitles.append(subtitle)
+            translated_cues = [
+                # Keep original text if translation fails
+                cue if translated_text is None else Cue(cue.start, cue.end, translated_text)
+                for cue, translated_text in zip(cues, translations)
+            ]
             
             # Generate output path
             if output_path is None:
@@ -94,7 +99,7 @@ class SubtitleTranslator:
                 output_path = f"{base}_{target_lang}.srt"
             
             # Write translated SRT
-            self._write_srt(translated_subtitles, output_path)
+            save_cues(translated_cues, output_path, "srt")
             
             logger.info(f"✅ Translation complete: {output_path}")
             return output_path
@@ -103,33 +108,196 @@ class SubtitleTranslator:
             logger.log_error_with_exception("Error translating subtitle file", e)
             return None
     
-    def _parse_srt(self, content):
-        """Parse SRT file content"""
-        subtitles = []
-        blocks = content.strip().split('\n\n')
-        
-        for block in blocks:
-            lines = block.strip().split('\n')
-            if len(lines) >= 3:
-                index = lines[0].strip()
-                timestamp = lines[1].strip()
-                text = '\n'.join(lines[2:]).strip()
-                
-                subtitles.append({
-                    'index': index,
-                    'timestamp': timestamp,
-                    'text': text
-                })
+    def _get_translator(self, source_lang, target_lang):
+        """
+        Get a translation client for the current thread
+        
+        deep-translator clients keep request state on the instance, so each
+        worker thread gets its own.
+        """
+        clients = getattr(self._local, 'clients', None)
+        if clients is None:
+            clients = self._local.clients = {}
+        
+        key = (source_lang, target_lang)
+        if key not in clients:
+            if config.TRANSLATION_PROVIDER == "libre":
+                clients[key] = LibreTranslator(
+                    source=source_lang,
+                    target=target_lang,
+                    api_key=config.LIBRETRANSLATE_API_KEY,
+                    custom_url=config.LIBRETRANSLATE_URL
+                )
+            else:
+                clients[key] = GoogleTranslator(source=source_lang, target=target_lang)
+        return clients[key]
+    
+    def _request(self, text, source_lang, target_lang):
+        """Send one translation request through the rate-limited engine"""
+        return self.engine.call(
+            lambda: self._get_translator(source_lang, target_lang).translate(text)
+        )
+    
+    def _translate_texts(self, texts, source_lang, target_lang, concurrent=True):
+        """
+        Translate many subtitle texts with as few requests as possible
+        
+        Repeated lines are translated once, lines already in the translation
+        memory are not sent at all, and the rest are packed into newline-joined
+        batches of up to TRANSLATION_BATCH_MAX_CHARS characters.
+        
+        Args:
+            texts (list): Texts to translate
+            source_lang (str): Source language code
+            target_lang (str): Target language code
+            concurrent (bool): Send batches concurrently (else one after another)
+        
+        Returns:
+            list: Translated texts in the same order (None where translation failed)
+        """
+        return self._translate_text_lists([(texts, source_lang, target_lang)], concurrent)[0]
+    
+    def _translate_text_lists(self, text_lists, concurrent=True):
+        """
+        Translate several lists of texts (e.g. one per target language) together
+        
+        The batches of every list go to the engine as one flat list of
+        (batch, language) work, so all languages are translated at the same
+        time within the engine's rate limit and in-flight bound.
+        
+        Args:
+            text_lists (list): (texts, source_lang, target_lang) tuples
+            concurrent (bool): Send batches concurrently (else one after another)
+        
+        Returns:
+            list: Translated texts per list, in the same order (None where translation failed)
+        """
+        jobs = [self._plan_translation(*text_list) for text_list in text_lists]
+        work = [(job, batch) for job in jobs for batch in job['batches']]
+        
+        # Batches run concurrently; each one fills its own result slots
+        def translate_batch(item):
+            job, batch = item
+            self._translate_batch(
+                job['missing'], batch, job['missing_results'], job['source_lang'], job['target_lang']
+            )
         
-        return subtitles
+        if concurrent:
+            self.engine.map(translate_batch, work)
+        else:
+            for item in work:
+                translate_batch(item)
+        
+        return [self._finish_translation(job) for job in jobs]
+    
+    def _plan_translation(self, texts, source_lang, target_lang):
+        """
+        Deduplicate texts, look them up in the translation memory and batch the rest
+        
+        Returns:
+            dict: Translation job for _translate_text_lists and _finish_translation
+        """
+        results = [None] * len(texts)
+        
+        # Subtitle line breaks are only display wrapping; keep one line per cue
+        flat_texts = [TranslationMemory.normalize(text) for text in texts]
+        
+        # Deduplicate: every distinct line is translated once
+        positions = {}
+        for i, text in enumerate(flat_texts):
+            if text:
+                positions.setdefault(text, []).append(i)
+            else:
+                results[i] = texts[i]
+        unique_texts = list(positions)
+        
+        translated = {}
+        if self.memory:
+            translated = self.memory.get_many(source_lang, target_lang, unique_texts)
+        missing = [text for text in unique_texts if text not in translated]
+        
+        logger.debug(
+            f"{len(texts)} subtitles: {len(unique_texts)} unique, "
+            f"{len(unique_texts) - len(missing)} from translation memory"
+        )
+        
+        batches = []
+        batch = []
+        batch_chars = 0
+        for i, text in enumerate(missing):
+            if batch and batch_chars + len(text) + 1 > config.TRANSLATION_BATCH_MAX_CHARS:
+                batches.append(batch)
+                batch = []
+                batch_chars = 0
+            batch.append(i)
+            batch_chars += len(text) + 1
+        if batch:
+            batches.append(batch)
+        
+        logger.debug(f"Translating {len(missing)} subtitles to {target_lang} in {len(batches)} requests")
+        
+        return {
+            'source_lang': source_lang,
+            'target_lang': target_lang,
+            'results': results,
+            'positions': positions,
+            'translated': translated,
+            'missing': missing,
+            'missing_results': [None] * len(missing),
+            'batches': batches,
+        }
+    
+    def _finish_translation(self, job):
+        """Remember a job's new translations and put every text back in its place"""
+        new_translations = {
+            text: result for text, result in zip(job['missing'], job['missing_results']) if result
+        }
+        if self.memory and new_translations:
+            self.memory.put_many(job['source_lang'], job['target_lang'], new_translations)
+        job['translated'].update(new_translations)
+        
+        results = job['results']
+        for text, indices in job['positions'].items():
+            for i in indices:
+                results[i] = job['translated'].get(text)
+        
+        return results
     
-    def _write_srt(self, subtitles, output_path):
-        """Write subtitles to SRT file"""
-        with open(output_path, 'w', encoding='utf-8') as f:
-            for subtitle in subtitles:
-                f.write(f"{subtitle['index']}\n")
-                f.write(f"{subtitle['timestamp']}\n")
-                f.write(f"{subtitle['text']}\n\n")
+    def _translate_batch(self, texts, indices, results, source_lang, target_lang):
+        """
+        Translate one batch, splitting it in half when its lines don't match
+        
+        A batch whose number of translated lines doesn't match the number of
+        cues is halved, which isolates the cues that cause trouble, so only
+        those end up translated one by one. A request that still errors after
+        the engine's retries fails the whole batch instead: splitting would
+        only multiply the requests sent to a service that is down. Failed
+        cues keep their original text.
+        """
+        if len(indices) == 1:
+            i = indices[0]
+            try:
+                results[i] = self._request(texts[i], source_lang, target_lang)
+            except Exception as e:
+                logger.warning(f"Error translating subtitle {i + 1}: {e}")
+            return
+        
+        try:
+            translated = self._request('\n'.join(texts[i] for i in indices), source_lang, target_lang)
+        except Exception as e:
+            logger.warning(f"Error translating {len(indices)} subtitles: {e}")
+            return
+        
+        lines = [line.strip() for line in (translated or '').strip().split('\n')]
+        if len(lines) == len(indices):
+            for i, line in zip(indices, lines):
+                results[i] = line
+            return
+        logger.debug(f"Batch of {len(indices)} returned {len(lines)} lines - splitting")
+        
+        middle = len(indices) // 2
+        self._translate_batch(texts, indices[:middle], results, source_lang, target_lang)
+        self._translate_batch(texts, indices[middle:], results, source_lang, target_lang)
     
     def translate_text(self, text, source_lang, target_lang):
         """
@@ -147,14 +315,212 @@ class SubtitleTranslator:
             logger.error("deep-translator not installed")
             return text
         
+        if self.memory:
+            remembered = self.memory.get(source_lang, target_lang, text)
+            if remembered is not None:
+                return remembered
+        
         try:
-            translator = GoogleTranslator(source=source_lang, target=target_lang)
-            translated = translator.translate(text)
+            translated = self._request(text, source_lang, target_lang)
+            if self.memory and translated:
+                self.memory.put(source_lang, target_lang, text, translated)
             return translated
         except Exception as e:
             logger.log_error_with_exception("Error translating text", e)
             return text
     
+    def translate_srt_files(self, srt_paths, source_lang, target_lang):
+        """
+        Translate several SRT files concurrently
+        
+        Files and the requests inside them share the engine's rate limit and
+        in-flight bound (TRANSLATION_MAX_IN_FLIGHT, TRANSLATION_REQUESTS_PER_SECOND).
+        
+        Args:
+            srt_paths (list): Paths to source .srt files
+            source_lang (str): Source language code
+            target_lang (str): Target language code
+        
+        Returns:
+            list: Translated file paths in the same order as srt_paths (None where failed)
+        """
+        return self.translate_srt_jobs(
+            [(srt_path, source_lang, target_lang, None) for srt_path in srt_paths]
+        )
+    
+    def translate_srt_jobs(self, jobs):
+        """
+        Translate many (file, language) pairs in one flat worker pool
+        
+        Every job is one file into one language, so all target languages share
+        a single pool of TRANSLATION_MAX_IN_FLIGHT workers instead of nesting
+        a pool per language and per file.
+        
+        Args:
+            jobs (list): (srt_path, source_lang, target_lang, output_path) tuples;
+                         output_path None = next to the source file
+        
+        Returns:
+            list: Translated file paths in job order (None where failed)
+        """
+        return self.engine.map(
+            lambda job: self.translate_srt_file(*job, concurrent=False),
+            jobs
+        )
+    
+    def translate_transcript(self, result, source_lang, target_lang):
+        """
+        Translate a whole transcription, one sentence at a time
+        
+        Consecutive segments are joined into sentences so the translator sees
+        complete sentences even where Whisper (or a clip boundary) splits them.
+        Each translated sentence is then divided back over its segments in
+        proportion to their original length, with evenly spread word timings
+        so SubtitleGenerator.slice_result can cut it onto the clip grid.
+        
+        Args:
+            result (dict): Transcription ('text', 'segments', 'language')
+            source_lang (str): Source language code
+            target_lang (str): Target language code
+        
+        Returns:
+            dict: Translated transcription in the same format (None if unavailable)
+        """
+        return self.translate_transcripts(result, source_lang, [target_lang])[target_lang]
+    
+    def translate_transcripts(self, result, source_lang, target_langs):
+        """
+        Translate a whole transcription into several languages at once
+        
+        Works like translate_transcript, but the sentence batches of every
+        language are sent together (see _translate_text_lists), so a short
+        video costs one round of requests instead of one per language.
+        
+        Args:
+            result (dict): Transcription ('text', 'segments', 'language')
+            source_lang (str): Source language code
+            target_langs (list): Target language codes
+        
+        Returns:
+            dict: Target language -> translated transcription (None if unavailable)
+        """
+        if not TRANSLATOR_AVAILABLE:
+            logger.error("deep-translator not installed")
+            return dict.fromkeys(target_langs)
+        
+        segments = [segment for segment in result['segments'] if segment['text'].strip()]
+        sentences = self._group_sentences(segments)
+        
+        logger.info(f"Translating transcript: {len(segments)} segments in {len(sentences)} sentences")
+        logger.info(f"From: {source_lang} → To: {', '.join(target_langs)}")
+        
+        texts = [' '.join(segments[i]['text'].strip() for i in sentence) for sentence in sentences]
+        translations = self._translate_text_lists(
+            [(texts, source_lang, target_lang) for target_lang in target_langs]
+        )
+        return {
+            target_lang: self._rebuild_transcript(segments, sentences, lang_translations, target_lang)
+            for target_lang, lang_translations in zip(target_langs, translations)
+        }
+    
+    def _rebuild_transcript(self, segments, sentences, translations, target_lang):
+        """Divide translated sentences back over their segments (see translate_transcript)"""
+        translated_segments = []
+        failed = 0
+        for sentence, translated_text in zip(sentences, translations):
+            if translated_text is None:
+                # Keep original text if translation fails
+                failed += 1
+                translated_segments.extend(segments[i] for i in sentence)
+                continue
+            
+            parts = self._split_translation(
+                translated_text,
+                [len(segments[i]['text'].strip()) for i in sentence]
+            )
+            for i, tokens in zip(sentence, parts):
+                if not tokens:
+                    continue
+                segment = segments[i]
+                translated_segments.append({
+                    'start': segment['start'],
+                    'end': segment['end'],
+                    'text': ''.join(tokens).strip(),
+                    'words': self._spread_words(tokens, segment['start'], segment['end'])
+                })
+        
+        if failed:
+            logger.warning(f"{failed}/{len(sentences)} sentences kept untranslated ({target_lang})")
+        
+        return {
+            'text': ' '.join(segment['text'] for segment in translated_segments),
+            'segments': translated_segments,
+            'language': target_lang
+        }
+    
+    def _group_sentences(self, segments):
+        """Group segment indices into sentences (punctuation, pauses, length cap)"""
+        sentences = []
+        current = []
+        
+        for i, segment in enumerate(segments):
+            if current and segment['start'] - segments[current[-1]]['end'] > SENTENCE_MAX_GAP:
+                sentences.append(current)
+                current = []
+            current.append(i)
+            if SENTENCE_END.search(segment['text'].strip()) or len(current) >= SENTENCE_MAX_SEGMENTS:
+                sentences.append(current)
+                current = []
+        
+        if current:
+            sentences.append(current)
+        return sentences
+    
+    def _split_translation(self, text, weights):
+        """
+        Divide a translated sentence over its source segments
+        
+        Args:
+            text (str): Translated sentence
+            weights (list): Source text length of each segment
+        
+        Returns:
+            list: One token list per segment (may be empty for short translations)
+        """
+        text = text.strip()
+        if ' ' in text or len(weights) == 1:
+            tokens = [' ' + word for word in text.split()]
+        else:
+            # Scripts written without spaces (Chinese, Japanese, Thai...)
+            tokens = list(text)
+        
+        total_weight = sum(weights) or 1
+        parts = []
+        position = 0
+        cumulative = 0
+        for weight in weights:
+            cumulative += weight
+            end = round(len(tokens) * cumulative / total_weight)
+            parts.append(tokens[position:end])
+            position = end
+        return parts
+    
+    def _spread_words(self, tokens, start, end):
+        """Give tokens word timings spread over start-end by character count"""
+        total = sum(len(token) for token in tokens) or 1
+        duration = end - start
+        words = []
+        offset = 0
+        for token in tokens:
+            word_start = start + duration * offset / total
+            offset += len(token)
+            words.append({
+                'word': token,
+                'start': word_start,
+                'end': start + duration * offset / total
+            })
+        return words
+    
     def batch_translate_subtitles(self, subtitle_folder, source_lang, target_lang):
         """
         Translate all subtitle files in a folder
@@ -167,7 +533,7 @@ class SubtitleTranslator:
         Returns:
             list: Paths to translated subtitle files
         """
-        subtitle_files = list(Path(subtitle_folder).glob("*.srt"))
+        subtitle_files = sorted(Path(subtitle_folder).glob("*.srt"))
         
         if not subtitle_files:
             logger.warning(f"No .srt files found in: {subtitle_folder}")
@@ -176,19 +542,12 @@ class SubtitleTranslator:
         logger.info(f"Translating {len(subtitle_files)} subtitle files...")
         logger.info(f"From: {source_lang} → To: {target_lang}")
         
-        translated_files = []
-        
-        for idx, srt_path in enumerate(subtitle_files, 1):
-            logger.info(f"\n[{idx}/{len(subtitle_files)}] Processing: {srt_path.name}")
-            
-            translated_path = self.translate_srt_file(
-                str(srt_path),
-                source_lang,
-                target_lang
-            )
-            
-            if translated_path:
-                translated_files.append(translated_path)
+        results = self.translate_srt_files(
+            [str(srt_path) for srt_path in subtitle_files],
+            source_lang,
+            target_lang
+        )
+        translated_files = [path for path in results if path]
         
         logger.info(f"\n✅ Batch translation complete: {len(translated_files)}/{len(subtitle_files)}")
         return translated_files
@@ -5,15 +5,31 @@ Cuts long videos into short clips
 
 import ffmpeg
 import os
+import shutil
+import tempfile
+from concurrent.futures import ThreadPoolExecutor
+from bisect import bisect_left, bisect_right
 from pathlib import Path
 import config
 from logger import get_logger
 
 logger = get_logger()
 
+# Encoder and bitstream filter used to re-encode GOP edges in smart-render mode,
+# keyed by the source codec. Other codecs fall back to a full re-encode.
+SMART_RENDER_CODECS = {
+    'h264': ('libx264', 'h264_mp4toannexb'),
+    'hevc': ('libx265', 'hevc_mp4toannexb'),
+}
+
+# Kinds of clip jobs, so schedulers can tell cheap stream copies from encodes
+JOB_COPY = "copy"
+JOB_ENCODE = "encode"
+
 
 class VideoCutter:
-    def __init__(self, input_video, output_folder=None, clip_duration=None):
+    def __init__(self, input_video, output_folder=None, clip_duration=None, workers=None, time_offset=0,
+                 encode_threads=None):
         """
         Initialize the video cutter
         
@@ -21,10 +37,33 @@ class VideoCutter:
             input_video (str): Path to the input video file
             output_folder (str): Folder to store output clips (uses config if None)
             clip_duration (int): Duration of each clip in seconds (uses config if None)
+            workers (int): Number of clips encoded at once (uses config if None)
+            time_offset (float): Where input_video starts in the original video,
+                                 for clip names (e.g. a downloaded section)
+            encode_threads (int): FFmpeg threads per encode (default: cores split
+                                  between the workers)
         """
         self.input_video = input_video
         self.output_folder = output_folder or config.CLIPS_PATH
         self.clip_duration = clip_duration or config.CLIP_DURATION
+        self.workers = max(1, workers or config.MAX_CONCURRENT_PROCESSES)
+        self.time_offset = time_offset
+        
+        # Split the cores between parallel encodes so N jobs x threads = cores
+        if encode_threads:
+            self.encode_threads = encode_threads
+        elif self.workers > 1:
+            self.encode_threads = max(1, (os.cpu_count() or 1) // self.workers)
+        else:
+            self.encode_threads = None  # Let FFmpeg pick (uses all cores)
+        self.clip_info = []  # One dict per created clip: index, path, start, end
+        
+        # Resume hooks, set by the caller: skip clips that are already cut,
+        # and hear about every newly cut one
+        self.is_clip_done = None  # callable(output_file, start_time, end_time) -> bool
+        self.on_clip_done = None  # callable(output_file, start_time, end_time)
+        self._keyframes = None
+        self._video_stream = None
         
         # Create output folder if it doesn't exist
         Path(self.output_folder).mkdir(parents=True, exist_ok=True)
@@ -42,101 +81,562 @@ class VideoCutter:
             logger.log_error_with_exception("Error getting video duration", e)
             return None
     
-    def cut_video_segments(self):
-        """Cut video into multiple segments"""
+    def cut_video_segments(self, mode=None):
+        """
+        Cut video into multiple segments
+        
+        Args:
+            mode (str): Cutting mode - 'reencode', 'segment', 'copy' or 'smart'
+                        (uses config if None)
+        
+        Returns:
+            list: Paths to created clips, in clip order. The actual start/end
+                  time of every clip is available in self.clip_info.
+        """
         duration = self.get_video_duration()
         
         if duration is None:
             logger.error("Could not determine video duration")
             return []
         
+        mode = mode or config.CUT_MODE
+        self.clip_info = []
+        
         logger.info(f"Video duration: {duration:.2f} seconds")
         logger.info(f"Creating {self.clip_duration}-second clips...")
+        logger.info(f"Cut mode: {mode}")
+        
+        if mode == "segment":
+            created_clips = self._cut_with_segment_muxer(duration)
+        elif mode == "copy":
+            created_clips = self._cut_with_stream_copy(duration)
+        elif mode == "reencode":
+            created_clips = self._cut_each_clip(duration)
+        elif mode == "smart":
+            created_clips = self._cut_each_clip(duration, smart_render=True)
+        else:
+            logger.error(f"Unsupported cut mode: {mode}")
+            return []
+        
+        logger.info(f"All clips saved in: {self.output_folder}")
+        return created_clips
+    
+    def _clip_grid(self, duration):
+        """
+        Split the video timeline into clips
         
-        # Calculate number of clips
+        Returns:
+            list: (index, start_time, end_time) tuples. The leftover tail is
+                  only included if it is longer than 5 seconds.
+        """
         num_clips = int(duration // self.clip_duration)
+        grid = [
+            (i + 1, i * self.clip_duration, (i + 1) * self.clip_duration)
+            for i in range(num_clips)
+        ]
+        
+        # Handle remaining footage if any
+        remaining_time = duration - (num_clips * self.clip_duration)
+        if remaining_time > 5:  # Only create if remaining footage is more than 5 seconds
+            grid.append((num_clips + 1, num_clips * self.clip_duration, duration))
+        
+        return grid
+    
+    def get_clip_plan(self):
+        """
+        Get the clips cut_video_segments would create, without cutting anything
+        
+        Returns:
+            list: Dicts with index, path, start and end for every planned clip
+        """
+        duration = self.get_video_duration()
+        if duration is None:
+            return []
+        
+        return [
+            {
+                'index': index,
+                'path': self._clip_output_path(index, start_time, end_time),
+                'start': start_time,
+                'end': end_time,
+            }
+            for index, start_time, end_time in self._clip_grid(duration)
+        ]
+    
+    def _clip_output_path(self, index, start_time, end_time):
+        """Build the output path for a clip using CLIP_NAME_FORMAT"""
+        return os.path.join(
+            self.output_folder,
+            config.CLIP_NAME_FORMAT.format(
+                index=index,
+                start=int(start_time + self.time_offset),
+                end=int(end_time + self.time_offset),
+                duration=int(end_time - start_time)
+            ) + ".mp4"
+        )
+    
+    def _record_clip(self, index, output_file, start_time, end_time, new=True):
+        """Remember the actual time range of a created (or already existing) clip"""
+        if new and self.on_clip_done:
+            self.on_clip_done(output_file, start_time, end_time)
+        self.clip_info.append({
+            'index': index,
+            'path': output_file,
+            'start': start_time,
+            'end': end_time,
+        })
+        return output_file
+    
+    def _run_clip_jobs(self, jobs):
+        """
+        Run clip jobs, up to self.workers FFmpeg processes at a time
+        
+        Args:
+            jobs (list): (cut_function, index, start_time, end_time, output_file, kind) tuples
+        
+        Returns:
+            list: Paths of the clips that were created, in job (index) order
+        """
+        if self.workers > 1 and len(jobs) > 1:
+            logger.info(f"Encoding {self.workers} clips at a time ({self.encode_threads} threads each)")
+            with ThreadPoolExecutor(max_workers=self.workers) as pool:
+                results = list(pool.map(self.run_clip_job, jobs))
+        else:
+            results = [self.run_clip_job(job) for job in jobs]
+        
+        self.clip_info.sort(key=lambda clip: clip['index'])
+        return [output_file for output_file in results if output_file]
+    
+    def _already_cut(self, output_file, start_time, end_time):
+        """Ask the is_clip_done hook whether a clip can be skipped"""
+        if self.is_clip_done and self.is_clip_done(output_file, start_time, end_time):
+            logger.info(f"Skipping (already cut): {os.path.basename(output_file)}")
+            return True
+        return False
+    
+    def _cut_each_clip(self, duration, smart_render=False):
+        """Cut every clip with its own FFmpeg run (seek + decode + encode per clip)"""
+        return self._run_clip_jobs(self._each_clip_jobs(duration, smart_render))
+    
+    def _each_clip_jobs(self, duration, smart_render=False):
+        """Build one encode (or smart render) job per clip"""
+        cut_clip = self._smart_render_clip if smart_render else self._encode_clip
+        if smart_render:
+            # Probe once up front instead of from every worker
+            self.get_keyframe_times()
+            self._get_video_stream()
+        
+        return [
+            (cut_clip, index, start_time, end_time,
+             self._clip_output_path(index, start_time, end_time), JOB_ENCODE)
+            for index, start_time, end_time in self._clip_grid(duration)
+        ]
+    
+    def get_clip_jobs(self, mode=None):
+        """
+        Plan the cut as independent per-clip jobs, for callers that schedule them
+        
+        Run each job with run_clip_job. The 'segment' mode writes every clip in
+        one FFmpeg pass, so it has no per-clip jobs.
+        
+        Args:
+            mode (str): Cutting mode (uses config if None)
+        
+        Returns:
+            list: (cut_function, index, start_time, end_time, output_file, kind)
+                  tuples in clip order, kind being JOB_COPY or JOB_ENCODE; None for
+                  'segment' mode or on error
+        """
+        mode = mode or config.CUT_MODE
+        duration = self.get_video_duration()
+        if duration is None:
+            logger.error("Could not determine video duration")
+            return None
+        
+        self.clip_info = []
+        if mode == "copy":
+            return self._stream_copy_jobs(duration)
+        if mode in ("reencode", "smart"):
+            return self._each_clip_jobs(duration, smart_render=(mode == "smart"))
+        return None
+    
+    def run_clip_job(self, job):
+        """
+        Cut one clip from get_clip_jobs (thread-safe)
+        
+        Returns:
+            str: Path of the created clip, or None if the cut failed
+        """
+        cut_clip, index, start_time, end_time, output_file, _ = job
+        if self._already_cut(output_file, start_time, end_time):
+            return self._record_clip(index, output_file, start_time, end_time, new=False)
+        if not cut_clip(index, start_time, end_time, output_file):
+            return None
+        return self._record_clip(index, output_file, start_time, end_time)
+    
+    def _encode_options(self):
+        """Video encoder options shared by every re-encoding cut"""
+        options = {
+            'vcodec': config.VIDEO_CODEC,
+            'video_bitrate': config.VIDEO_BITRATE,
+            'preset': config.ENCODING_PRESET,
+        }
+        if self.encode_threads:
+            options['threads'] = self.encode_threads
+        return options
+    
+    def _encode_clip(self, index, start_time, end_time, output_file):
+        """Re-encode one clip with the configured codec settings"""
+        try:
+            logger.log_video_cut(os.path.basename(output_file), start_time, end_time)
+            
+            # Cut the video segment with audio
+            (
+                ffmpeg
+                .input(self.input_video, ss=start_time, t=end_time - start_time)
+                .output(
+                    output_file,
+                    acodec=config.AUDIO_CODEC,
+                    audio_bitrate=config.AUDIO_BITRATE,
+                    **self._encode_options()
+                )
+                .overwrite_output()
+                .run(capture_stdout=True, capture_stderr=True, quiet=True)
+            )
+            
+            logger.log_file_created(output_file)
+            return True
+            
+        except ffmpeg.Error as e:
+            logger.error(f"Error creating clip {index}: {e.stderr.decode()}")
+            return False
+    
+    def _cut_with_segment_muxer(self, duration):
+        """
+        Decode the source once and write every clip through the segment muxer
+        
+        Keyframes are forced at every clip boundary so the muxer splits exactly
+        on the clip grid. Output is limited to the end of the last kept clip,
+        so a tail shorter than 5 seconds is never written.
+        """
+        grid = self._clip_grid(duration)
+        if not grid:
+            return []
+        
+        # One pass writes every clip, so only a fully cut video is skipped
+        planned = [
+            (index, self._clip_output_path(index, start_time, end_time), start_time, end_time)
+            for index, start_time, end_time in grid
+        ]
+        if self.is_clip_done and all(self.is_clip_done(output_file, start_time, end_time)
+                                     for _, output_file, start_time, end_time in planned):
+            logger.info(f"Skipping (already cut): all {len(planned)} clips")
+            return [
+                self._record_clip(index, output_file, start_time, end_time, new=False)
+                for index, output_file, start_time, end_time in planned
+            ]
+        
+        segment_pattern = os.path.join(self.output_folder, "_segment_%05d.mp4")
+        boundaries = ",".join(f"{start_time:.3f}" for _, start_time, _ in grid[1:])
+        
+        output_options = {
+            'f': 'segment',
+            'reset_timestamps': 1,
+            't': grid[-1][2],
+            'vcodec': config.VIDEO_CODEC,
+            'acodec': config.AUDIO_CODEC,
+            'audio_bitrate': config.AUDIO_BITRATE,
+            'video_bitrate': config.VIDEO_BITRATE,
+            'preset': config.ENCODING_PRESET,
+        }
+        if boundaries:
+            output_options['segment_times'] = boundaries
+            output_options['force_key_frames'] = boundaries
+        
+        try:
+            logger.info(f"Writing {len(grid)} clips in a single pass...")
+            (
+                ffmpeg
+                .input(self.input_video)
+                .output(segment_pattern, **output_options)
+                .overwrite_output()
+                .run(capture_stdout=True, capture_stderr=True, quiet=True)
+            )
+        except ffmpeg.Error as e:
+            logger.error(f"Error running segment muxer: {e.stderr.decode()}")
+            return []
+        
+        # Rename the numbered segments to the configured clip names
         created_clips = []
+        for index, start_time, end_time in grid:
+            segment_file = segment_pattern % (index - 1)
+            output_file = self._clip_output_path(index, start_time, end_time)
+            
+            if not os.path.exists(segment_file):
+                logger.error(f"Error creating clip {index}: segment not written")
+                continue
+            
+            os.replace(segment_file, output_file)
+            logger.log_video_cut(os.path.basename(output_file), start_time, end_time)
+            logger.log_file_created(output_file)
+            created_clips.append(
+                self._record_clip(index, output_file, start_time, end_time)
+            )
+        
+        return created_clips
+    
+    def get_keyframe_times(self):
+        """
+        Get the timestamps of all video keyframes
         
-        for i in range(num_clips):
-            start_time = i * self.clip_duration
-            output_file = os.path.join(
-                self.output_folder, 
-                config.CLIP_NAME_FORMAT.format(
-                    index=i+1,
-                    start=int(start_time),
-                    end=int(start_time + self.clip_duration),
-                    duration=self.clip_duration
-                ) + ".mp4"
+        Reads packet flags with ffprobe, so nothing is decoded.
+        
+        Returns:
+            list: Sorted keyframe times in seconds (empty if probing fails)
+        """
+        if self._keyframes is not None:
+            return self._keyframes
+        
+        try:
+            probe = ffmpeg.probe(
+                self.input_video,
+                select_streams='v:0',
+                show_entries='packet=pts_time,flags'
+            )
+            keyframes = sorted(
+                float(packet['pts_time'])
+                for packet in probe.get('packets', [])
+                if 'K' in packet.get('flags', '') and packet.get('pts_time') not in (None, 'N/A')
             )
+            logger.debug(f"Found {len(keyframes)} keyframes")
+            self._keyframes = keyframes
+        except Exception as e:
+            logger.log_error_with_exception("Error probing keyframes", e)
+            self._keyframes = []
+        
+        return self._keyframes
+    
+    def _snap_to_keyframe(self, time_point, tolerance):
+        """
+        Move a time to the nearest keyframe
+        
+        Returns:
+            float: Keyframe time, or None if no keyframe is within tolerance
+        """
+        keyframes = self.get_keyframe_times()
+        if not keyframes:
+            return None
+        
+        pos = bisect_left(keyframes, time_point)
+        candidates = keyframes[max(pos - 1, 0):pos + 1]
+        nearest = min(candidates, key=lambda k: abs(k - time_point))
+        
+        if abs(nearest - time_point) <= tolerance:
+            return nearest
+        return None
+    
+    def _cut_with_stream_copy(self, duration):
+        """
+        Cut clips with '-c copy' on keyframe-aligned boundaries (no re-encode)
+        
+        Every clip boundary is snapped to the nearest keyframe within
+        config.KEYFRAME_SNAP_TOLERANCE. A clip whose boundaries cannot be
+        snapped is re-encoded instead, from the edge its neighbour was cut at
+        (or the original grid time where that one was not snapped either).
+        """
+        return self._run_clip_jobs(self._stream_copy_jobs(duration))
+    
+    def _stream_copy_jobs(self, duration):
+        """Build one stream-copy job per clip (re-encode jobs where snapping failed)"""
+        grid = self._clip_grid(duration)
+        if not grid:
+            return []
+        
+        tolerance = config.KEYFRAME_SNAP_TOLERANCE
+        
+        # Snap the shared boundaries once so neighbouring clips never overlap.
+        # snapped is None where no keyframe is close enough; edges holds the
+        # time every boundary is actually cut at (the grid time in that case)
+        boundaries = [grid[0][1]] + [end_time for _, _, end_time in grid]
+        snapped = [boundaries[0]]
+        edges = [boundaries[0]]
+        for i in range(1, len(boundaries) - 1):
+            keyframe = self._snap_to_keyframe(boundaries[i], tolerance)
+            if keyframe is not None and edges[-1] < keyframe < boundaries[i + 1]:
+                snapped.append(keyframe)
+                edges.append(keyframe)
+            else:
+                snapped.append(None)
+                edges.append(boundaries[i])
+        snapped.append(boundaries[-1])
+        edges.append(boundaries[-1])
+        
+        jobs = []
+        for i, (index, _, _) in enumerate(grid):
+            copy_start, copy_end = snapped[i], snapped[i + 1]
             
-            try:
-                logger.log_video_cut(
-                    os.path.basename(output_file),
-                    start_time,
-                    start_time + self.clip_duration
+            if copy_start is None or copy_end is None:
+                logger.warning(
+                    f"No keyframe within {tolerance}s of clip {index} boundaries - re-encoding"
                 )
-                
-                # Cut the video segment with audio
+                start_time, end_time = edges[i], edges[i + 1]
+                jobs.append((self._encode_clip, index, start_time, end_time,
+                             self._clip_output_path(index, start_time, end_time), JOB_ENCODE))
+            else:
+                jobs.append((self._copy_clip, index, copy_start, copy_end,
+                             self._clip_output_path(index, copy_start, copy_end), JOB_COPY))
+        
+        return jobs
+    
+    def _copy_clip(self, index, start_time, end_time, output_file):
+        """Stream-copy one keyframe-aligned clip"""
+        try:
+            logger.log_video_cut(os.path.basename(output_file), start_time, end_time)
+            (
+                ffmpeg
+                .input(self.input_video, ss=start_time)
+                .output(
+                    output_file,
+                    t=end_time - start_time,
+                    c='copy',
+                    avoid_negative_ts='make_zero'
+                )
+                .overwrite_output()
+                .run(capture_stdout=True, capture_stderr=True, quiet=True)
+            )
+            logger.log_file_created(output_file)
+            return True
+        except ffmpeg.Error as e:
+            logger.error(f"Error creating clip {index}: {e.stderr.decode()}")
+            return False
+    
+    def _get_video_stream(self):
+        """Get the ffprobe info of the first video stream (cached)"""
+        if self._video_stream is None:
+            try:
+                probe = ffmpeg.probe(self.input_video, select_streams='v:0')
+                self._video_stream = probe['streams'][0]
+            except Exception as e:
+                logger.log_error_with_exception("Error probing video stream", e)
+                self._video_stream = {}
+        return self._video_stream
+    
+    def _smart_render_clip(self, index, start_time, end_time, output_file):
+        """
+        Frame-accurate cut that only re-encodes the partial GOPs at the edges
+        
+        The video between the first and last keyframe inside the clip is
+        stream-copied; the head (start -> first keyframe) and tail (last
+        keyframe -> end) are re-encoded with matching codec settings. The
+        pieces are joined losslessly with the concat demuxer and the audio
+        for the whole clip is encoded in the same final pass.
+        """
+        stream = self._get_video_stream()
+        codec = stream.get('codec_name')
+        keyframes = self.get_keyframe_times()
+        
+        if codec not in SMART_RENDER_CODECS or not keyframes:
+            logger.debug(f"Smart render unavailable for codec '{codec}' - re-encoding clip {index}")
+            return self._encode_clip(index, start_time, end_time, output_file)
+        
+        first_pos = bisect_left(keyframes, start_time)
+        last_pos = bisect_right(keyframes, end_time) - 1
+        if first_pos >= len(keyframes) or last_pos <= first_pos:
+            # No complete GOP inside the clip, nothing to copy
+            return self._encode_clip(index, start_time, end_time, output_file)
+        
+        copy_start, copy_end = keyframes[first_pos], keyframes[last_pos]
+        encoder, bitstream_filter = SMART_RENDER_CODECS[codec]
+        
+        edge_options = dict(self._encode_options(), vcodec=encoder, an=None, f='mpegts')
+        if stream.get('pix_fmt'):
+            edge_options['pix_fmt'] = stream['pix_fmt']
+        profile = (stream.get('profile') or '').lower()
+        if codec == 'h264' and profile in ('baseline', 'main', 'high'):
+            edge_options['profile:v'] = profile
+        
+        Path(config.TEMP_FOLDER).mkdir(parents=True, exist_ok=True)
+        work_dir = tempfile.mkdtemp(prefix="smart_render_", dir=config.TEMP_FOLDER)
+        
+        try:
+            logger.log_video_cut(os.path.basename(output_file), start_time, end_time)
+            logger.debug(
+                f"Smart render: copy {copy_start:.3f}s - {copy_end:.3f}s, "
+                f"re-encode {copy_start - start_time:.3f}s + {end_time - copy_end:.3f}s"
+            )
+            
+            pieces = []
+            
+            # Head: partial GOP before the first keyframe
+            if copy_start - start_time > 0.001:
+                head_file = os.path.join(work_dir, "head.ts")
                 (
                     ffmpeg
-                    .input(self.input_video, ss=start_time, t=self.clip_duration)
-                    .output(
-                        output_file,
-                        vcodec=config.VIDEO_CODEC,
-                        acodec=config.AUDIO_CODEC,
-                        audio_bitrate=config.AUDIO_BITRATE,
-                        video_bitrate=config.VIDEO_BITRATE,
-                        preset=config.ENCODING_PRESET
-                    )
+                    .input(self.input_video, ss=start_time, t=copy_start - start_time)
+                    .output(head_file, **edge_options)
                     .overwrite_output()
                     .run(capture_stdout=True, capture_stderr=True, quiet=True)
                 )
-                
-                logger.log_file_created(output_file)
-                created_clips.append(output_file)
-                
-            except ffmpeg.Error as e:
-                logger.error(f"Error creating clip {i+1}: {e.stderr.decode()}")
-        
-        # Handle remaining footage if any
-        remaining_time = duration - (num_clips * self.clip_duration)
-        if remaining_time > 5:  # Only create if remaining footage is more than 5 seconds
-            start_time = num_clips * self.clip_duration
-            output_file = os.path.join(
-                self.output_folder,
-                config.CLIP_NAME_FORMAT.format(
-                    index=num_clips+1,
-                    start=int(start_time),
-                    end=int(duration),
-                    duration=int(remaining_time)
-                ) + ".mp4"
+                pieces.append(head_file)
+            
+            # Middle: whole GOPs, copied untouched
+            middle_file = os.path.join(work_dir, "middle.ts")
+            (
+                ffmpeg
+                .input(self.input_video, ss=copy_start, t=copy_end - copy_start)
+                .output(middle_file, vcodec='copy', an=None, f='mpegts',
+                        **{'bsf:v': bitstream_filter})
+                .overwrite_output()
+                .run(capture_stdout=True, capture_stderr=True, quiet=True)
             )
+            pieces.append(middle_file)
             
-            try:
-                logger.info(f"Creating final clip: {os.path.basename(output_file)}")
+            # Tail: partial GOP after the last keyframe
+            if end_time - copy_end > 0.001:
+                tail_file = os.path.join(work_dir, "tail.ts")
                 (
                     ffmpeg
-                    .input(self.input_video, ss=start_time, t=remaining_time)
-                    .output(
-                        output_file,
-                        vcodec=config.VIDEO_CODEC,
-                        acodec=config.AUDIO_CODEC,
-                        audio_bitrate=config.AUDIO_BITRATE,
-                        video_bitrate=config.VIDEO_BITRATE,
-                        preset=config.ENCODING_PRESET
-                    )
+                    .input(self.input_video, ss=copy_end, t=end_time - copy_end)
+                    .output(tail_file, **edge_options)
                     .overwrite_output()
                     .run(capture_stdout=True, capture_stderr=True, quiet=True)
                 )
-                logger.log_file_created(output_file)
-                created_clips.append(output_file)
-            except ffmpeg.Error as e:
-                logger.error(f"Error creating final clip: {e.stderr.decode()}")
-        
-        logger.info(f"All clips saved in: {self.output_folder}")
-        return created_clips
+                pieces.append(tail_file)
+            
+            concat_list = os.path.join(work_dir, "pieces.txt")
+            with open(concat_list, 'w', encoding='utf-8') as f:
+                for piece in pieces:
+                    f.write(f"file '{os.path.abspath(piece)}'\n")
+            
+            # Join the video pieces losslessly and encode the clip's audio
+            video = ffmpeg.input(concat_list, f='concat', safe=0)
+            audio = ffmpeg.input(self.input_video, ss=start_time, t=end_time - start_time)
+            (
+                ffmpeg
+                .output(
+                    video['v'],
+                    audio['a'],
+                    output_file,
+                    vcodec='copy',
+                    acodec=config.AUDIO_CODEC,
+                    audio_bitrate=config.AUDIO_BITRATE
+                )
+                .overwrite_output()
+                .run(capture_stdout=True, capture_stderr=True, quiet=True)
+            )
+            
+            logger.log_file_created(output_file)
+            return True
+            
+        except ffmpeg.Error as e:
+            logger.error(f"Error creating clip {index}: {e.stderr.decode()}")
+            return False
+        finally:
+            if config.CLEANUP_TEMP_FILES:
+                shutil.rmtree(work_dir, ignore_errors=True)
     
-    def cut_specific_segment(self, start_time, end_time=None, output_name="custom_clip.mp4"):
+    def cut_specific_segment(self, start_time, end_time=None, output_name="custom_clip.mp4",
+                             smart_render=False):
         """
         Cut a specific segment from the video
         
@@ -144,6 +644,8 @@ class VideoCutter:
             start_time (int/float): Start time in seconds
             end_time (int/float): End time in seconds (if None, uses start_time + clip_duration)
             output_name (str): Name of the output file
+            smart_render (bool): Only re-encode the partial GOPs at the clip edges
+                                 and stream-copy the rest (still frame-accurate)
         """
         if end_time is None:
             duration = self.clip_duration
@@ -152,6 +654,12 @@ class VideoCutter:
         
         output_file = os.path.join(self.output_folder, output_name)
         
+        if smart_render:
+            logger.info(f"Creating clip from {start_time}s to {start_time + duration}s (smart render)...")
+            if self._smart_render_clip(1, start_time, start_time + duration, output_file):
+                return output_file
+            return None
+        
         try:
             logger.info(f"Creating clip from {start_time}s to {start_time + duration}s...")
             
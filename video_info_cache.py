@@ -0,0 +1,104 @@
+"""
+Video Info Cache - Integrated with config and logging
+Keeps yt-dlp metadata per video ID so each video is extracted once, not once per step
+"""
+
+import json
+import os
+import threading
+import time
+from pathlib import Path
+import config
+from logger import get_logger
+
+logger = get_logger()
+
+
+class VideoInfoCache:
+    """yt-dlp info dicts keyed by video ID, in memory and on disk, with a time-to-live"""
+    
+    def __init__(self, cache_folder=None, ttl_hours=None):
+        """
+        Initialize the video info cache
+        
+        Args:
+            cache_folder (str): Folder for cache entries (uses config if None)
+            ttl_hours (float): How long an entry stays valid (uses config if None)
+        """
+        self.cache_folder = cache_folder or os.path.join(config.CACHE_PATH, "video_info")
+        ttl_hours = config.VIDEO_INFO_CACHE_TTL_HOURS if ttl_hours is None else ttl_hours
+        self.ttl_seconds = ttl_hours * 3600
+        self._memory = {}  # video ID -> (fetched_at, info)
+        self._lock = threading.Lock()
+        
+        Path(self.cache_folder).mkdir(parents=True, exist_ok=True)
+        logger.debug(f"Video info cache folder: {self.cache_folder}")
+    
+    def get(self, video_id):
+        """
+        Look up the info of a video
+        
+        Returns:
+            dict: yt-dlp info dict, or None on a miss or when the entry expired
+        """
+        with self._lock:
+            entry = self._memory.get(video_id)
+        
+        if entry is None:
+            try:
+                with open(self._entry_path(video_id), 'r', encoding='utf-8') as f:
+                    data = json.load(f)
+                entry = (data['fetched_at'], data['info'])
+            except FileNotFoundError:
+                return None
+            except Exception as e:
+                logger.warning(f"Ignoring unreadable video info entry {video_id}: {e}")
+                return None
+        
+        fetched_at, info = entry
+        if time.time() - fetched_at > self.ttl_seconds:
+            logger.debug(f"Video info expired: {video_id}")
+            return None
+        
+        with self._lock:
+            self._memory[video_id] = entry
+        logger.debug(f"Video info cache hit: {video_id}")
+        return info
+    
+    def put(self, video_id, info):
+        """Store the info of a video (must be JSON-serializable, e.g. from ydl.sanitize_info)"""
+        entry = (time.time(), info)
+        with self._lock:
+            self._memory[video_id] = entry
+        
+        entry_path = self._entry_path(video_id)
+        temp_path = f"{entry_path}.{os.getpid()}.{threading.get_ident()}.tmp"
+        
+        try:
+            with open(temp_path, 'w', encoding='utf-8') as f:
+                json.dump({'fetched_at': entry[0], 'info': info}, f, ensure_ascii=False)
+            os.replace(temp_path, entry_path)
+            logger.debug(f"Video info cached: {video_id}")
+        except Exception as e:
+            logger.log_error_with_exception("Error writing video info cache", e)
+            if os.path.exists(temp_path):
+                os.remove(temp_path)
+            return
+        
+        self._remove_expired()
+    
+    def _entry_path(self, video_id):
+        """Path of the JSON file for a video ID"""
+        return os.path.join(self.cache_folder, f"{video_id}.json")
+    
+    def _remove_expired(self):
+        """Delete entries older than the time-to-live"""
+        cutoff = time.time() - self.ttl_seconds
+        
+        for entry_path in Path(self.cache_folder).glob("*.json"):
+            try:
+                if entry_path.stat().st_mtime < cutoff:
+                    entry_path.unlink()
+                    logger.debug(f"Removed expired video info: {entry_path.name}")
+            except OSError:
+                continue
@@ -0,0 +1,173 @@
+"""
+Voice Activity Detection - Integrated with config and logging
+Finds speech regions with a fast energy-based pass (NumPy only, no model)
+"""
+
+import config
+from logger import get_logger
+
+logger = get_logger()
+
+try:
+    import numpy as np
+    NUMPY_AVAILABLE = True
+except ImportError:
+    # No warning here: create_backend already reports missing NumPy, and
+    # without a backend transcription (and so VAD) never runs
+    NUMPY_AVAILABLE = False
+
+# Voice energy is concentrated in this band; music beds and noise spread wider
+SPEECH_BAND_HZ = (300, 3400)
+
+# Silence inserted between speech regions when they are joined for Whisper
+REGION_GAP_SECONDS = 0.3
+
+
+def detect_speech(audio, sample_rate=16000, threshold_db=None, frame_ms=30,
+                  min_speech_ms=250, min_silence_ms=300, padding_ms=200):
+    """
+    Find the regions of an audio signal that contain speech
+    
+    A frame counts as speech when its energy is threshold_db above the
+    background level (10th percentile of all frames) and most of that energy
+    sits in the speech band. Short gaps are bridged, short blips are dropped
+    and every region is padded so word edges are not clipped.
+    
+    Args:
+        audio (numpy.ndarray): Mono float32 samples
+        sample_rate (int): Sample rate of audio
+        threshold_db (float): Energy above background for speech (uses config if None)
+        frame_ms (int): Analysis frame length
+        min_speech_ms (int): Shortest region kept
+        min_silence_ms (int): Shortest gap that splits two regions
+        padding_ms (int): Padding added around each region
+    
+    Returns:
+        list: (start_seconds, end_seconds) tuples, sorted and non-overlapping
+    """
+    threshold_db = config.VAD_ENERGY_THRESHOLD_DB if threshold_db is None else threshold_db
+    frame_len = int(sample_rate * frame_ms / 1000)
+    num_frames = len(audio) // frame_len
+    if num_frames == 0:
+        return []
+    
+    frames = audio[:num_frames * frame_len].reshape(num_frames, frame_len)
+    
+    # Frame energy relative to the background level
+    energy_db = 10 * np.log10(np.mean(frames ** 2, axis=1) + 1e-10)
+    background_db = np.percentile(energy_db, 10)
+    loud = energy_db > max(background_db + threshold_db, -60.0)
+    
+    # Share of each frame's energy inside the speech band
+    # (in blocks, so hour-long sources don't need a huge spectrum array)
+    freqs = np.fft.rfftfreq(frame_len, 1.0 / sample_rate)
+    band = (freqs >= SPEECH_BAND_HZ[0]) & (freqs <= SPEECH_BAND_HZ[1])
+    band_ratio = np.empty(num_frames, dtype=np.float32)
+    for block_start in range(0, num_frames, 10000):
+        block = frames[block_start:block_start + 10000]
+        spectrum = np.abs(np.fft.rfft(block, axis=1)) ** 2
+        band_ratio[block_start:block_start + len(block)] = (
+            spectrum[:, band].sum(axis=1) / (spectrum.sum(axis=1) + 1e-10)
+        )
+    
+    is_speech = loud & (band_ratio > 0.5)
+    
+    # Collect runs of speech frames
+    regions = []
+    start = None
+    for i, speech in enumerate(is_speech):
+        if speech and start is None:
+            start = i
+        elif not speech and start is not None:
+            regions.append([start, i])
+            start = None
+    if start is not None:
+        regions.append([start, num_frames])
+    
+    # Bridge short gaps, then drop short blips
+    min_gap = min_silence_ms / frame_ms
+    merged = []
+    for region in regions:
+        if merged and region[0] - merged[-1][1] < min_gap:
+            merged[-1][1] = region[1]
+        else:
+            merged.append(region)
+    min_len = min_speech_ms / frame_ms
+    merged = [r for r in merged if r[1] - r[0] >= min_len]
+    
+    # Convert to seconds with padding, merging any overlaps it creates
+    frame_s = frame_ms / 1000
+    padding_s = padding_ms / 1000
+    total_s = len(audio) / sample_rate
+    speech_regions = []
+    for start_frame, end_frame in merged:
+        start_s = max(0.0, start_frame * frame_s - padding_s)
+        end_s = min(total_s, end_frame * frame_s + padding_s)
+        if speech_regions and start_s <= speech_regions[-1][1]:
+            speech_regions[-1] = (speech_regions[-1][0], end_s)
+        else:
+            speech_regions.append((start_s, end_s))
+    
+    return speech_regions
+
+
+def speech_ratio(regions, total_seconds):
+    """Fraction (0-1) of the audio covered by speech regions"""
+    if total_seconds <= 0:
+        return 0.0
+    return min(1.0, sum(end - start for start, end in regions) / total_seconds)
+
+
+def extract_speech(audio, regions, sample_rate=16000):
+    """
+    Join the speech regions into one shorter signal
+    
+    Returns:
+        tuple: (samples, mapping) where mapping is a list of
+               (compact_start, original_start, length) tuples in seconds,
+               used by restore_timestamps()
+    """
+    gap = np.zeros(int(REGION_GAP_SECONDS * sample_rate), dtype=audio.dtype)
+    
+    pieces = []
+    mapping = []
+    position = 0.0
+    for start_s, end_s in regions:
+        piece = audio[int(start_s * sample_rate):int(end_s * sample_rate)]
+        mapping.append((position, start_s, len(piece) / sample_rate))
+        pieces.extend([piece, gap])
+        position += (len(piece) + len(gap)) / sample_rate
+    
+    if not pieces:
+        return audio[:0], []
+    return np.concatenate(pieces), mapping
+
+
+def restore_timestamps(result, mapping):
+    """
+    Shift segment and word times from the joined signal back to the original
+    
+    Args:
+        result (dict): Transcription of the extract_speech() samples (modified in place)
+        mapping (list): Mapping returned by extract_speech()
+    
+    Returns:
+        dict: The same result with original-timeline times
+    """
+    def to_original(t):
+        chunk = mapping[0]
+        for candidate in mapping:
+            if candidate[0] > t:
+                break
+            chunk = candidate
+        compact_start, original_start, length = chunk
+        return original_start + min(max(t - compact_start, 0.0), length)
+    
+    for segment in result['segments']:
+        segment['start'] = to_original(segment['start'])
+        segment['end'] = to_original(segment['end'])
+        for word in segment.get('words') or []:
+            word['start'] = to_original(word['start'])
+            word['end'] = to_original(word['end'])
+    
+    return result
@@ -3,11 +3,14 @@ YouTube Video Downloader - Integrated with config and logging
 Downloads YouTube videos for processing
 """
 
+import copy
 import os
 import re
 from pathlib import Path
 import config
 from logger import get_logger
+from download_store import DownloadStore
+from video_info_cache import VideoInfoCache
 
 logger = get_logger()
 
@@ -19,6 +22,13 @@ except ImportError:
     logger.warning("yt-dlp not installed. YouTube download functionality unavailable.")
     logger.info("Install with: pip install yt-dlp")
 
+# youtube.com/watch?v=ID, youtu.be/ID, /embed/ID, /shorts/ID ... (last group is the video ID)
+YOUTUBE_URL_REGEX = (
+    r'(https?://)?(www\.|m\.)?'
+    r'(youtube|youtu|youtube-nocookie)\.(com|be)/'
+    r'(watch\?v=|embed/|v/|shorts/|.+[?&]v=)?([^&=%\?/]{11})'
+)
+
 
 class YouTubeDownloader:
     def __init__(self, download_folder=None):
@@ -29,17 +39,44 @@ class YouTubeDownloader:
             download_folder (str): Folder to save downloaded videos (uses config if None)
         """
         self.download_folder = download_folder or config.DOWNLOAD_PATH
+        self.info_cache = VideoInfoCache() if config.VIDEO_INFO_CACHE_ENABLED else None
+        self.store = DownloadStore(self.download_folder) if config.DOWNLOAD_STORE_ENABLED else None
         Path(self.download_folder).mkdir(parents=True, exist_ok=True)
         logger.debug(f"Download folder: {self.download_folder}")
     
     def is_youtube_url(self, url):
         """Check if the URL is a valid YouTube URL"""
-        youtube_regex = (
-            r'(https?://)?(www\.)?'
-            '(youtube|youtu|youtube-nocookie)\.(com|be)/'
-            '(watch\?v=|embed/|v/|.+\?v=)?([^&=%\?]{11})'
-        )
-        return re.match(youtube_regex, url) is not None
+        return re.match(YOUTUBE_URL_REGEX, url) is not None
+    
+    def get_video_id(self, url):
+        """Get the 11-character video ID from any YouTube URL form (None if not YouTube)"""
+        match = re.match(YOUTUBE_URL_REGEX, url)
+        return match.group(6) if match else None
+    
+    def _extract_info(self, url, ydl):
+        """
+        Get the metadata of a video, from the info cache when possible
+        
+        Args:
+            url (str): YouTube video URL
+            ydl: Open yt_dlp.YoutubeDL instance (used on a cache miss)
+        
+        Returns:
+            dict: JSON-safe info dict that ydl.process_ie_result can download from
+        """
+        video_id = self.get_video_id(url)
+        if self.info_cache and video_id:
+            info = self.info_cache.get(video_id)
+            if info is not None:
+                logger.debug(f"Using cached video info: {video_id}")
+                # process_ie_result modifies the dict it is given
+                return copy.deepcopy(info)
+        
+        info = ydl.sanitize_info(ydl.extract_info(url, download=False), remove_private_keys=True)
+        if self.info_cache and video_id:
+            self.info_cache.put(video_id, info)
+            info = copy.deepcopy(info)
+        return info
     
     def download_video(self, url, output_name=None, quality=None):
         """
@@ -63,7 +100,37 @@ class YouTubeDownloader:
             return None
         
         quality = quality or config.YOUTUBE_QUALITY
+        format_string = self._get_format_string(quality)
+        
+        # Same video + format already downloaded (from any URL form)?
+        video_id = self.get_video_id(url)
+        if self.store and video_id and not output_name:
+            store_key = self.store.make_key(video_id, format_string)
+            # A batch can hold the same video twice: the second thread waits
+            # for the first download instead of writing to the same files
+            with self.store.key_lock(store_key):
+                stored_file = self.store.get(store_key)
+                if stored_file:
+                    logger.info(f"Using stored download: {stored_file}")
+                    return stored_file
+                return self._download(url, quality, format_string, store_key=store_key)
+        
+        return self._download(url, quality, format_string, output_name=output_name)
+    
+    def _download(self, url, quality, format_string, output_name=None, store_key=None):
+        """
+        Run yt-dlp for one video (download_video has already checked the store)
+        
+        Args:
+            url (str): YouTube video URL
+            quality (str): Video quality (for the log)
+            format_string (str): yt-dlp format selection
+            output_name (str): Custom output filename (optional)
+            store_key (str): Store key to download into (None = plain download folder)
         
+        Returns:
+            str: Path to downloaded video file, or None if failed
+        """
         logger.info(f"Downloading video from YouTube...")
         logger.info(f"URL: {url}")
         logger.info(f"Quality: {quality}")
@@ -71,11 +138,14 @@ class YouTubeDownloader:
         # Configure yt-dlp options
         if output_name:
             output_template = os.path.join(self.download_folder, output_name)
+        elif store_key:
+            # Downloaded aside, then renamed into the store when complete
+            output_template = self.store.partial_template(store_key)
         else:
             output_template = os.path.join(self.download_folder, '%(title)s.%(ext)s')
         
         ydl_opts = {
-            'format': self._get_format_string(quality),
+            'format': format_string,
             'outtmpl': output_template,
             'quiet': False,
             'no_warnings': False,
@@ -84,21 +154,24 @@ class YouTubeDownloader:
         
         try:
             with yt_dlp.YoutubeDL(ydl_opts) as ydl:
-                # Get video info
-                info = ydl.extract_info(url, download=False)
+                # Get video info (cached, so get_video_info + download extract once)
+                info = self._extract_info(url, ydl)
                 video_title = info.get('title', 'video')
                 duration = info.get('duration', 0)
                 
                 logger.info(f"Title: {video_title}")
                 logger.info(f"Duration: {self._format_duration(duration)}")
                 
-                # Download the video
-                info = ydl.extract_info(url, download=True)
+                # Download the video from the info already fetched
+                info = ydl.process_ie_result(info, download=True)
                 
-                # Get the downloaded file path
-                downloaded_file = ydl.prepare_filename(info)
+                # Get the downloaded file path (after merging video + audio)
+                requested = info.get('requested_downloads') or [{}]
+                downloaded_file = requested[0].get('filepath') or ydl.prepare_filename(info)
                 
                 if os.path.exists(downloaded_file):
+                    if store_key:
+                        downloaded_file = self.store.add(store_key, downloaded_file, title=video_title)
                     size_mb = os.path.getsize(downloaded_file) / (1024 * 1024)
                     logger.info(f"Download complete: {downloaded_file}")
                     logger.info(f"File size: {size_mb:.2f} MB")
@@ -111,6 +184,82 @@ class YouTubeDownloader:
             logger.log_error_with_exception("Error downloading video", e)
             return None
     
+    def download_sections(self, url, sections, quality=None):
+        """
+        Download only some time ranges of a YouTube video
+        
+        Uses yt-dlp's download_ranges support, so only the requested parts are
+        fetched (one file per range) instead of the whole video.
+        
+        Args:
+            url (str): YouTube video URL
+            sections (list): (start, end) tuples in seconds
+            quality (str): Video quality (uses config if None)
+        
+        Returns:
+            dict: (start, end) -> path of the downloaded section, in time order
+                  (ranges that failed are left out), or None if failed
+        """
+        if not YT_DLP_AVAILABLE:
+            logger.error("yt-dlp is not installed!")
+            logger.info("Install it with: pip install yt-dlp")
+            return None
+        
+        if not self.is_youtube_url(url):
+            logger.error(f"Invalid YouTube URL: {url}")
+            return None
+        
+        quality = quality or config.YOUTUBE_QUALITY
+        sections = sorted((float(start), float(end)) for start, end in sections)
+        
+        logger.info(f"Downloading {len(sections)} sections from YouTube...")
+        logger.info(f"URL: {url}")
+        logger.info(f"Quality: {quality}")
+        for start, end in sections:
+            logger.info(f"  Section: {self._format_duration(start)} - {self._format_duration(end)}")
+        
+        ydl_opts = {
+            'format': self._get_format_string(quality),
+            'outtmpl': os.path.join(
+                self.download_folder,
+                '%(title)s [%(id)s] %(section_start)d-%(section_end)ds.%(ext)s'
+            ),
+            'download_ranges': yt_dlp.utils.download_range_func(None, sections),
+            'force_keyframes_at_cuts': config.YOUTUBE_SECTIONS_PRECISE_CUTS,
+            'quiet': False,
+            'no_warnings': False,
+            'progress_hooks': [self._progress_hook],
+        }
+        
+        try:
+            with yt_dlp.YoutubeDL(ydl_opts) as ydl:
+                info = ydl.process_ie_result(self._extract_info(url, ydl), download=True)
+                logger.info(f"Title: {info.get('title', 'video')}")
+                
+                # One requested download per section, tagged with its range
+                section_files = {}
+                for download in info.get('requested_downloads') or []:
+                    path = download.get('filepath') or download.get('_filename')
+                    section_start = download.get('section_start')
+                    if not path or not os.path.exists(path) or section_start is None:
+                        continue
+                    for start, end in sections:
+                        if abs(start - section_start) < 1 and (start, end) not in section_files:
+                            section_files[(start, end)] = path
+                            break
+                
+                if not section_files:
+                    logger.error("Downloaded sections not found")
+                    return None
+                
+                total_mb = sum(os.path.getsize(path) for path in section_files.values()) / (1024 * 1024)
+                logger.info(f"Downloaded {len(section_files)}/{len(sections)} sections ({total_mb:.2f} MB)")
+                return dict(sorted(section_files.items()))
+                
+        except Exception as e:
+            logger.log_error_with_exception("Error downloading video sections", e)
+            return None
+    
     def _get_format_string(self, quality):
         """Convert quality setting to yt-dlp format string"""
         quality_map = {
@@ -171,7 +320,7 @@ class YouTubeDownloader:
         try:
             ydl_opts = {'quiet': True}
             with yt_dlp.YoutubeDL(ydl_opts) as ydl:
-                info = ydl.extract_info(url, download=False)
+                info = self._extract_info(url, ydl)
                 
                 return {
                     'title': info.get('title', 'Unknown'),